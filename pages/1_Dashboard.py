@@ -1,8 +1,8 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-from datetime import datetime
-from utils.database import get_connection
+from utils.charts import cached_figure, time_series_figure
+from utils.database import get_connection, data_generation
+from utils.formatters import period_labels
 
 # ============================================
 # 1. FUNGSI DATA (DENGAN CACHE)
@@ -63,12 +63,11 @@ def render_dashboard():
         st.subheader("Tren Pemasukan Bulanan")
         if not df_monthly.empty:
             # Format nama bulan untuk grafik
-            df_monthly['periode'] = df_monthly.apply(
-                lambda x: f"{datetime(2000, int(x['bulan']), 1).strftime('%b')} {int(x['tahun'])}", axis=1
-            )
-            fig = px.line(df_monthly, x='periode', y='total', 
-                          markers=True, template="plotly_white",
-                          labels={'total': 'Pemasukan (Rp)', 'periode': 'Bulan'})
+            df_monthly['periode'] = period_labels(df_monthly['bulan'], df_monthly['tahun'])
+            fig = time_series_figure('dashboard_pemasukan', df_monthly, 'periode', 'total',
+                                     version=data_generation(),
+                                     markers=True, template="plotly_white",
+                                     labels={'total': 'Pemasukan (Rp)', 'periode': 'Bulan'})
             st.plotly_chart(fig, use_container_width=True)
         else:
             st.info("Belum ada data keuangan yang terverifikasi.")
@@ -76,9 +75,10 @@ def render_dashboard():
     with c2:
         st.subheader("Komposisi Status")
         if not df_status.empty:
-            fig_pie = px.pie(df_status, values='jumlah', names='status',
-                             color='status',
-                             color_discrete_map={'verified':'#2E8B57', 'pending':'#FFA500', 'rejected':'#FF4B4B'})
+            fig_pie = cached_figure('dashboard_status', 'pie', df_status,
+                                    version=data_generation(),
+                                    values='jumlah', names='status', color='status',
+                                    color_discrete_map={'verified':'#2E8B57', 'pending':'#FFA500', 'rejected':'#FF4B4B'})
             st.plotly_chart(fig_pie, use_container_width=True)
 
 # ============================================
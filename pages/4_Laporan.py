@@ -1,21 +1,38 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
+from utils.charts import cached_figure, time_series_figure
 from datetime import datetime
-from utils.database import get_connection
+from utils.aging import aging_totals
+from utils.database import (
+    get_report, get_tunggakan_tagihan, get_umur_tunggakan, get_tunggakan_tahun, get_statement, get_settings,
+    get_saldo_bulanan, get_buku_kas, data_generation, report_generation
+)
 from utils.helpers import format_currency
+from utils.snapshot import staleness_note
+from utils.formatters import month_labels, currency_column
 
 # Konfigurasi Halaman
 st.set_page_config(page_title="Laporan Keuangan", layout="wide")
 st.title("Laporan Keuangan")
+catatan_snapshot = staleness_note()
+if catatan_snapshot:
+    st.caption(catatan_snapshot)
 
-conn = get_connection()
+# ==================== DATA UMUR TUNGGAKAN ====================
+
+def current_aging():
+    """Umur tunggakan dari tagihan terbuka, sumber yang sama dengan daftar tagihan terbuka di bawahnya"""
+    batas_waktu = int(get_settings()['batas_waktu'])
+    return batas_waktu, get_umur_tunggakan(batas_waktu, datetime.now().date())
+
+def aging_csv(df_aging):
+    return df_aging.to_csv(index=False).encode('utf-8')
 
 # Pengaturan Tab
-tab1, tab2, tab3, tab4 = st.tabs([
+tab1, tab2, tab3, tab_kas, tab4 = st.tabs([
     "Laporan Bulanan", 
     "Laporan Tahunan", 
     "Analisis Tunggakan", 
+    "Arus Kas",
     "Export Data"
 ])
 
@@ -30,25 +47,17 @@ with tab1:
             key="sb_thn_bln"
         )
 
-    query = f"""
-        SELECT 
-            p.bulan,
-            SUM(p.jumlah) as total_pembayaran,
-            COUNT(p.id) as jumlah_transaksi,
-            SUM(CASE WHEN p.status='verified' THEN p.jumlah ELSE 0 END) as verified_payment,
-            SUM(CASE WHEN p.status='pending' THEN p.jumlah ELSE 0 END) as pending_payment
-        FROM pembayaran p
-        WHERE p.tahun={tahun_bulanan}
-        GROUP BY p.bulan ORDER BY p.bulan
-    """
-    df_bulanan = pd.read_sql_query(query, conn)
+    # Query laporan lewat engine analitik (DuckDB/SQLite) di atas snapshot laporan
+    df_bulanan = get_report('pembayaran_bulanan', (tahun_bulanan,))
 
     if not df_bulanan.empty:
-        df_bulanan['bulan_nama'] = df_bulanan['bulan'].apply(lambda x: datetime(2000, x, 1).strftime('%B'))
+        df_bulanan['bulan_nama'] = month_labels(df_bulanan['bulan'], full=True)
         
         # Visualisasi
-        fig_bar = px.bar(
-            df_bulanan, x='bulan_nama', y='total_pembayaran',
+        fig_bar = cached_figure(
+            'laporan_bulanan', 'bar', df_bulanan[['bulan_nama', 'total_pembayaran']],
+            version=(report_generation(), tahun_bulanan),
+            x='bulan_nama', y='total_pembayaran',
             title=f'Distribusi Pembayaran {tahun_bulanan}',
             labels={'bulan_nama': 'Bulan', 'total_pembayaran': 'Jumlah (Rp)'},
             template="plotly_white"
@@ -58,7 +67,7 @@ with tab1:
         # Tabel Data
         df_display = df_bulanan.copy()
         for col in ['total_pembayaran', 'verified_payment', 'pending_payment']:
-            df_display[col] = df_display[col].apply(format_currency)
+            df_display[col] = currency_column(df_display[col])
 
         st.dataframe(
             df_display[['bulan_nama', 'total_pembayaran', 'verified_payment', 'pending_payment', 'jumlah_transaksi']],
@@ -77,12 +86,11 @@ with tab1:
 
 # --- TAB 2: LAPORAN TAHUNAN ---
 with tab2:
-    query = "SELECT tahun, SUM(jumlah) as total, COUNT(id) as transaksi FROM pembayaran WHERE status='verified' GROUP BY tahun ORDER BY tahun DESC"
-    df_tahunan = pd.read_sql_query(query, conn)
+    df_tahunan = get_report('pendapatan_tahunan')
 
     if not df_tahunan.empty:
-        fig_line = px.line(
-            df_tahunan, x='tahun', y='total', markers=True,
+        fig_line = time_series_figure(
+            'laporan_tahunan', df_tahunan, 'tahun', 'total', markers=True, version=report_generation(),
             title='Pertumbuhan Pendapatan Tahunan',
             template="plotly_white"
         )
@@ -98,40 +106,94 @@ with tab3:
     with col_t2:
         tahun_analisis = st.selectbox("Tahun Analisis", list(range(2026, 2031)), index=0)
 
-    query_tunggakan = f"""
-        SELECT 
-            w.no_rumah, w.nama_kepala_keluarga,
-            (SELECT COUNT(*) FROM pembayaran p2 WHERE p2.warga_id = w.id AND p2.tahun={tahun_analisis} AND p2.status='verified') as lunas,
-            (12 - (SELECT COUNT(*) FROM pembayaran p2 WHERE p2.warga_id = w.id AND p2.tahun={tahun_analisis} AND p2.status='verified')) as tunggak
-        FROM warga w WHERE w.status='aktif'
-    """
-    df_tunggakan = pd.read_sql_query(query_tunggakan, conn)
-    df_tunggakan['nominal_tunggakan'] = df_tunggakan['tunggak'] * 100000 # Asumsi 100rb/bulan
-
-    if not df_tunggakan.empty:
-        # Filter hanya yang menunggak
-        df_active_tunggak = df_tunggakan[df_tunggakan['tunggak'] > 0].sort_values('tunggak', ascending=False)
-        
+    # Tunggakan tahun terpilih dari tagihan hasil billing run: hanya periode yang sudah ditagih
+    # (bukan 12 bulan penuh), sehingga bulan mendatang dan bulan sebelum warga masuk tidak dihitung
+    df_tunggakan = get_tunggakan_tahun(tahun_analisis)
+
+    if df_tunggakan.empty:
+        st.info(f"Belum ada tagihan tahun {tahun_analisis}. Jalankan billing run di Pengaturan > Tarif Iuran.")
+    else:
+        df_active_tunggak = df_tunggakan[df_tunggakan['tunggak'] > 0]
+
         c1, c2 = st.columns([2, 1])
         with c1:
-            st.dataframe(df_active_tunggak, use_container_width=True, hide_index=True)
+            st.dataframe(df_active_tunggak.drop(columns='warga_id'), use_container_width=True, hide_index=True,
+                         column_config={"nominal_tunggakan": st.column_config.NumberColumn("Nominal Tunggakan", format="Rp %d")})
         with c2:
-            fig_pie = px.pie(
+            fig_pie = cached_figure(
+                'laporan_kepatuhan', 'pie',
                 values=[len(df_tunggakan)-len(df_active_tunggak), len(df_active_tunggak)], 
                 names=['Lunas', 'Menunggak'],
                 hole=0.4, title="Rasio Kepatuhan"
             )
             st.plotly_chart(fig_pie, use_container_width=True)
 
+    # Umur tunggakan lintas tahun, dikelompokkan per hari keterlambatan dari jatuh tempo
+    st.subheader("Umur Tunggakan (Semua Tahun)")
+    batas_waktu, df_aging = current_aging()
+    st.caption(f"Jatuh tempo tanggal {batas_waktu} setiap bulan (Pengaturan > Aplikasi); "
+               "sisa tagihan terbuka per periode, bulan yang sudah dibayar di muka tidak dihitung")
+    totals = aging_totals(df_aging)
+    for col, row in zip(st.columns(len(totals)), totals.itertuples()):
+        col.metric(row.kelompok, format_currency(row.nominal), f"{row.warga} warga", delta_color="off")
+    st.dataframe(df_aging, use_container_width=True, hide_index=True)
+    st.download_button("Unduh Umur Tunggakan (CSV)", aging_csv(df_aging),
+                       file_name=f"umur_tunggakan_{datetime.now():%Y%m%d}.csv", mime="text/csv")
+
+    # Tunggakan lintas tahun dari tagihan terbuka (lookup index); warga yang masuk di
+    # tengah tahun hanya ditagih sejak bulan masuknya
+    st.subheader("Tagihan Terbuka (Semua Periode)")
+    df_tagihan = get_tunggakan_tagihan()
+    if df_tagihan.empty:
+        st.caption("Belum ada tagihan terbuka. Jalankan billing run di Pengaturan > Tarif Iuran "
+                   "atau lewat scripts/run_billing.py")
+    else:
+        t1, t2 = st.columns(2)
+        t1.metric("Warga dengan Tagihan Terbuka", len(df_tagihan))
+        t2.metric("Total Sisa Tagihan", format_currency(df_tagihan['sisa'].sum()))
+        st.dataframe(df_tagihan.drop(columns='warga_id'), use_container_width=True, hide_index=True)
+
+        labels = (df_tagihan['no_rumah'] + " - " + df_tagihan['nama_kepala_keluarga']).tolist()
+        pilihan = st.selectbox("Rincian Tagihan Warga", labels)
+        warga_id = int(df_tagihan['warga_id'].iloc[labels.index(pilihan)])
+        st.dataframe(get_statement(warga_id), use_container_width=True, hide_index=True)
+
+# --- TAB ARUS KAS ---
+with tab_kas:
+    # Saldo penutupan bulanan dibaca dari tabel materialisasi (tanpa scan pembayaran/pengeluaran)
+    df_saldo = get_saldo_bulanan()
+    if df_saldo.empty:
+        st.info("Belum ada transaksi kas")
+    else:
+        terakhir = df_saldo.iloc[-1]
+        k1, k2, k3 = st.columns(3)
+        k1.metric("Saldo Kas", format_currency(terakhir['saldo_akhir']))
+        k2.metric(f"Pemasukan {terakhir['bulan']:02d}/{terakhir['tahun']}", format_currency(terakhir['pemasukan']))
+        k3.metric(f"Pengeluaran {terakhir['bulan']:02d}/{terakhir['tahun']}", format_currency(terakhir['pengeluaran']))
+
+        fig_saldo = time_series_figure(
+            'laporan_saldo_kas', df_saldo, 'periode', 'saldo_akhir', agg='last', markers=True, version=data_generation(),
+            title='Saldo Kas Akhir Bulan', labels={'periode': 'Bulan', 'saldo_akhir': 'Saldo (Rp)'},
+            template="plotly_white"
+        )
+        st.plotly_chart(fig_saldo, use_container_width=True)
+
+        tahun_opsi = sorted(df_saldo['tahun'].unique().tolist(), reverse=True)
+        tahun_kas = st.selectbox("Buku Kas Tahun", tahun_opsi, key="kas_tahun")
+        # Transaksi satu tahun dengan saldo berjalan; saldo awal dari saldo akhir tahun sebelumnya
+        st.dataframe(get_buku_kas(tahun_kas), use_container_width=True, hide_index=True)
+
 # --- TAB 4: EXPORT DATA ---
 with tab4:
     st.subheader("Unduh Laporan")
     report_type = st.selectbox("Format Laporan", ["Ringkasan Bulanan", "Data Tunggakan", "Database Lengkap"])
     
+    if report_type == "Data Tunggakan":
+        _, df_aging = current_aging()
+        st.download_button("Unduh Data Tunggakan (CSV)", aging_csv(df_aging),
+                           file_name=f"data_tunggakan_{datetime.now():%Y%m%d}.csv", mime="text/csv")
     # Logic export disederhanakan
-    if st.button("Generate File"):
+    elif st.button("Generate File"):
         # Placeholder untuk fungsi export asli Anda
         st.success(f"File {report_type} siap diunduh.")
         # button download asli diletakkan di sini sesuai report_type
-
-conn.close()
\ No newline at end of file
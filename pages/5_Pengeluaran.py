@@ -1,14 +1,22 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
+from utils.charts import cached_figure
 from datetime import datetime
-# Tambahkan delete_pengeluaran di import
-from utils.database import add_pengeluaran, get_all_pengeluaran, delete_pengeluaran 
+from utils.database import (
+    add_pengeluaran, get_all_pengeluaran, delete_pengeluaran_batch, get_report, PeriodClosedError,
+    get_anggaran, get_anggaran_realisasi, get_rekap_pengeluaran, set_anggaran, delete_anggaran, report_generation
+)
 from utils.helpers import format_currency
+from utils.formatters import month_labels
+from utils.snapshot import staleness_note
 
 # Konfigurasi Halaman
 st.set_page_config(page_title="Laporan Pengeluaran", layout="wide")
 
+# Kolom yang dirender tabel riwayat dan analisis (created_at tidak ditampilkan)
+KOLOM_PENGELUARAN = ('id', 'kategori', 'deskripsi', 'jumlah', 'tanggal', 'bukti', 'disetujui_oleh')
+KATEGORI = ["Kebersihan", "Keamanan", "Pemeliharaan", "Administrasi", "Listrik", "Air", "ATK", "Lainnya"]
+
 # CSS Minimalis
 st.markdown("""
     <style>
@@ -24,16 +32,14 @@ if not st.session_state.get('is_admin', False):
     st.stop()
 
 # --- NAVIGASI TAB ---
-tab1, tab2, tab3 = st.tabs(["Input Data", "Daftar Transaksi", "Analisis"])
+tab1, tab2, tab3, tab4 = st.tabs(["Input Data", "Daftar Transaksi", "Analisis", "Anggaran"])
 
 # ==================== TAB 1: INPUT ====================
 with tab1:
     with st.form("form_pengeluaran", clear_on_submit=True):
         c1, c2 = st.columns(2)
         with c1:
-            kategori = st.selectbox("Kategori", 
-                                   ["Kebersihan", "Keamanan", "Pemeliharaan", 
-                                    "Administrasi", "Listrik", "Air", "ATK", "Lainnya"])
+            kategori = st.selectbox("Kategori", KATEGORI)
             jumlah = st.number_input("Nominal (Rp)", min_value=0, step=50000)
             tanggal = st.date_input("Tanggal", datetime.now())
         
@@ -61,18 +67,21 @@ with tab2:
     with f1:
         tahun_f = st.selectbox("Tahun", ["Semua"] + [str(i) for i in range(2026, 2031)], key="filter_thn")
     with f2:
-        kat_f = st.selectbox("Kategori", ["Semua", "Kebersihan", "Keamanan", "Pemeliharaan", "Administrasi", "Lainnya"], key="filter_kat")
+        kat_f = st.selectbox("Kategori", ["Semua"] + KATEGORI, key="filter_kat")
+    with f3:
+        cari_f = st.text_input("Cari Deskripsi", placeholder="Contoh: lampu jalan", key="filter_cari")
     
-    df_raw = get_all_pengeluaran()
+    df_raw = get_all_pengeluaran(columns=KOLOM_PENGELUARAN)
     
     if not df_raw.empty:
         df_f = df_raw.copy()
-        df_f['tanggal'] = pd.to_datetime(df_f['tanggal'])
         
         if tahun_f != "Semua":
             df_f = df_f[df_f['tanggal'].dt.year == int(tahun_f)]
         if kat_f != "Semua":
             df_f = df_f[df_f['kategori'] == kat_f]
+        if cari_f:
+            df_f = df_f[df_f['deskripsi'].str.contains(cari_f, case=False, na=False, regex=False)]
             
         st.write("### Riwayat Transaksi")
         st.caption("Centang kolom 'Pilih' untuk menghapus data, lalu klik tombol konfirmasi di bawah.")
@@ -96,7 +105,6 @@ with tab2:
                 "deskripsi": st.column_config.TextColumn("Deskripsi", disabled=True),
                 "bukti": st.column_config.TextColumn("Bukti", disabled=True),
                 "disetujui_oleh": st.column_config.TextColumn("Otoritas", disabled=True),
-                "created_at": None # Sembunyikan kolom created_at jika tidak perlu
             }
         )
         
@@ -105,11 +113,23 @@ with tab2:
         
         if not items_to_delete.empty:
             if st.button(f"Hapus {len(items_to_delete)} Data Terpilih", type="primary"):
-                for idx, row in items_to_delete.iterrows():
-                    delete_pengeluaran(row['id'])
-                st.success("Data berhasil dihapus!")
-                st.cache_data.clear()
-                st.rerun()
+                # Satu transaksi: periode tertutup menggagalkan semuanya sebelum ada yang terhapus
+                ids = [int(pid) for pid in items_to_delete['id']]
+                try:
+                    deleted = delete_pengeluaran_batch(ids)
+                except PeriodClosedError as e:
+                    st.error(f"Tidak ada data yang dihapus. {e}")
+                else:
+                    if deleted is None:
+                        st.error("Gagal menghapus data; tidak ada data yang dihapus")
+                    else:
+                        tidak_ada = sorted(set(ids) - set(deleted))
+                        if tidak_ada:
+                            st.warning(f"{len(deleted)} data dihapus; {len(tidak_ada)} tidak ditemukan "
+                                       f"(mungkin sudah dihapus): ID {', '.join(map(str, tidak_ada))}")
+                        else:
+                            st.success(f"{len(deleted)} data berhasil dihapus!")
+                            st.rerun()
 
         st.divider()
         # Ringkasan Angka
@@ -126,32 +146,104 @@ with tab3:
         col_sel, _ = st.columns([1, 3])
         with col_sel:
             thn_ana = st.selectbox("Tahun Analisis", range(2026, 2031), key="ana_y")
+        catatan_snapshot = staleness_note()
+        if catatan_snapshot:
+            st.caption(catatan_snapshot)
         
-        df_ana = df_raw.copy()
-        df_ana['tanggal'] = pd.to_datetime(df_ana['tanggal'])
-        df_ana = df_ana[df_ana['tanggal'].dt.year == thn_ana]
+        # Agregasi per kategori/bulan lewat engine analitik (DuckDB/SQLite), bukan groupby pandas
+        df_pie = get_report('pengeluaran_kategori', (thn_ana,))
         
-        if not df_ana.empty:
+        if not df_pie.empty:
             c1, c2 = st.columns(2)
             
             with c1:
-                df_pie = df_ana.groupby('kategori')['jumlah'].sum().reset_index()
-                fig_pie = px.pie(df_pie, values='jumlah', names='kategori', 
-                               hole=0.4, template="plotly_white")
-                fig_pie.update_layout(title="Distribusi per Kategori")
+                fig_pie = cached_figure('pengeluaran_kategori', 'pie', df_pie,
+                                        version=(report_generation(), thn_ana),
+                                        values='jumlah', names='kategori',
+                                        hole=0.4, template="plotly_white",
+                                        layout={'title': "Distribusi per Kategori"})
                 st.plotly_chart(fig_pie, use_container_width=True)
                 
             with c2:
-                df_ana['bulan'] = df_ana['tanggal'].dt.month
-                df_trend = df_ana.groupby('bulan')['jumlah'].sum().reset_index()
-                df_trend = df_trend.sort_values('bulan')
-                df_trend['bulan'] = df_trend['bulan'].apply(lambda x: datetime(2000, x, 1).strftime('%b'))
+                df_trend = get_report('pengeluaran_bulanan', (thn_ana,))
+                df_trend['bulan'] = month_labels(df_trend['bulan'])
                 
-                fig_line = px.line(df_trend, x='bulan', y='jumlah', 
-                                  markers=True, template="plotly_white")
-                fig_line.update_layout(title="Trend Pengeluaran Bulanan")
+                fig_line = cached_figure('pengeluaran_trend', 'line', df_trend,
+                                         version=(report_generation(), thn_ana),
+                                         x='bulan', y='jumlah',
+                                         markers=True, template="plotly_white",
+                                         layout={'title': "Trend Pengeluaran Bulanan"})
                 st.plotly_chart(fig_line, use_container_width=True)
         else:
             st.info(f"Data tahun {thn_ana} tidak tersedia.")
     else:
-        st.info("Database kosong.")
\ No newline at end of file
+        st.info("Database kosong.")
+
+# ==================== TAB 4: ANGGARAN ====================
+with tab4:
+    col_sel, _ = st.columns([1, 3])
+    with col_sel:
+        thn_agg = st.selectbox("Tahun Anggaran", range(2026, 2031), key="agg_y")
+
+    # Hanya membaca tabel anggaran dan rekap_pengeluaran (dipelihara saat input/hapus pengeluaran)
+    tahunan, bulanan = get_anggaran_realisasi(thn_agg)
+    if tahunan.empty:
+        st.info(f"Belum ada anggaran maupun pengeluaran tahun {thn_agg}.")
+    else:
+        dianggarkan = tahunan[tahunan['anggaran'].notna()]
+        m1, m2, m3 = st.columns(3)
+        m1.metric("Total Anggaran", format_currency(dianggarkan['anggaran'].sum()))
+        m2.metric("Realisasi", format_currency(tahunan['realisasi'].sum()))
+        m3.metric("Kategori Melebihi Anggaran", int((tahunan['status'] == 'Melebihi').sum()))
+
+        melebihi = pd.concat([
+            tahunan.loc[tahunan['status'] == 'Melebihi', 'kategori'],
+            bulanan.loc[bulanan['status'] == 'Melebihi', 'kategori'] + " (" + month_labels(bulanan.loc[bulanan['status'] == 'Melebihi', 'bulan']) + ")",
+        ])
+        if not melebihi.empty:
+            st.warning("Melebihi anggaran: " + ", ".join(melebihi))
+
+        kolom_anggaran = {
+            "anggaran": st.column_config.NumberColumn("Anggaran", format="Rp %d"),
+            "realisasi": st.column_config.NumberColumn("Realisasi", format="Rp %d"),
+            "sisa": st.column_config.NumberColumn("Sisa", format="Rp %d"),
+            "persen": st.column_config.ProgressColumn("Terpakai", format="%.1f%%", min_value=0, max_value=100),
+        }
+        st.write("### Anggaran vs Realisasi Tahunan")
+        st.dataframe(tahunan, use_container_width=True, hide_index=True, column_config=kolom_anggaran)
+
+        if not bulanan.empty:
+            st.write("### Anggaran Bulanan")
+            bulanan_view = bulanan.assign(bulan=month_labels(bulanan['bulan']))
+            st.dataframe(bulanan_view, use_container_width=True, hide_index=True, column_config=kolom_anggaran)
+
+        st.write("### Realisasi per Kategori dan Bulan")
+        rekap = get_rekap_pengeluaran(thn_agg)
+        rekap.columns = month_labels(list(rekap.columns)).tolist()
+        st.dataframe(rekap, use_container_width=True)
+
+    st.divider()
+    with st.form("form_anggaran", clear_on_submit=True):
+        c1, c2, c3 = st.columns(3)
+        kategori_agg = c1.selectbox("Kategori", KATEGORI)
+        periode_agg = c2.selectbox("Periode", ["Tahunan", "Bulanan (semua bulan)", "Bulanan (satu bulan)"])
+        bulan_agg = c3.selectbox("Bulan", range(1, 13), help="Hanya untuk periode bulanan satu bulan")
+        jumlah_agg = st.number_input("Anggaran (Rp)", min_value=0, step=100000)
+        if st.form_submit_button("Simpan Anggaran", type="primary"):
+            if jumlah_agg <= 0:
+                st.error("Nominal anggaran harus lebih dari 0.")
+            else:
+                bulan_simpan = {"Tahunan": 0, "Bulanan (semua bulan)": range(1, 13)}.get(periode_agg, bulan_agg)
+                set_anggaran(kategori_agg, thn_agg, bulan_simpan, jumlah_agg, st.session_state.get('username'))
+                st.toast("Anggaran disimpan")
+                st.rerun()
+
+    daftar = get_anggaran(thn_agg)
+    if not daftar.empty:
+        label = {row.id: f"{row.kategori} - {'Tahunan' if row.bulan == 0 else month_labels(row.bulan)[0]} "
+                         f"({format_currency(row.jumlah)})" for row in daftar.itertuples()}
+        c1, c2 = st.columns([3, 1])
+        hapus_agg = c1.selectbox("Hapus Anggaran", list(label), format_func=label.get)
+        if c2.button("Hapus", use_container_width=True) and delete_anggaran(hapus_agg):
+            st.toast("Anggaran dihapus")
+            st.rerun()
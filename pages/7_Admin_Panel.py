@@ -3,8 +3,8 @@ import pandas as pd
 import json
 import os
 from datetime import datetime
-from utils.database import get_connection, get_pending_changes, update_pending_change_status
-import plotly.express as px
+from utils.database import get_connection, get_pending_changes, update_pending_change_status, get_saldo_bulanan, data_generation
+from utils.charts import time_series_figure
 
 st.set_page_config(page_title="Admin Panel", layout="wide")
 st.title("Admin Panel")
@@ -94,8 +94,9 @@ with tab3:
     cursor.execute("SELECT COUNT(*) FROM warga WHERE status='aktif'")
     m1.metric("Warga Aktif", cursor.fetchone()[0])
     
-    cursor.execute("SELECT SUM(jumlah) FROM pembayaran WHERE status='verified'")
-    total = cursor.fetchone()[0] or 0
+    # Saldo = pemasukan terverifikasi dikurangi pengeluaran (saldo_bulanan yang dimaterialisasi)
+    df_saldo = get_saldo_bulanan()
+    total = int(df_saldo['saldo_akhir'].iloc[-1]) if not df_saldo.empty else 0
     m2.metric("Total Kas", f"Rp {total:,}")
     
     cursor.execute("SELECT COUNT(*) FROM pembayaran WHERE status='pending'")
@@ -107,10 +108,11 @@ with tab3:
     st.divider()
 
     # Row 2: Visualisasi
-    q_act = "SELECT DATE(created_at) as tgl, COUNT(*) as jml FROM pending_changes GROUP BY tgl LIMIT 30"
-    df_act = pd.read_sql_query(q_act, conn)
+    # Seluruh riwayat harian; deret panjang diringkas ke mingguan/bulanan oleh time_series_figure
+    q_act = "SELECT DATE(created_at) as tgl, COUNT(*) as jml FROM pending_changes GROUP BY tgl ORDER BY tgl"
+    df_act = pd.read_sql_query(q_act, conn, parse_dates=['tgl'])
     if not df_act.empty:
-        fig = px.line(df_act, x='tgl', y='jml', title='Tren Aktivitas (30 Hari)')
+        fig = time_series_figure('admin_aktivitas', df_act, 'tgl', 'jml', version=data_generation(), title='Tren Aktivitas')
         st.plotly_chart(fig, use_container_width=True)
 
     # Row 3: Info Sistem & Maintenance
@@ -0,0 +1,82 @@
+import streamlit as st
+import numpy as np
+from datetime import datetime
+from utils.database import get_payment_cube
+from utils.cube import status_grid, GRID_LEGEND, VERIFIED, PENDING
+from utils.helpers import MONTH_ABBR_ID
+
+# Konfigurasi Halaman
+st.set_page_config(page_title="Peta Pembayaran", layout="wide")
+st.title("Peta Pembayaran")
+st.caption("Siapa sudah membayar bulan apa: baris = rumah, kolom = bulan. " + GRID_LEGEND)
+
+BULAN = list(MONTH_ABBR_ID[1:])
+
+# ==================== DATA GRID ====================
+
+@st.cache_resource(max_entries=8)
+def load_grid(tahun, version, _cube):
+    """Pivot warga × bulan untuk satu tahun; dibangun ulang hanya saat versi kubus berubah"""
+    return status_grid(_cube, tahun)
+
+# ==================== FRAGMENT ====================
+# Filter blok/status hanya merender ulang grid
+
+@st.fragment
+def render_peta():
+    cube = get_payment_cube()
+    now = datetime.now()
+    tahun_opsi = sorted(set(cube.years.tolist()) | {now.year}, reverse=True)
+
+    c1, c2, c3 = st.columns([1, 2, 2])
+    with c1:
+        tahun = st.selectbox("Tahun", tahun_opsi, key="peta_tahun")
+    grid, codes = load_grid(tahun, cube.version, cube)
+
+    with c2:
+        blok = st.multiselect("Blok", sorted(grid['blok'].unique()), key="peta_blok",
+                              placeholder="Semua blok")
+    with c3:
+        tampil = st.selectbox("Tampilkan", ["Warga aktif", "Semua warga", "Ada tunggakan", "Ada pending"],
+                              key="peta_tampil")
+
+    # Bulan yang sudah jatuh tempo: tahun berjalan sampai bulan ini, tahun lalu penuh
+    jatuh_tempo = 12 if tahun < now.year else (now.month if tahun == now.year else 0)
+
+    mask = np.ones(len(grid), dtype=bool)
+    if blok:
+        mask &= grid['blok'].isin(blok).to_numpy()
+    if tampil != "Semua warga":
+        mask &= grid['aktif'].to_numpy()
+    if tampil == "Ada tunggakan":
+        mask &= (codes[:, :jatuh_tempo] != VERIFIED).any(axis=1)
+    elif tampil == "Ada pending":
+        mask &= (codes == PENDING).any(axis=1)
+
+    view_codes = codes[mask]
+    m1, m2, m3 = st.columns(3)
+    m1.metric("Rumah ditampilkan", int(mask.sum()))
+    if jatuh_tempo:
+        lunas_semua = (view_codes[:, :jatuh_tempo] == VERIFIED).all(axis=1)
+        m2.metric(f"Lunas s.d. {MONTH_ABBR_ID[jatuh_tempo]}", int(lunas_semua.sum()))
+        m3.metric(f"Sudah bayar {MONTH_ABBR_ID[jatuh_tempo]}", int((view_codes[:, jatuh_tempo - 1] == VERIFIED).sum()))
+
+    # st.dataframe hanya merender baris yang terlihat, jadi ribuan rumah tetap ringan
+    st.dataframe(
+        grid.loc[mask, ['no_rumah', 'nama_kepala_keluarga'] + BULAN + ['lunas']],
+        use_container_width=True,
+        hide_index=True,
+        height=600,
+        column_config={
+            "no_rumah": st.column_config.TextColumn("No. Rumah", pinned=True),
+            "nama_kepala_keluarga": st.column_config.TextColumn("Kepala Keluarga", pinned=True),
+            **{bulan: st.column_config.TextColumn(bulan, width="small") for bulan in BULAN},
+            "lunas": st.column_config.ProgressColumn("Lunas", min_value=0, max_value=12, format="%d/12"),
+        },
+    )
+
+    # Rekap per bulan untuk baris yang sedang ditampilkan
+    rekap = {bulan: int((view_codes[:, i] == VERIFIED).sum()) for i, bulan in enumerate(BULAN)}
+    st.caption("Jumlah rumah lunas per bulan: " + " · ".join(f"{bulan} {jumlah}" for bulan, jumlah in rekap.items()))
+
+render_peta()
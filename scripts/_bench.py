@@ -0,0 +1,88 @@
+"""
+UTILITAS BERSAMA BENCHMARK
+Dipakai oleh scripts/bench_*.py (diimpor sebagai `import _bench` dari folder scripts):
+saat diimpor root project masuk sys.path dan log streamlit disenyapkan, lalu tersedia
+pengukur waktu dan data uji sintetis (warga, pembayaran, pengeluaran) yang sama untuk
+semua benchmark.
+"""
+
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from streamlit.logger import set_log_level
+
+set_log_level("error")
+
+TAHUN_AKHIR = 2026
+IURAN = 100000
+STATUS = ['verified'] * 8 + ['pending', 'rejected']
+KATEGORI = ["Kebersihan", "Keamanan", "Pemeliharaan", "Administrasi", "Lainnya"]
+
+# ==================== PENGUKUR WAKTU ====================
+
+def timed(func, repeat=3):
+    """Waktu tercepat (ms) dari repeat kali setelah satu pemanasan; mengembalikan (ms, hasil)"""
+    result = func()
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, result
+
+def timed_mean(func, repeat=20):
+    """Waktu rata-rata (ms) dari repeat kali setelah satu pemanasan; untuk operasi di bawah 1 ms"""
+    result = func()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1000, result
+
+def elapsed(func):
+    """Waktu (ms) satu kali jalan tanpa pemanasan (mengukur keadaan dingin, misal cache kosong)"""
+    start = time.perf_counter()
+    result = func()
+    return (time.perf_counter() - start) * 1000, result
+
+# ==================== DATA UJI ====================
+
+def no_rumah(i):
+    """Nomor rumah sintetis urutan ke-i: A-1, B-1, ..., H-1, A-2, ..."""
+    return f"{'ABCDEFGH'[i % 8]}-{i // 8 + 1}"
+
+def seed_warga(conn, n_warga, rng, aktif=0.9, tanggal_masuk=None):
+    """Isi n_warga warga (id 1..n_warga); tanggal_masuk: fungsi(i) -> 'YYYY-MM-DD' (default 2020-01-01)"""
+    conn.executemany(
+        "INSERT INTO warga (no_rumah, nama_kepala_keluarga, anggota_keluarga, telepon, email, tanggal_masuk, status) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+        [(no_rumah(i), f"Warga {i}", rng.randint(1, 6), f"08{rng.randint(10**8, 10**9 - 1)}", f"warga{i}@contoh.id",
+          tanggal_masuk(i) if tanggal_masuk else '2020-01-01', 'aktif' if rng.random() < aktif else 'non-aktif')
+         for i in range(n_warga)])
+
+def seed_pembayaran(conn, n_warga, years, rng, coverage=0.85, detail=False):
+    """Pembayaran iuran ~coverage warga-bulan per tahun di years, status acak dari STATUS.
+
+    detail=True ikut mengisi metode_bayar dan bukti_bayar (lebar baris seperti data asli).
+    Mengembalikan jumlah baris.
+    """
+    rows = [(w, bulan, tahun, IURAN, f"{tahun}-{bulan:02d}-05",
+             rng.choice(['transfer', 'tunai']) if detail else None,
+             f"uploads/bukti_{w}_{tahun}{bulan:02d}.jpg" if detail else None, rng.choice(STATUS))
+            for w in range(1, n_warga + 1) for tahun in years for bulan in range(1, 13) if rng.random() < coverage]
+    conn.executemany(
+        "INSERT INTO pembayaran (warga_id, bulan, tahun, jumlah, tanggal_bayar, metode_bayar, bukti_bayar, status) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+    return len(rows)
+
+def seed_pengeluaran(conn, years, per_year, rng, kategori=KATEGORI):
+    """per_year pengeluaran acak per tahun di years (tanggal dan kategori acak)"""
+    conn.executemany(
+        "INSERT INTO pengeluaran (kategori, deskripsi, jumlah, tanggal) VALUES (?, ?, ?, ?)",
+        [(rng.choice(kategori), 'Biaya operasional', rng.randint(1, 50) * 10000,
+          f"{tahun}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}")
+         for tahun in years for _ in range(per_year)])
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+BENCHMARK UMUR TUNGGAKAN
+Membandingkan perhitungan umur tunggakan 30/60/90 hari untuk semua warga dan semua tahun:
+  sql    : GROUP BY kelompok langsung atas tagihan terbuka, bucket lewat CASE
+  vektor : utils.billing.open_invoices lalu utils.aging.arrears_aging (numpy + pivot)
+Jalankan dari root project: python scripts/bench_aging.py [jumlah_warga] [jumlah_tahun]
+"""
+
+import random
+import sqlite3
+import sys
+
+import pandas as pd
+
+from _bench import IURAN, TAHUN_AKHIR, seed_warga, timed
+
+from utils.aging import AGING_LABELS, aging_totals, arrears_aging
+from utils.billing import open_invoices
+from utils.database import apply_schema
+
+HARI_INI = '2026-10-19'
+BATAS_WAKTU = 15
+
+# ==================== DATA UJI ====================
+
+def seed(conn, n_warga, n_tahun):
+    rng = random.Random(29)
+    first = TAHUN_AKHIR - n_tahun + 1
+    # ~30% warga masuk di tengah periode uji
+    seed_warga(conn, n_warga, rng, tanggal_masuk=lambda i: (
+        f"{rng.randint(first, TAHUN_AKHIR)}-{rng.randint(1, 12):02d}-01" if rng.random() < 0.3 else f"{first}-01-01"))
+    # Tagihan per bulan sejak tanggal masuk; ~85% lunas, sebagian kecil terbayar separuh
+    rows = []
+    for w in range(1, n_warga + 1):
+        masuk = conn.execute("SELECT tanggal_masuk FROM warga WHERE id=?", (w,)).fetchone()[0]
+        for tahun in range(int(masuk[:4]), TAHUN_AKHIR + 1):
+            for bulan in range(1, 13):
+                if (tahun, bulan) < (int(masuk[:4]), int(masuk[5:7])) or (tahun, bulan) > (TAHUN_AKHIR, 10):
+                    continue
+                roll = rng.random()
+                terbayar = IURAN if roll < 0.85 else (IURAN // 2 if roll < 0.9 else 0)
+                rows.append((w, tahun, bulan, IURAN, terbayar,
+                             'lunas' if terbayar >= IURAN else 'terbuka'))
+    conn.executemany(
+        "INSERT INTO tagihan (warga_id, tahun, bulan, jumlah, terbayar, status) VALUES (?, ?, ?, ?, ?, ?)", rows)
+    conn.commit()
+
+# ==================== JALUR ====================
+
+def via_sql(conn):
+    buckets = " ".join(f"WHEN hari <= {edge} THEN '{label}'"
+                       for edge, label in zip((0, 30, 60, 90), AGING_LABELS))
+    return pd.read_sql_query(f"""
+        WITH sel AS (
+            SELECT warga_id, jumlah - terbayar AS sisa,
+                   CAST(julianday(?) - julianday(printf('%04d-%02d-01', tahun, bulan)) AS INTEGER)
+                       - ({BATAS_WAKTU} - 1) AS hari
+            FROM tagihan WHERE status = 'terbuka'
+        )
+        SELECT CASE {buckets} ELSE '{AGING_LABELS[-1]}' END AS kelompok,
+               SUM(sisa) AS nominal, COUNT(DISTINCT warga_id) AS warga
+        FROM sel GROUP BY kelompok
+    """, conn, params=[HARI_INI])
+
+def run(n_warga, n_tahun):
+    conn = sqlite3.connect(':memory:')
+    apply_schema(conn)
+    seed(conn, n_warga, n_tahun)
+
+    t_sql, sql = timed(lambda: via_sql(conn), repeat=1)
+    t_load, invoices = timed(lambda: open_invoices(conn))
+    t_vec, aging = timed(lambda: arrears_aging(invoices, BATAS_WAKTU, today=HARI_INI))
+
+    totals = aging_totals(aging).set_index('kelompok')
+    sql = sql.set_index('kelompok').reindex(totals.index, fill_value=0)
+    assert (totals['nominal'] == sql['nominal']).all() and (totals['warga'] == sql['warga']).all()
+
+    print(f"⏳ BENCHMARK UMUR TUNGGAKAN ({n_warga} warga, {n_tahun} tahun, per {HARI_INI})")
+    print("=" * 72)
+    print(f"  sql (GROUP BY tagihan terbuka)   : {t_sql:9.1f} ms")
+    print(f"  vektor (tagihan sudah dimuat)    : {t_vec:9.1f} ms")
+    print(f"  vektor + muat tagihan terbuka    : {t_vec + t_load:9.1f} ms")
+    print(f"  {'kelompok':<20} {'nominal':>16} {'warga':>8}")
+    for label, row in totals.iterrows():
+        print(f"  {label:<20} {row['nominal']:16,} {row['warga']:8}")
+
+if __name__ == "__main__":
+    n_warga = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    n_tahun = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    run(n_warga, n_tahun)
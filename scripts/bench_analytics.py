@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+BENCHMARK ENGINE ANALITIK
+Membandingkan waktu query laporan (utils.analytics.REPORTS) di SQLite dengan
+DuckDB mode 'scan' (baca file SQLite langsung) dan mode 'copy' (salinan kolumnar),
+pada database sementara berisi ledger sintetis.
+Jalankan dari root project: python scripts/bench_analytics.py [jumlah_warga] [jumlah_tahun]
+"""
+
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+
+from _bench import TAHUN_AKHIR, seed_pembayaran, seed_pengeluaran, seed_warga, timed
+
+from utils.analytics import REPORTS, DuckDBEngine, SQLiteEngine, load_duckdb
+from utils.database import apply_schema
+
+# ==================== DATA UJI ====================
+
+def seed(path, n_warga, n_tahun):
+    rng = random.Random(17)
+    years = range(TAHUN_AKHIR - n_tahun + 1, TAHUN_AKHIR + 1)
+    conn = sqlite3.connect(path)
+    apply_schema(conn)
+    seed_warga(conn, n_warga, rng)
+    count = seed_pembayaran(conn, n_warga, years, rng)
+    seed_pengeluaran(conn, years, n_warga, rng)
+    conn.commit()
+    conn.close()
+    return count
+
+# ==================== PENGUKURAN ====================
+
+def run(n_warga, n_tahun):
+    if load_duckdb() is None:
+        print("❌ DuckDB tidak terpasang (pip install duckdb)")
+        return
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'bench.db')
+        n_payments = seed(path, n_warga, n_tahun)
+
+        sqlite = SQLiteEngine(lambda: sqlite3.connect(path))
+        engines = {'sqlite': sqlite}
+        sync_ms = {}
+        for mode in ('scan', 'copy'):
+            start = time.perf_counter()
+            engine = DuckDBEngine(path, mode=mode)
+            engine._sync()
+            sync_ms[mode] = (time.perf_counter() - start) * 1000
+            engines[f"duckdb-{mode}"] = engine
+
+        print(f"🦆 BENCHMARK ENGINE ANALITIK ({n_warga} warga, {n_tahun} tahun, {n_payments} pembayaran)")
+        print("=" * 78)
+        print(f"  Sinkronisasi awal: scan {sync_ms['scan']:.0f} ms, copy {sync_ms['copy']:.0f} ms "
+              f"(copy diulang hanya saat file sumber berubah)")
+        print(f"  {'query':<24} " + " ".join(f"{name:>14}" for name in engines))
+        for name, sql in REPORTS.items():
+            params = () if '?' not in sql else (TAHUN_AKHIR,)
+            times = [timed(lambda e=engine: e.query(sql, params), repeat=5)[0] for engine in engines.values()]
+            print(f"  {name:<24} " + " ".join(f"{t:11.1f} ms" for t in times))
+
+if __name__ == "__main__":
+    n_warga = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    n_tahun = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    run(n_warga, n_tahun)
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+BENCHMARK ANGGARAN PENGELUARAN
+Membandingkan anggaran vs realisasi per kategori untuk satu tahun:
+  scan  : GROUP BY kategori atas tabel pengeluaran (tahun dari tanggal) setiap render
+  rekap : utils.budget.annual_budget_vs_actual di atas tabel rekap_pengeluaran
+  tambah: biaya memelihara rekap untuk satu pengeluaran baru (record_spend)
+Rekap yang dipelihara per transaksi dicek sama dengan hasil bangun ulang penuh.
+Jalankan dari root project: python scripts/bench_anggaran.py [jumlah_pengeluaran] [jumlah_tahun]
+"""
+
+import random
+import sqlite3
+import sys
+
+import pandas as pd
+
+from _bench import TAHUN_AKHIR, timed
+
+from utils import budget
+from utils.database import apply_schema
+from utils.ledger import TANGGAL_PENGELUARAN
+
+KATEGORI = ["Kebersihan", "Keamanan", "Pemeliharaan", "Administrasi", "Listrik", "Air", "ATK", "Lainnya"]
+
+# ==================== DATA UJI ====================
+
+def seed(conn, n_pengeluaran, n_tahun):
+    rng = random.Random(37)
+    rows = [(rng.choice(KATEGORI), 'Biaya operasional', rng.randint(1, 50) * 10000,
+             f"{rng.randint(TAHUN_AKHIR - n_tahun + 1, TAHUN_AKHIR)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}")
+            for _ in range(n_pengeluaran)]
+    # Setengah data lewat record_spend (jalur aplikasi), sisanya dibangun ulang lalu dibandingkan
+    half = len(rows) // 2
+    conn.executemany("INSERT INTO pengeluaran (kategori, deskripsi, jumlah, tanggal) VALUES (?, ?, ?, ?)", rows[:half])
+    budget.refresh_spend(conn)
+    for kategori, deskripsi, jumlah, tanggal in rows[half:]:
+        conn.execute("INSERT INTO pengeluaran (kategori, deskripsi, jumlah, tanggal) VALUES (?, ?, ?, ?)",
+                     (kategori, deskripsi, jumlah, tanggal))
+        budget.record_spend(conn, kategori, tanggal, jumlah)
+    for kategori in KATEGORI[:5]:
+        budget.set_budget(conn, kategori, TAHUN_AKHIR, budget.ANGGARAN_TAHUNAN, n_pengeluaran * 32000 // n_tahun)
+        for bulan in range(1, 13):
+            budget.set_budget(conn, kategori, TAHUN_AKHIR, bulan, n_pengeluaran * 2500 // n_tahun)
+    conn.commit()
+
+# ==================== JALUR ====================
+
+def via_scan(conn, tahun):
+    return pd.read_sql_query(f'''
+        WITH r AS (
+            SELECT kategori, SUM(jumlah) AS realisasi FROM pengeluaran
+            WHERE substr({TANGGAL_PENGELUARAN}, 1, 4) = :teks GROUP BY kategori
+        ),
+        k AS (SELECT kategori FROM anggaran WHERE tahun = :tahun UNION SELECT kategori FROM r)
+        SELECT k.kategori, a.jumlah AS anggaran, COALESCE(r.realisasi, 0) AS realisasi
+        FROM k LEFT JOIN anggaran a ON a.kategori = k.kategori AND a.tahun = :tahun AND a.bulan = 0
+        LEFT JOIN r ON r.kategori = k.kategori
+        ORDER BY k.kategori
+    ''', conn, params={'tahun': tahun, 'teks': str(tahun)})
+
+def run(n_pengeluaran, n_tahun):
+    conn = sqlite3.connect(':memory:')
+    apply_schema(conn)
+    seed(conn, n_pengeluaran, n_tahun)
+
+    maintained = pd.read_sql_query("SELECT * FROM rekap_pengeluaran ORDER BY 1, 2, 3", conn)
+    budget.refresh_spend(conn)
+    assert maintained.equals(pd.read_sql_query("SELECT * FROM rekap_pengeluaran ORDER BY 1, 2, 3", conn))
+
+    t_scan, scan = timed(lambda: via_scan(conn, TAHUN_AKHIR), repeat=5)
+    t_rekap, rekap = timed(lambda: budget.annual_budget_vs_actual(conn, TAHUN_AKHIR), repeat=5)
+    assert scan['realisasi'].tolist() == rekap['realisasi'].tolist()
+    t_add, _ = timed(lambda: budget.record_spend(conn, 'Lainnya', f"{TAHUN_AKHIR}-06-01", 1000), repeat=50)
+
+    print(f"💰 BENCHMARK ANGGARAN ({n_pengeluaran} pengeluaran, {n_tahun} tahun)")
+    print("=" * 72)
+    print(f"  anggaran vs realisasi: scan pengeluaran : {t_scan:9.2f} ms")
+    print(f"  anggaran vs realisasi: baca rekap       : {t_rekap:9.2f} ms")
+    print(f"  pelihara rekap per transaksi            : {t_add:9.3f} ms")
+    print(f"  {'kategori':<14} {'anggaran':>14} {'realisasi':>14}  status")
+    for row in rekap.itertuples():
+        anggaran = f"{row.anggaran:14,.0f}" if row.anggaran == row.anggaran else f"{'-':>14}"
+        print(f"  {row.kategori:<14} {anggaran} {row.realisasi:14,}  {row.status}")
+
+if __name__ == "__main__":
+    n_pengeluaran = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    n_tahun = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    run(n_pengeluaran, n_tahun)
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+BENCHMARK JALUR ARROW
+Membandingkan waktu dari query sampai byte Arrow yang dikirim st.dataframe untuk
+riwayat pembayaran lengkap dan tabel warga:
+  pandas : read_sql_typed -> DataFrame -> konversi Arrow oleh Streamlit
+  cursor : utils.loaders.read_sql_arrow (tuple cursor -> pyarrow) -> Arrow IPC
+  adbc   : ADBC SQLite (hasil langsung Arrow) + skema -> Arrow IPC (jika terpasang)
+Jalankan dari root project: python scripts/bench_arrow.py [jumlah_warga] [jumlah_tahun]
+"""
+
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+
+from _bench import TAHUN_AKHIR, seed_pembayaran, seed_warga, timed
+
+from streamlit.dataframe_util import convert_arrow_table_to_arrow_bytes, convert_pandas_df_to_arrow_bytes
+
+from utils.database import apply_schema, WARGA_DIRECTORY_COLUMNS, select_list
+from utils.loaders import PEMBAYARAN_SCHEMA, apply_arrow_schema, read_sql_arrow, read_sql_typed
+
+QUERIES = {
+    'riwayat pembayaran': (f"""
+        SELECT {select_list('pembayaran', None, 'p')}, w.no_rumah, w.nama_kepala_keluarga
+        FROM pembayaran p JOIN warga w ON p.warga_id = w.id
+        ORDER BY p.tahun DESC, p.bulan DESC, p.tanggal_bayar DESC""", PEMBAYARAN_SCHEMA),
+    'tabel warga': (f"SELECT {select_list('warga', WARGA_DIRECTORY_COLUMNS)} FROM warga ORDER BY no_rumah", {}),
+}
+
+# ==================== DATA UJI ====================
+
+def seed(path, n_warga, n_tahun):
+    rng = random.Random(19)
+    conn = sqlite3.connect(path)
+    apply_schema(conn)
+    seed_warga(conn, n_warga, rng, aktif=1.0)
+    seed_pembayaran(conn, n_warga, range(TAHUN_AKHIR - n_tahun + 1, TAHUN_AKHIR + 1), rng, detail=True)
+    conn.commit()
+    conn.close()
+
+# ==================== JALUR ====================
+
+def via_pandas(path, query, schema):
+    conn = sqlite3.connect(path)
+    try:
+        return convert_pandas_df_to_arrow_bytes(read_sql_typed(query, conn, schema))
+    finally:
+        conn.close()
+
+def via_cursor(path, query, schema):
+    conn = sqlite3.connect(path)
+    try:
+        return convert_arrow_table_to_arrow_bytes(read_sql_arrow(query, conn, schema))
+    finally:
+        conn.close()
+
+def via_adbc(path, query, schema):
+    import adbc_driver_sqlite.dbapi as adbc
+    with adbc.connect(f"file:{path}?mode=ro") as conn, conn.cursor() as cursor:
+        cursor.execute(query)
+        return convert_arrow_table_to_arrow_bytes(apply_arrow_schema(cursor.fetch_arrow_table(), schema))
+
+def run(n_warga, n_tahun):
+    paths = {'pandas': via_pandas, 'cursor': via_cursor}
+    try:
+        import adbc_driver_sqlite  # noqa: F401
+        paths['adbc'] = via_adbc
+    except ImportError:
+        pass
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'bench.db')
+        seed(path, n_warga, n_tahun)
+        print(f"🏹 BENCHMARK JALUR ARROW ({n_warga} warga, {n_tahun} tahun)")
+        print("=" * 72)
+        for name, (query, schema) in QUERIES.items():
+            rows = sqlite3.connect(path).execute(f"SELECT COUNT(*) FROM ({query})").fetchone()[0]
+            print(f"  {name} ({rows} baris): query -> byte Arrow untuk st.dataframe")
+            for label, func in paths.items():
+                ms, payload = timed(lambda: func(path, query, schema))
+                kb = len(payload) / 1024
+                print(f"    {label:<8} {ms:9.1f} ms   payload {kb:8.0f} KB")
+        if 'adbc' not in paths:
+            print("  (ADBC tidak terpasang: pip install adbc-driver-sqlite)")
+
+if __name__ == "__main__":
+    n_warga = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    n_tahun = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    run(n_warga, n_tahun)
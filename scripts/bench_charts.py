@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+BENCHMARK CACHE FIGURE PLOTLY
+Membandingkan waktu membangun figure plotly.express dari awal dengan
+mengambilnya dari cache (utils.charts.cached_figure, figure dibangun ulang dari JSON).
+Jalankan dari root project: python scripts/bench_charts.py [jumlah_ulang]
+"""
+
+import sys
+
+import numpy as np
+import pandas as pd
+
+from _bench import timed_mean
+
+from utils.charts import cached_figure, clear_figure_cache, figure_cache_info
+from utils.lazy import px
+
+def make_frames():
+    rng = np.random.default_rng(42)
+    monthly = pd.DataFrame({
+        'periode': [f"{m:02d}/{y}" for y in range(2021, 2027) for m in range(1, 13)],
+        'total': rng.integers(1_000_000, 9_000_000, 72),
+    })
+    status = pd.DataFrame({'status': ['verified', 'pending', 'rejected'], 'jumlah': [120, 14, 3]})
+    return monthly, status
+
+def run(repeat):
+    monthly, status = make_frames()
+    cases = [
+        ("line 72 titik",
+         lambda: px.line(monthly, x='periode', y='total', markers=True, template="plotly_white"),
+         lambda: cached_figure('bench_line', 'line', monthly, version=1, x='periode', y='total',
+                               markers=True, template="plotly_white")),
+        ("pie 3 status",
+         lambda: px.pie(status, values='jumlah', names='status', color='status'),
+         lambda: cached_figure('bench_pie', 'pie', status, version=1, values='jumlah', names='status',
+                               color='status')),
+    ]
+
+    clear_figure_cache()
+    print(f"📈 BENCHMARK CACHE FIGURE ({repeat}x)")
+    print("=" * 60)
+    print(f"  {'grafik':<16} {'bangun ulang':>14} {'cache':>10} {'speedup':>9}")
+    for label, build, cached in cases:
+        t_build, _ = timed_mean(build, repeat)
+        t_cached, _ = timed_mean(cached, repeat)
+        print(f"  {label:<16} {t_build:11.2f} ms {t_cached:7.3f} ms {t_build / t_cached:8.0f}x")
+    print(f"\n  {figure_cache_info()}")
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 50)
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+BENCHMARK KUBUS PEMBAYARAN
+Membandingkan query SQL per analitik (bulan lunas per warga seperti kolom 'lunas' Peta
+Pembayaran, jumlah "Sudah Bayar") dengan slice/reduksi pada kubus NumPy (utils.cube.PaymentCube),
+termasuk biaya bangun sekali, pembaruan inkremental per transaksi, dan grid
+Peta Pembayaran (pivot pandas seluruh ledger vs utils.cube.status_grid).
+Jalankan dari root project: python scripts/bench_cube.py [jumlah_warga] [jumlah_tahun]
+"""
+
+import random
+import sqlite3
+import sys
+import time
+
+import pandas as pd
+
+from _bench import TAHUN_AKHIR, seed_pembayaran, seed_warga, timed_mean
+
+from utils.cube import CUBE_COLUMNS, VERIFIED, PaymentCube, status_grid
+from utils.database import apply_schema, select_list
+
+# ==================== DATA UJI ====================
+
+def seed(conn, n_warga, n_tahun):
+    rng = random.Random(13)
+    seed_warga(conn, n_warga, rng)
+    count = seed_pembayaran(conn, n_warga, range(TAHUN_AKHIR - n_tahun + 1, TAHUN_AKHIR + 1), rng)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_bench_pembayaran ON pembayaran (warga_id, tahun, status)")
+    conn.commit()
+    return count
+
+# ==================== SKENARIO ====================
+
+def sql_arrears(conn, tahun):
+    return pd.read_sql_query(f"""
+        SELECT w.no_rumah,
+               (SELECT COUNT(*) FROM pembayaran p2 WHERE p2.warga_id = w.id AND p2.tahun={tahun} AND p2.status='verified') as lunas
+        FROM warga w WHERE w.status='aktif'""", conn)
+
+def sql_payers(conn, tahun, bulan):
+    return pd.read_sql_query(f"""
+        SELECT COUNT(DISTINCT warga_id) as jumlah FROM pembayaran
+        WHERE bulan={bulan} AND tahun={tahun} AND status='verified'""", conn)['jumlah'][0]
+
+def run(n_warga, n_tahun):
+    conn = sqlite3.connect(':memory:')
+    apply_schema(conn)
+    n_payments = seed(conn, n_warga, n_tahun)
+
+    start = time.perf_counter()
+    warga = pd.read_sql_query("SELECT id, no_rumah, nama_kepala_keluarga, status FROM warga ORDER BY id", conn)
+    payments = pd.read_sql_query(f"SELECT {select_list('pembayaran', CUBE_COLUMNS)} FROM pembayaran ORDER BY id", conn)
+    cube = PaymentCube(warga['id'], payments, active=warga['status'].eq('aktif').to_numpy(),
+                       households=warga[['id', 'no_rumah', 'nama_kepala_keluarga']])
+    build_ms = (time.perf_counter() - start) * 1000
+
+    t_sql_arrears, df_arrears = timed_mean(lambda: sql_arrears(conn, TAHUN_AKHIR), repeat=3)
+    t_cube_arrears, lunas = timed_mean(lambda: (cube.heatmap(TAHUN_AKHIR, active_only=True) == VERIFIED).sum(axis=1))
+    assert sorted(df_arrears['lunas']) == sorted(lunas.tolist())
+    t_sql_payers, payers = timed_mean(lambda: sql_payers(conn, TAHUN_AKHIR, 6))
+    t_cube_payers, cube_payers = timed_mean(lambda: cube.payer_count(TAHUN_AKHIR, 6))
+    assert payers == cube_payers
+    t_heatmap, _ = timed_mean(lambda: cube.heatmap(TAHUN_AKHIR))
+
+    def pandas_pivot():
+        rows = pd.read_sql_query(f"""
+            SELECT w.no_rumah, p.bulan, p.status FROM pembayaran p JOIN warga w ON p.warga_id = w.id
+            WHERE p.tahun={TAHUN_AKHIR}""", conn)
+        return rows.pivot_table(index='no_rumah', columns='bulan', values='status', aggfunc='max')
+
+    t_pivot, _ = timed_mean(pandas_pivot, repeat=3)
+    t_grid, _ = timed_mean(lambda: status_grid(cube, TAHUN_AKHIR))
+    grid, codes = status_grid(cube, TAHUN_AKHIR)
+    t_filter, _ = timed_mean(lambda: grid.loc[grid['blok'].isin(['A', 'B']).to_numpy()
+                                         & (codes[:, :6] != VERIFIED).any(axis=1)])
+
+    next_id = int(payments['id'].max()) + 1
+    start = time.perf_counter()
+    for i in range(1000):
+        cube.apply(next_id + i, 1 + i % n_warga, TAHUN_AKHIR, 1 + i % 12, 100000, 'pending')
+        cube.set_status(next_id + i, 'verified')
+    update_us = (time.perf_counter() - start) / 2000 * 1e6
+
+    print(f"🧊 BENCHMARK KUBUS PEMBAYARAN ({n_warga} warga, {n_tahun} tahun, {n_payments} pembayaran)")
+    print("=" * 72)
+    print(f"  Bangun kubus (1 scan, sekali per TTL) : {build_ms:9.1f} ms, {cube.nbytes / 1024:.0f} KB")
+    print(f"  Pembaruan inkremental per transaksi    : {update_us:9.1f} µs")
+    print(f"  {'analitik':<34} {'SQL':>12} {'kubus':>12}")
+    print(f"  {'bulan lunas per warga (1 tahun)':<34} {t_sql_arrears:9.2f} ms {t_cube_arrears * 1000:9.1f} µs")
+    print(f"  {'Sudah Bayar (1 bulan)':<34} {t_sql_payers:9.2f} ms {t_cube_payers * 1000:9.1f} µs")
+    print(f"  {'heatmap warga × 12 bulan':<34} {'-':>12} {t_heatmap * 1000:9.1f} µs")
+    print(f"  {'grid Peta Pembayaran (pivot)':<34} {t_pivot:9.2f} ms {t_grid:9.2f} ms")
+    print(f"  {'filter blok + tunggakan (grid jadi)':<34} {'-':>12} {t_filter:9.2f} ms")
+
+if __name__ == "__main__":
+    n_warga = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    n_tahun = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    run(n_warga, n_tahun)
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+BENCHMARK DIREKTORI WARGA
+Membandingkan biaya per rerun untuk membuat opsi selectbox warga dan mencari
+warga terpilih: cara lama (bangun label + pecah string + scan DataFrame) vs
+direktori yang di-cache (utils.directory.resident_directory).
+Jalankan dari root project: python scripts/bench_directory.py [jumlah_warga]
+"""
+
+import sys
+import time
+
+import pandas as pd
+
+from _bench import timed_mean
+
+from utils.directory import natural_key, resident_directory
+from utils.formatters import house_labels
+
+def make_warga(n):
+    blocks = "ABCDEFGH"
+    return pd.DataFrame({
+        'id': range(1, n + 1),
+        'no_rumah': [f"{blocks[i % len(blocks)]}-{i // len(blocks) + 1}" for i in range(n)],
+        'nama_kepala_keluarga': [f"Warga {i}" for i in range(n)],
+        'status': 'aktif',
+    })
+
+def old_rerun(df, selected):
+    options = house_labels(df).tolist()
+    no_rumah = selected.split(" - ")[0]
+    return options, int(df[df['no_rumah'] == no_rumah]['id'].iloc[0])
+
+def new_rerun(directory, selected):
+    return directory.options(), int(directory.by_label(selected)['id'])
+
+def run(n):
+    df = make_warga(n).sort_values('no_rumah').reset_index(drop=True)
+    start = time.perf_counter()
+    directory = resident_directory(df)
+    build_ms = (time.perf_counter() - start) * 1000
+    selected = directory.labels[len(directory) // 2]
+
+    assert old_rerun(df, selected)[1] == new_rerun(directory, selected)[1]
+    t_old, _ = timed_mean(lambda: old_rerun(df, selected), repeat=200)
+    t_new, _ = timed_mean(lambda: new_rerun(directory, selected), repeat=200)
+
+    print(f"🏠 BENCHMARK DIREKTORI WARGA ({n} warga)")
+    print("=" * 60)
+    print(f"  Bangun direktori (sekali, lalu di-cache) : {build_ms:8.2f} ms")
+    print(f"  Per rerun, cara lama                     : {t_old:8.3f} ms")
+    print(f"  Per rerun, direktori                     : {t_new:8.3f} ms  ({t_old / t_new:.0f}x)")
+    print(f"  Urutan natural                           : {directory.labels[:3]}")
+    print(f"  Urutan SQL ORDER BY (leksikal)           : {tuple(house_labels(df).head(3))}")
+    assert list(directory.frame['no_rumah']) == sorted(df['no_rumah'], key=natural_key)
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+BENCHMARK FORMATTER
+Membandingkan format kolom per baris (apply) dengan versi vektorisasi
+di utils/formatters.py dan fungsi *_series di utils/helpers.py.
+Pembanding mata uang/tanggal adalah fungsi skalar di utils/helpers.py sendiri.
+Default dijalankan untuk tabel halaman (1.000 baris) dan frame besar (100.000 baris).
+Jalankan: python scripts/bench_formatters.py [jumlah_baris ...]
+"""
+
+import sys
+
+import numpy as np
+import pandas as pd
+
+from _bench import timed
+
+from utils.formatters import period_labels, month_labels, house_labels, join_labels, currency_column
+from utils.helpers import (format_currency, format_date, format_datetime_for_display, get_month_name,
+                           format_date_series, format_datetime_series)
+
+def make_frame(n):
+    """Buat DataFrame sintetis berukuran n baris"""
+    rng = np.random.default_rng(42)
+    return pd.DataFrame({
+        'id': np.arange(1, n + 1),
+        'bulan': rng.integers(1, 13, n),
+        'tahun': rng.integers(2020, 2031, n),
+        'jumlah': rng.integers(0, 5_000_000, n),
+        'no_rumah': [f"A-{i}" for i in range(n)],
+        'nama_kepala_keluarga': [f"Warga {i}" for i in range(n)],
+        'tanggal_bayar': pd.to_datetime(rng.integers(1.6e9, 1.9e9, n), unit='s').strftime('%Y-%m-%d'),
+        'verified_at': pd.to_datetime(rng.integers(1.6e9, 1.9e9, n), unit='s').strftime('%d-%m-%Y %H:%M:%S'),
+    })
+
+def bench(label, old, new, repeat=3):
+    """Jalankan kedua versi, pastikan hasil sama, lalu cetak waktu dan speedup"""
+    t_old, expected = timed(old, repeat)
+    t_new, actual = timed(new, repeat)
+    assert list(expected) == list(actual), f"Hasil {label} berbeda"
+    print(f"  {label:<16} apply: {t_old:9.1f} ms   vektor: {t_new:8.1f} ms   speedup: {t_old / t_new:6.1f}x")
+
+def run(n):
+    print(f"⏱️  BENCHMARK FORMATTER ({n:,} baris)")
+    print("=" * 78)
+    df = make_frame(n)
+
+    bench("periode",
+          lambda: df.apply(lambda x: f"{get_month_name(int(x['bulan']))[:3]} {int(x['tahun'])}", axis=1),
+          lambda: period_labels(df['bulan'], df['tahun']))
+    bench("nama bulan",
+          lambda: df['bulan'].apply(get_month_name),
+          lambda: month_labels(df['bulan'], full=True))
+    bench("label warga",
+          lambda: df.apply(lambda x: f"{x['no_rumah']} - {x['nama_kepala_keluarga']}", axis=1),
+          lambda: house_labels(df))
+    bench("label user",
+          lambda: df.apply(lambda x: f"{x['id']} - {x['no_rumah']}", axis=1),
+          lambda: join_labels(df, ['id', 'no_rumah']))
+    bench("mata uang",
+          lambda: df['jumlah'].apply(format_currency),
+          lambda: currency_column(df['jumlah']))
+    bench("tanggal",
+          lambda: df['tanggal_bayar'].apply(format_date),
+          lambda: format_date_series(df['tanggal_bayar']))
+    bench("datetime",
+          lambda: df['verified_at'].apply(format_datetime_for_display),
+          lambda: format_datetime_series(df['verified_at']))
+
+if __name__ == "__main__":
+    for rows in [int(arg) for arg in sys.argv[1:]] or [1_000, 100_000]:
+        run(rows)
+        print()
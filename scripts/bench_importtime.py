@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+BENCHMARK WAKTU IMPOR (COLD START)
+Mengukur waktu impor saat server start dan saat render pertama tiap halaman
+memakai `python -X importtime`. Setiap pengukuran berjalan di proses baru.
+Jalankan dari root project: python scripts/bench_importtime.py [jumlah_proses]
+
+Gunakan salinan database (bukan database produksi); render halaman bisa
+menulis ke database (misal inisialisasi skema).
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+MARKER = "--- render dimulai ---"
+
+# (label, halaman, admin?) ; halaman None = layar login
+PAGES = [
+    ("Login", None, False),
+    ("Dashboard Admin", "views/dashboard_admin.py", True),
+    ("Data Warga", "views/data_warga.py", True),
+    ("Pembayaran", "views/pembayaran.py", True),
+    ("Pengeluaran", "pages/5_Pengeluaran.py", True),
+    ("Kelola User", "views/kelola_user.py", True),
+    ("Pengaturan", "views/pengaturan.py", True),
+    ("Laporan", "pages/4_Laporan.py", True),
+    ("Ringkasan Keuangan", "pages/1_Dashboard.py", True),
+]
+
+# plotly inti sudah dimuat oleh streamlit sendiri (tema grafik); yang bisa ditunda
+# adalah plotly.express beserta graph_objects dan openpyxl
+HEAVY_MODULES = ["plotly.express", "openpyxl"]
+
+SERVER_CODE = "import streamlit; import streamlit.web.bootstrap"
+
+# Kode yang dijalankan di proses anak: impor harness dulu, cetak penanda ke stderr,
+# lalu render halaman. Impor setelah penanda adalah biaya render pertama halaman.
+PAGE_CODE = """
+import json, sys, time
+from streamlit.logger import set_log_level
+from streamlit.testing.v1 import AppTest
+set_log_level("error")
+sys.path.insert(0, {cwd!r})
+print({marker!r}, file=sys.stderr, flush=True)
+start = time.perf_counter()
+at = AppTest.from_file("app.py", default_timeout=120)
+if {admin!r}:
+    at.session_state['logged_in'] = True
+    at.session_state['is_admin'] = True
+    at.session_state['user_id'] = 1
+    at.session_state['username'] = 'benchmark'
+if {page!r}:
+    at.switch_page({page!r})  # langsung ke halaman tujuan, tanpa render halaman default
+at.run()
+elapsed = (time.perf_counter() - start) * 1000
+heavy = [m for m in {heavy!r} if m in sys.modules]
+error = str(at.exception[0].value) if at.exception else None
+print(json.dumps({{"elapsed": elapsed, "heavy": heavy, "error": error}}))
+"""
+
+# ==================== PARSING OUTPUT -X importtime ====================
+
+def parse_importtime(stderr, after_marker=False):
+    """Total waktu impor (ms) dari modul level teratas, opsional hanya setelah penanda"""
+    total_us = 0
+    counting = not after_marker
+    for line in stderr.splitlines():
+        if line.strip() == MARKER:
+            counting = True
+            continue
+        if not counting or not line.startswith("import time:"):
+            continue
+        parts = line.split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue  # baris header
+        name = parts[2][1:]
+        if not name.startswith(" "):  # modul level teratas (bukan impor bersarang)
+            total_us += int(parts[1])
+    return total_us / 1000
+
+# ==================== PENGUKURAN ====================
+
+def measure_server(repeat):
+    """Waktu impor streamlit dan bootstrap server (terbaik dari beberapa proses baru)"""
+    timings = []
+    for _ in range(repeat):
+        result = subprocess.run([sys.executable, "-X", "importtime", "-c", SERVER_CODE],
+                                capture_output=True, text=True)
+        timings.append(parse_importtime(result.stderr))
+    return min(timings)
+
+def measure_page(page, admin, repeat):
+    """Waktu impor dan render pertama satu halaman (terbaik dari beberapa proses baru)"""
+    best = None
+    for _ in range(repeat):
+        info = _measure_page_once(page, admin)
+        if best is None or info["elapsed"] < best["elapsed"]:
+            best = info
+    return best
+
+def _measure_page_once(page, admin):
+    code = PAGE_CODE.format(cwd=os.getcwd(), marker=MARKER, admin=admin,
+                            page=page, heavy=HEAVY_MODULES)
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                            capture_output=True, text=True)
+    lines = [l for l in result.stdout.splitlines() if l.startswith("{")]
+    if not lines:
+        raise RuntimeError(f"{page}: {result.stderr.strip().splitlines()[-1:]}")
+    info = json.loads(lines[-1])
+    info["imports"] = parse_importtime(result.stderr, after_marker=True)
+    return info
+
+def run(repeat):
+    print(f"⏱️  BENCHMARK COLD START (python -X importtime, terbaik dari {repeat} proses)")
+    print("=" * 78)
+    print(f"  {'Server (streamlit + bootstrap)':<32} impor {measure_server(repeat):8.1f} ms")
+    print("-" * 78)
+    print(f"  {'Halaman':<22} {'impor':>10} {'render pertama':>16}   modul berat")
+    for label, page, admin in PAGES:
+        info = measure_page(page, admin, repeat)
+        heavy = ", ".join(info["heavy"]) or "-"
+        line = f"  {label:<22} {info['imports']:7.1f} ms {info['elapsed']:13.1f} ms   {heavy}"
+        if info["error"]:
+            line += f"  ❌ {info['error']}"
+        print(line)
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 3)
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+BENCHMARK SALDO KAS
+Membandingkan deret saldo penutupan bulanan untuk grafik multi-tahun:
+  scan     : UNION pembayaran terverifikasi + pengeluaran, GROUP BY bulan + window SUM (setiap render)
+  materi   : baca tabel saldo_bulanan (utils.ledger.monthly_balances)
+  tambah   : biaya memperbarui saldo_bulanan setelah satu transaksi baru di bulan berjalan
+Jalankan dari root project: python scripts/bench_ledger.py [jumlah_warga] [jumlah_tahun]
+"""
+
+import random
+import sqlite3
+import sys
+
+import pandas as pd
+
+from _bench import TAHUN_AKHIR, seed_pembayaran, seed_pengeluaran, seed_warga, timed
+
+from utils import ledger
+from utils.database import apply_schema
+
+# ==================== DATA UJI ====================
+
+def seed(conn, n_warga, n_tahun):
+    rng = random.Random(31)
+    years = range(TAHUN_AKHIR - n_tahun + 1, TAHUN_AKHIR + 1)
+    seed_warga(conn, n_warga, rng, aktif=1.0)
+    seed_pembayaran(conn, n_warga, years, rng)
+    seed_pengeluaran(conn, years, n_warga, rng)
+    conn.commit()
+
+# ==================== JALUR ====================
+
+def via_scan(conn):
+    return pd.read_sql_query(f'''
+        WITH arus AS ({ledger.cash_flow_sql()})
+        SELECT substr(tanggal, 1, 7) AS periode, SUM(masuk) AS pemasukan, SUM(keluar) AS pengeluaran,
+               SUM(SUM(masuk) - SUM(keluar)) OVER (ORDER BY substr(tanggal, 1, 7)) AS saldo_akhir
+        FROM arus GROUP BY 1 ORDER BY 1
+    ''', conn)
+
+def run(n_warga, n_tahun):
+    conn = sqlite3.connect(':memory:')
+    apply_schema(conn)
+    seed(conn, n_warga, n_tahun)
+    t_build, months = timed(lambda: ledger.refresh_balances(conn), repeat=1)
+
+    t_scan, scan = timed(lambda: via_scan(conn), repeat=5)
+    t_read, materialized = timed(lambda: ledger.monthly_balances(conn), repeat=5)
+    assert scan['saldo_akhir'].tolist() == materialized['saldo_akhir'].tolist()
+
+    key = TAHUN_AKHIR * 12 + 11
+    def add_and_refresh():
+        conn.execute("INSERT INTO pengeluaran (kategori, jumlah, tanggal) VALUES ('Lainnya', 1000, ?)",
+                     (ledger.month_start(key),))
+        ledger.refresh_balances(conn, key)
+    t_incr, _ = timed(add_and_refresh, repeat=5)
+
+    rows = conn.execute("SELECT (SELECT COUNT(*) FROM pembayaran) + (SELECT COUNT(*) FROM pengeluaran)").fetchone()[0]
+    print(f"📒 BENCHMARK SALDO KAS ({n_warga} warga, {n_tahun} tahun, {rows} transaksi, {months} bulan)")
+    print("=" * 72)
+    print(f"  bangun saldo_bulanan (sekali)          : {t_build:9.1f} ms")
+    print(f"  deret saldo: scan UNION + window       : {t_scan:9.1f} ms")
+    print(f"  deret saldo: baca saldo_bulanan        : {t_read:9.1f} ms")
+    print(f"  transaksi baru + perbarui bulan berjalan: {t_incr:9.1f} ms")
+
+if __name__ == "__main__":
+    n_warga = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    n_tahun = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    run(n_warga, n_tahun)
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+BENCHMARK LOADER BERTIPE
+Membandingkan memori dan waktu groupby DataFrame ledger tanpa skema vs dengan skema dtype
+Jalankan: python scripts/bench_loaders.py [jumlah_warga] [jumlah_tahun]
+"""
+
+import os
+import sys
+import sqlite3
+import timeit
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.loaders import read_sql_typed, PEMBAYARAN_SCHEMA
+
+QUERY = '''
+    SELECT p.*, w.no_rumah, w.nama_kepala_keluarga
+    FROM pembayaran p
+    JOIN warga w ON p.warga_id = w.id
+    ORDER BY p.tahun DESC, p.bulan DESC, p.tanggal_bayar DESC
+'''
+
+def build_ledger(n_warga, n_tahun):
+    """Database in-memory dengan satu pembayaran per warga per bulan"""
+    conn = sqlite3.connect(':memory:')
+    conn.execute("CREATE TABLE warga (id INTEGER PRIMARY KEY, no_rumah TEXT, nama_kepala_keluarga TEXT)")
+    conn.execute('''CREATE TABLE pembayaran (id INTEGER PRIMARY KEY, warga_id INTEGER, bulan INTEGER,
+                    tahun INTEGER, jumlah INTEGER, tanggal_bayar DATE, metode_bayar TEXT, bukti_bayar TEXT,
+                    status TEXT, catatan TEXT, verified_by INTEGER, verified_at TIMESTAMP, created_at TIMESTAMP)''')
+    conn.executemany("INSERT INTO warga VALUES (?, ?, ?)",
+                     [(i, f"B-{i}", f"Warga {i}") for i in range(1, n_warga + 1)])
+    rng = np.random.default_rng(7)
+    rows = []
+    for tahun in range(2026 - n_tahun + 1, 2027):
+        for bulan in range(1, 13):
+            for w in range(1, n_warga + 1):
+                status = ('verified', 'pending', 'rejected')[rng.integers(0, 3)]
+                rows.append((w, bulan, tahun, 100000, f"{tahun}-{bulan:02d}-05", 'Transfer',
+                             f"R{w}-{tahun}{bulan}", status, '', 1, f"{tahun}-{bulan:02d}-06 10:00:00",
+                             f"{tahun}-{bulan:02d}-05 09:00:00"))
+    conn.executemany('''INSERT INTO pembayaran (warga_id, bulan, tahun, jumlah, tanggal_bayar, metode_bayar,
+                        bukti_bayar, status, catatan, verified_by, verified_at, created_at)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)''', rows)
+    return conn
+
+def run(n_warga, n_tahun):
+    conn = build_ledger(n_warga, n_tahun)
+    df_plain = pd.read_sql_query(QUERY, conn)
+    df_typed = read_sql_typed(QUERY, conn, PEMBAYARAN_SCHEMA)
+    conn.close()
+
+    mem_plain = df_plain.memory_usage(deep=True).sum() / 1024 ** 2
+    mem_typed = df_typed.memory_usage(deep=True).sum() / 1024 ** 2
+    print(f"📦 LEDGER {len(df_plain):,} baris ({n_warga} warga x {n_tahun} tahun)")
+    print("=" * 60)
+    print(f"  Memori tanpa skema : {mem_plain:8.1f} MB")
+    print(f"  Memori dengan skema: {mem_typed:8.1f} MB  ({mem_typed / mem_plain:.0%})")
+
+    def group(df):
+        return df.groupby(['tahun', 'status'], observed=True)['jumlah'].sum()
+    t_plain = min(timeit.repeat(lambda: group(df_plain), number=5, repeat=3)) / 5
+    t_typed = min(timeit.repeat(lambda: group(df_typed), number=5, repeat=3)) / 5
+    print(f"  Groupby tahun x status: {t_plain * 1000:.1f} ms -> {t_typed * 1000:.1f} ms")
+
+if __name__ == "__main__":
+    warga = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    tahun = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    run(warga, tahun)
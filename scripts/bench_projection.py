@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+BENCHMARK PROYEKSI KOLOM
+Membandingkan SELECT * dengan daftar kolom yang dideklarasikan halaman
+(utils.database.select_list) pada database in-memory yang dibuat dari SCHEMA_DDL:
+waktu query, memori DataFrame, dan ukuran payload Arrow yang dikirim ke browser.
+Jalankan dari root project: python scripts/bench_projection.py [jumlah_warga]
+"""
+
+import random
+import sqlite3
+import sys
+import time
+
+import pandas as pd
+import pyarrow as pa
+
+from _bench import seed_warga
+
+from utils.database import apply_schema, USER_COLUMNS, select_list
+
+# ==================== DATA UJI ====================
+
+def seed(conn, n_warga, bulan=24):
+    rng = random.Random(5)
+    seed_warga(conn, n_warga, rng, aktif=1.0)
+    conn.executemany(
+        "INSERT INTO pembayaran (warga_id, bulan, tahun, jumlah, tanggal_bayar, metode_bayar, bukti_bayar, "
+        "status, catatan, verified_by, verified_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        [(w, m % 12 + 1, 2024 + m // 12, 50000, '2024-01-05', 'transfer', f"uploads/bukti_{w}_{m}.jpg",
+          'verified', 'Pembayaran iuran bulanan via transfer bank' if m % 3 else None, 1, '2024-01-06 10:00:00')
+         for w in range(1, n_warga + 1) for m in range(bulan)])
+    conn.executemany(
+        "INSERT INTO users (username, password, nama_lengkap, role, status) VALUES (?, ?, ?, ?, ?)",
+        [(f"user{i}", 'x' * 64, f"User {i}", 'warga', 'aktif') for i in range(n_warga // 10)])
+    conn.commit()
+
+# ==================== SKENARIO ====================
+
+# (nama, tabel, kolom halaman, query dengan placeholder {cols})
+SCENARIOS = [
+    ("warga (Data Warga)", 'warga',
+     ('id', 'no_rumah', 'nama_kepala_keluarga', 'anggota_keluarga', 'telepon', 'email', 'tanggal_masuk', 'status'),
+     "SELECT {cols} FROM warga ORDER BY no_rumah"),
+    ("pembayaran (Riwayat)", 'pembayaran',
+     ('id', 'warga_id', 'bulan', 'tahun', 'jumlah', 'tanggal_bayar', 'bukti_bayar', 'status'),
+     "SELECT {cols} FROM pembayaran ORDER BY tahun DESC, bulan DESC"),
+    ("users (Kelola User)", 'users', USER_COLUMNS,
+     "SELECT {cols} FROM users ORDER BY created_at DESC"),
+]
+
+def measure(conn, sql, repeat=5):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        df = pd.read_sql_query(sql, conn)
+        best = min(best, time.perf_counter() - start)
+    memory = df.memory_usage(deep=True).sum() / 1024
+    arrow = pa.Table.from_pandas(df, preserve_index=False).nbytes / 1024
+    return best * 1000, memory, arrow, len(df.columns)
+
+def run(n_warga):
+    conn = sqlite3.connect(':memory:')
+    apply_schema(conn)
+    seed(conn, n_warga)
+
+    print(f"📐 BENCHMARK PROYEKSI KOLOM ({n_warga} warga)")
+    print("=" * 92)
+    print(f"  {'query':<22} {'kolom':>7} {'waktu':>18} {'memori DataFrame':>24} {'payload Arrow':>22}")
+    for name, table, columns, sql in SCENARIOS:
+        full = measure(conn, sql.format(cols='*'))
+        proj = measure(conn, sql.format(cols=select_list(table, columns)))
+        print(f"  {name:<22} {full[3]:>3}→{proj[3]:<3} "
+              f"{full[0]:6.1f}→{proj[0]:6.1f} ms "
+              f"{full[1]:8.0f}→{proj[1]:7.0f} KB ({proj[1] / full[1]:4.0%}) "
+              f"{full[2]:7.0f}→{proj[2]:6.0f} KB ({proj[2] / full[2]:4.0%})")
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+BENCHMARK QUERY PER INTERAKSI
+Menghitung jumlah statement SQL yang dijalankan untuk setiap interaksi widget
+(ketik pencarian, ganti filter, tombol Refresh) di halaman admin, memakai
+streamlit.testing (AppTest) dan trace callback sqlite3.
+Jalankan dari root project: python scripts/bench_queries.py
+
+Catatan: AppTest menjalankan ulang seluruh script untuk setiap interaksi, termasuk
+widget di dalam fragment. Angka di sini adalah batas atas; di server sungguhan
+fragment hanya menjalankan loader miliknya sendiri.
+
+Gunakan salinan database (bukan database produksi).
+"""
+
+import os
+import sqlite3
+import sys
+
+from streamlit.logger import set_log_level
+from streamlit.testing.v1 import AppTest
+
+set_log_level("error")
+
+# ==================== PENGHITUNG QUERY ====================
+
+_counter = {'queries': 0}
+_connect = sqlite3.connect
+
+def _counting_connect(*args, **kwargs):
+    conn = _connect(*args, **kwargs)
+    conn.set_trace_callback(lambda _sql: _counter.__setitem__('queries', _counter['queries'] + 1))
+    return conn
+
+sqlite3.connect = _counting_connect
+
+# ==================== SKENARIO ====================
+
+def _find(widgets, label):
+    for widget in widgets:
+        if widget.label == label:
+            return widget
+    return None
+
+def type_search(at):
+    widget = _find(at.text_input, "Cari")
+    return widget.input("A-0") if widget else None
+
+def change_status_filter(at):
+    widget = _find(at.selectbox, "Filter Status")
+    return widget.set_value("aktif") if widget else None
+
+def click_refresh(at):
+    widget = _find(at.button, "Refresh Data")
+    return widget.click() if widget else None
+
+def select_user(at):
+    widget = _find(at.selectbox, "Pilih user untuk dikelola")
+    if widget is None or len(widget.options) < 2:
+        return None
+    return widget.set_value(widget.options[1])
+
+def plain_rerun(at):
+    return at
+
+SCENARIOS = [
+    ("views/dashboard_admin.py", "rerun", plain_rerun),
+    ("views/dashboard_admin.py", "refresh", click_refresh),
+    ("views/data_warga.py", "rerun", plain_rerun),
+    ("views/data_warga.py", "cari", type_search),
+    ("views/data_warga.py", "filter", change_status_filter),
+    ("views/data_warga.py", "refresh", click_refresh),
+    ("views/pembayaran.py", "rerun", plain_rerun),
+    ("views/pembayaran.py", "refresh", click_refresh),
+    ("views/kelola_user.py", "rerun", plain_rerun),
+    ("views/kelola_user.py", "pilih user", select_user),
+]
+
+def open_page(page):
+    at = AppTest.from_file("app.py", default_timeout=120)
+    at.session_state['logged_in'] = True
+    at.session_state['is_admin'] = True
+    at.session_state['user_id'] = 1
+    at.session_state['username'] = 'benchmark'
+    at.switch_page(page)
+    at.run()
+    if at.exception:
+        raise RuntimeError(f"{page}: {at.exception[0].value}")
+    return at
+
+def measure(page, action):
+    """Jumlah query untuk satu interaksi (setelah halaman sudah dirender sekali)"""
+    at = open_page(page)
+    target = action(at)
+    if target is None:
+        return None
+    _counter['queries'] = 0
+    target.run()
+    return _counter['queries']
+
+def run():
+    print("🔎 BENCHMARK QUERY PER INTERAKSI (admin)")
+    print("=" * 60)
+    for page, label, action in SCENARIOS:
+        count = measure(page, action)
+        shown = "-" if count is None else f"{count:4d} query"
+        print(f"  {page:<28} {label:<12} {shown}")
+
+if __name__ == "__main__":
+    sys.path.insert(0, os.getcwd())
+    run()
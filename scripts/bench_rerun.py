@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+BENCHMARK RERUN HALAMAN
+Mengukur waktu rerun app.py per halaman memakai streamlit.testing (AppTest)
+Jalankan dari root project: python scripts/bench_rerun.py [jumlah_rerun]
+
+Gunakan salinan database (bukan database produksi); rerun halaman tertentu
+bisa menulis ke database (misal inisialisasi skema).
+"""
+
+import os
+import sys
+import time
+
+from streamlit.logger import set_log_level
+from streamlit.testing.v1 import AppTest
+
+set_log_level("error")
+
+ADMIN_PAGES = [
+    "views/dashboard_admin.py",
+    "views/data_warga.py",
+    "views/pembayaran.py",
+    "pages/4_Laporan.py",
+    "pages/5_Pengeluaran.py",
+    "views/kelola_user.py",
+    "views/pengaturan.py",
+]
+
+def measure(page, runs):
+    """Waktu rerun tercepat (ms) untuk satu halaman sebagai admin"""
+    at = AppTest.from_file("app.py", default_timeout=120)
+    at.session_state['logged_in'] = True
+    at.session_state['is_admin'] = True
+    at.session_state['user_id'] = 1
+    at.session_state['username'] = 'benchmark'
+    at.run()
+    at.switch_page(page).run()
+    if at.exception:
+        raise RuntimeError(f"{page}: {at.exception[0].value}")
+
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        at.run()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+def run(runs):
+    print(f"⏱️  BENCHMARK RERUN ({runs}x per halaman, admin)")
+    print("=" * 60)
+    for page in ADMIN_PAGES:
+        print(f"  {page:<28} {measure(page, runs):8.1f} ms")
+
+if __name__ == "__main__":
+    sys.path.insert(0, os.getcwd())
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
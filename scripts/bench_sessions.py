@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+BENCHMARK MEMORI PER SESI
+Mensimulasikan banyak sesi admin yang membuka Data Warga dan Kelola User lalu
+melakukan satu rerun (filter status), dan mengukur memori dengan tracemalloc:
+cara lama (DataFrame hasil st.cache_data disalin ke session_state + .copy() setiap
+rerun) vs registry frame bersama copy-on-write (utils.frames.FrameRegistry).
+Jalankan dari root project: python scripts/bench_sessions.py [jumlah_sesi] [jumlah_warga]
+"""
+
+import pickle
+import random
+import sqlite3
+import sys
+import tracemalloc
+
+import pandas as pd
+
+from _bench import seed_warga
+
+from utils.database import apply_schema, USER_COLUMNS, WARGA_DIRECTORY_COLUMNS, select_list
+from utils.frames import FrameRegistry
+
+# ==================== DATA UJI ====================
+
+def seed(conn, n_warga):
+    rng = random.Random(11)
+    seed_warga(conn, n_warga, rng)
+    conn.executemany(
+        "INSERT INTO users (username, password, nama_lengkap, role, status) VALUES (?, ?, ?, ?, ?)",
+        [(f"user{i}", 'x' * 64, f"User {i}", 'pengurus', 'aktif') for i in range(max(n_warga // 20, 5))])
+    conn.commit()
+
+def load(conn, table, columns):
+    return pd.read_sql_query(f"SELECT {select_list(table, columns)} FROM {table}", conn)
+
+# ==================== SIMULASI SESI ====================
+
+def rerun(df):
+    """Satu rerun tab daftar: filter status lalu hitung metrik"""
+    view = df[df['status'] == 'aktif']
+    return len(view)
+
+def old_sessions(conn, n_sessions):
+    # st.cache_data menyimpan hasil ter-pickle dan mengembalikan salinan baru ke setiap pemanggil
+    cached = {
+        'warga': pickle.dumps(load(conn, 'warga', WARGA_DIRECTORY_COLUMNS)),
+        'users': pickle.dumps(load(conn, 'users', USER_COLUMNS)),
+    }
+    sessions = []
+    for _ in range(n_sessions):
+        state = {'warga_data': pickle.loads(cached['warga']), 'df_users': pickle.loads(cached['users'])}
+        rerun(state['warga_data'].copy())
+        state['df_users'].copy()
+        sessions.append(state)
+    return sessions
+
+def new_sessions(conn, n_sessions):
+    registry = FrameRegistry()
+    registry.register('warga', lambda: load(conn, 'warga', WARGA_DIRECTORY_COLUMNS))
+    registry.register('users', lambda: load(conn, 'users', USER_COLUMNS))
+    sessions = []
+    for _ in range(n_sessions):
+        # Sesi hanya menyimpan state filter; frame diambil dari registry setiap rerun
+        state = {'warga_filter_status': 'Aktif', 'warga_search': ''}
+        rerun(registry.get('warga'))
+        registry.get('users')
+        sessions.append(state)
+    return sessions, registry
+
+def measure(build, conn, n_sessions, copy_on_write):
+    pd.set_option('mode.copy_on_write', copy_on_write)
+    tracemalloc.start()
+    result = build(conn, n_sessions)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current / 1024, peak / 1024
+
+def run(n_sessions, n_warga):
+    conn = sqlite3.connect(':memory:')
+    apply_schema(conn)
+    seed(conn, n_warga)
+
+    old = measure(old_sessions, conn, n_sessions, copy_on_write=False)
+    new = measure(new_sessions, conn, n_sessions, copy_on_write=True)
+
+    print(f"🧠 BENCHMARK MEMORI SESI ({n_sessions} sesi, {n_warga} warga)")
+    print("=" * 70)
+    print(f"  {'':<28} {'tertahan':>12} {'per sesi':>12} {'puncak':>12}")
+    print(f"  {'session_state + .copy()':<28} {old[0]:9.0f} KB {old[0] / n_sessions:9.1f} KB {old[1]:9.0f} KB")
+    print(f"  {'registry copy-on-write':<28} {new[0]:9.0f} KB {new[0] / n_sessions:9.1f} KB {new[1]:9.0f} KB")
+    print(f"  Hemat memori tertahan: {old[0] / new[0]:.0f}x")
+
+if __name__ == "__main__":
+    n_sessions = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    n_warga = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    run(n_sessions, n_warga)
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+BENCHMARK RESOLVER TARIF
+Membandingkan penentuan tarif iuran per warga-bulan (tanggal berlaku + override tipe rumah):
+  sql    : subquery berkorelasi "tarif terakhir dengan berlaku_mulai <= periode" per baris
+  python : bisect per baris di jadwal tarif
+  vektor : utils.tarif.TarifSchedule.resolve (searchsorted, satu panggilan)
+Jalankan dari root project: python scripts/bench_tarif.py [jumlah_warga] [jumlah_tahun]
+"""
+
+import bisect
+import random
+import sqlite3
+import sys
+
+import numpy as np
+
+from _bench import TAHUN_AKHIR, timed
+
+from utils.database import apply_schema
+from utils.tarif import TIPE_STANDAR, TarifSchedule, month_key
+
+TIPE = [TIPE_STANDAR] * 8 + ['ruko', 'kavling']
+
+# ==================== DATA UJI ====================
+
+def schedule_rows(n_tahun):
+    rows = []
+    for i, tahun in enumerate(range(TAHUN_AKHIR - n_tahun + 1, TAHUN_AKHIR + 1)):
+        rows.append((i * 3 + 1, f"{tahun}-01-01", TIPE_STANDAR, 100000 + i * 5000, ''))
+        rows.append((i * 3 + 2, f"{tahun}-07-01", 'ruko', 200000 + i * 10000, ''))
+        rows.append((i * 3 + 3, f"{tahun}-04-01", 'kavling', 75000 + i * 2500, ''))
+    return rows
+
+def periods(n_warga, n_tahun):
+    rng = random.Random(23)
+    tipe = np.array([rng.choice(TIPE) for _ in range(n_warga)], dtype=object)
+    years = np.arange(TAHUN_AKHIR - n_tahun + 1, TAHUN_AKHIR + 1)
+    w, y, m = np.meshgrid(np.arange(n_warga), years, np.arange(1, 13), indexing='ij')
+    return tipe[w.ravel()], y.ravel(), m.ravel()
+
+# ==================== JALUR ====================
+
+def via_sql(conn, tipe, tahun, bulan):
+    conn.execute("DROP TABLE IF EXISTS periode")
+    conn.execute("CREATE TEMP TABLE periode (tipe TEXT, kunci INTEGER)")
+    conn.executemany("INSERT INTO periode VALUES (?, ?)", zip(tipe.tolist(), month_key(tahun, bulan).tolist()))
+    kunci = "(CAST(substr(t.berlaku_mulai, 1, 4) AS INTEGER) * 12 + CAST(substr(t.berlaku_mulai, 6, 2) AS INTEGER) - 1)"
+    return conn.execute(f"""
+        SELECT COALESCE(
+            (SELECT t.jumlah FROM tarif t WHERE t.tipe_rumah = p.tipe AND {kunci} <= p.kunci
+             ORDER BY t.berlaku_mulai DESC LIMIT 1),
+            (SELECT t.jumlah FROM tarif t WHERE t.tipe_rumah = '' AND {kunci} <= p.kunci
+             ORDER BY t.berlaku_mulai DESC LIMIT 1),
+            (SELECT t.jumlah FROM tarif t WHERE t.tipe_rumah = '' ORDER BY t.berlaku_mulai LIMIT 1))
+        FROM periode p""").fetchall()
+
+def via_python(schedule, tipe, tahun, bulan):
+    groups = {}
+    for row in schedule.frame.itertuples():
+        key = row.berlaku_mulai.year * 12 + row.berlaku_mulai.month - 1
+        groups.setdefault(row.tipe_rumah, ([], []))
+        groups[row.tipe_rumah][0].append(key)
+        groups[row.tipe_rumah][1].append(row.jumlah)
+    default_keys, default_amounts = groups.pop(TIPE_STANDAR)
+    result = []
+    for t, key in zip(tipe.tolist(), month_key(tahun, bulan).tolist()):
+        pos = bisect.bisect_right(default_keys, key) - 1
+        amount = default_amounts[max(pos, 0)]
+        if t in groups:
+            pos = bisect.bisect_right(groups[t][0], key) - 1
+            if pos >= 0:
+                amount = groups[t][1][pos]
+        result.append(amount)
+    return result
+
+def run(n_warga, n_tahun):
+    rows = schedule_rows(n_tahun)
+    conn = sqlite3.connect(':memory:')
+    apply_schema(conn)
+    conn.executemany("INSERT INTO tarif (id, berlaku_mulai, tipe_rumah, jumlah, keterangan) VALUES (?, ?, ?, ?, ?)", rows)
+    schedule = TarifSchedule([dict(zip(('id', 'berlaku_mulai', 'tipe_rumah', 'jumlah', 'keterangan'), row))
+                              for row in rows])
+    tipe, tahun, bulan = periods(n_warga, n_tahun)
+
+    print(f"💰 BENCHMARK RESOLVER TARIF ({n_warga} warga, {n_tahun} tahun, {len(tipe)} warga-bulan, "
+          f"{len(rows)} baris tarif)")
+    print("=" * 72)
+    t_vec, vec = timed(lambda: schedule.resolve(tahun, bulan, tipe))
+    t_py, py = timed(lambda: via_python(schedule, tipe, tahun, bulan), repeat=1)
+    assert vec.tolist() == py
+    print(f"  vektor (searchsorted)  : {t_vec:10.1f} ms")
+    print(f"  python (bisect/baris)  : {t_py:10.1f} ms")
+    # Subquery berkorelasi hanya diukur pada sampel agar benchmark tetap singkat
+    n_sql = min(len(tipe), 50000)
+    t_sql, sql = timed(lambda: via_sql(conn, tipe[:n_sql], tahun[:n_sql], bulan[:n_sql]), repeat=1)
+    assert [row[0] for row in sql] == vec[:n_sql].tolist()
+    print(f"  sql (subquery/baris)   : {t_sql:10.1f} ms untuk {n_sql} baris "
+          f"(~{t_sql * len(tipe) / n_sql:.0f} ms untuk semua)")
+
+if __name__ == "__main__":
+    n_warga = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    n_tahun = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    run(n_warga, n_tahun)
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+BENCHMARK DERET WAKTU PANJANG
+Membandingkan ukuran payload JSON dan waktu bangun grafik garis untuk deret
+harian/per jam yang panjang: px.line apa adanya vs utils.charts.time_series_figure
+(agregasi adaptif / LTTB + WebGL).
+Jalankan dari root project: python scripts/bench_timeseries.py
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.getcwd())
+
+from utils.charts import clear_figure_cache, time_series_figure, POINT_BUDGET
+from utils.lazy import px
+
+# (jumlah titik, frekuensi data mentah)
+SIZES = [(365, 'D'), (3 * 365, 'D'), (10 * 365, 'D'), (20 * 365, 'D'), (100_000, 'h')]
+
+def make_series(n, freq):
+    rng = np.random.default_rng(7)
+    return pd.DataFrame({
+        'tgl': pd.date_range('2000-01-01', periods=n, freq=freq),
+        'jml': rng.poisson(5, n),
+    })
+
+def measure(build):
+    start = time.perf_counter()
+    fig = build()
+    payload = fig.to_json()
+    elapsed = (time.perf_counter() - start) * 1000
+    return elapsed, len(payload) / 1024, len(fig.data[0].x), type(fig.data[0]).__name__
+
+def run():
+    print(f"📉 BENCHMARK DERET WAKTU (budget {POINT_BUDGET} titik)")
+    print("=" * 86)
+    print(f"  {'titik':>8} | {'px.line apa adanya':^32} | {'time_series_figure':^36}")
+    measure(lambda: px.line(make_series(10, 'D'), x='tgl', y='jml'))  # pemanasan impor plotly
+    for n, freq in SIZES:
+        df = make_series(n, freq)
+        clear_figure_cache()
+        raw = measure(lambda: px.line(df, x='tgl', y='jml'))
+        new = measure(lambda: time_series_figure('bench', df, 'tgl', 'jml'))
+        print(f"  {n:>7}{freq} | {raw[0]:7.1f} ms {raw[1]:8.1f} KB {raw[2]:>7} | "
+              f"{new[0]:7.1f} ms {new[1]:8.1f} KB {new[2]:>6} {new[3]}")
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+BENCHMARK TYPEAHEAD PENCARIAN WARGA
+Mensimulasikan pengetikan query huruf demi huruf dan membandingkan:
+SQL LIKE per ketikan (search_warga lama), str.contains pada DataFrame,
+dan index prefix dengan penyempurnaan bertahap (utils.typeahead).
+Jalankan dari root project: python scripts/bench_typeahead.py [jumlah_warga]
+"""
+
+import random
+import sqlite3
+import sys
+import time
+
+import pandas as pd
+
+from _bench import elapsed, no_rumah
+
+from utils.directory import resident_directory
+
+FIRST = ["Budi", "Siti", "Agus", "Dewi", "Joko", "Rina", "Hendra", "Sri", "Bambang", "Wati"]
+LAST = ["Santoso", "Wijaya", "Saputra", "Lestari", "Hidayat", "Kurniawan", "Pratama", "Susanto"]
+QUERIES = ["budi santoso", "a-1", "0812"]
+
+def make_warga(n):
+    rng = random.Random(3)
+    return pd.DataFrame({
+        'id': range(1, n + 1),
+        'no_rumah': [no_rumah(i) for i in range(n)],
+        'nama_kepala_keluarga': [f"{rng.choice(FIRST)} {rng.choice(LAST)}" for _ in range(n)],
+        'telepon': [f"08{rng.randint(100000000, 999999999)}" for _ in range(n)],
+        'email': '',
+        'status': 'aktif',
+    })
+
+def keystrokes(query):
+    return [query[:i] for i in range(1, len(query) + 1)]
+
+def bench_like(conn, query):
+    for typed in keystrokes(query):
+        pd.read_sql_query(
+            "SELECT * FROM warga WHERE (nama_kepala_keluarga LIKE ? OR no_rumah LIKE ?) ORDER BY no_rumah",
+            conn, params=(f'%{typed}%', f'%{typed}%'))
+
+def bench_contains(df, query):
+    for typed in keystrokes(query):
+        mask = df['nama_kepala_keluarga'].str.contains(typed, case=False, regex=False) | \
+               df['no_rumah'].str.contains(typed, case=False, regex=False)
+        df[mask]
+
+def bench_index(index, frame, query):
+    for typed in keystrokes(query):
+        frame.iloc[list(index.search(typed))]
+
+def run(n):
+    df = make_warga(n)
+    conn = sqlite3.connect(':memory:')
+    df.to_sql('warga', conn, index=False)
+    directory = resident_directory(df)
+
+    start = time.perf_counter()
+    index = directory.search_index
+    build_ms = (time.perf_counter() - start) * 1000
+
+    print(f"🔤 BENCHMARK TYPEAHEAD ({n} warga, waktu total per query yang diketik)")
+    print("=" * 72)
+    print(f"  Bangun index (sekali per penulisan warga): {build_ms:.1f} ms, {len(index._tokens)} token")
+    print(f"  {'query':<14} {'SQL LIKE':>10} {'contains':>10} {'index':>10}  hasil")
+    for query in QUERIES:
+        t_like, _ = elapsed(lambda: bench_like(conn, query))
+        t_contains, _ = elapsed(lambda: bench_contains(df, query))
+        t_index, _ = elapsed(lambda: bench_index(index, directory.frame, query))
+        print(f"  {query!r:<14} {t_like:8.1f} ms {t_contains:7.1f} ms {t_index:7.2f} ms  "
+              f"{len(index.search(query))}")
+    print(f"  statistik index: {index.stats}, entri cache {len(index._cache)}")
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+CEK UMUR TUNGGAKAN
+Skenario kecil di database in-memory untuk utils.aging.arrears_aging:
+  - warga A bayar Januari lalu bayar di muka 4 bulan (Februari-Mei) sekaligus
+  - warga B bayar setengah iuran Oktober
+Bulan yang dibayar di muka dan bulan yang belum ditagih tidak boleh menjadi tunggakan,
+dan total umur tunggakan harus sama dengan sisa tagihan terbuka (billing.arrears_summary).
+Jalankan dari root project: python scripts/check_aging.py
+Keluar dengan kode 1 jika ada pengecekan yang gagal.
+"""
+
+import os
+import sqlite3
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from streamlit.logger import set_log_level
+
+set_log_level("error")
+
+from utils.aging import AGING_LABELS, aging_totals, arrears_aging
+from utils.billing import arrears_summary, billing_run, open_invoices
+from utils.database import apply_schema
+from utils.tarif import DEFAULT_IURAN, TarifSchedule
+
+HARI_INI = '2026-10-19'
+BATAS_WAKTU = 15
+
+def seed(conn):
+    conn.executemany(
+        "INSERT INTO warga (no_rumah, nama_kepala_keluarga, anggota_keluarga, tanggal_masuk, status) VALUES (?, ?, ?, ?, ?)",
+        [('A-1', 'Warga A', 3, '2026-01-01', 'aktif'), ('B-1', 'Warga B', 2, '2026-09-01', 'aktif')])
+    conn.executemany(
+        "INSERT INTO pembayaran (warga_id, bulan, tahun, jumlah, tanggal_bayar, status) VALUES (?, ?, ?, ?, ?, ?)",
+        [(1, 1, 2026, DEFAULT_IURAN, '2026-01-05', 'verified'),
+         (1, 2, 2026, DEFAULT_IURAN * 4, '2026-02-05', 'verified'),
+         (2, 10, 2026, DEFAULT_IURAN // 2, '2026-10-05', 'verified')])
+    schedule = TarifSchedule()
+    for bulan in range(1, 11):
+        billing_run(conn, 2026, bulan, schedule)
+    conn.commit()
+
+def main():
+    conn = sqlite3.connect(':memory:')
+    apply_schema(conn)
+    seed(conn)
+    aging = arrears_aging(open_invoices(conn), BATAS_WAKTU, today=HARI_INI).set_index('no_rumah')
+    a, b = aging.loc['A-1'], aging.loc['B-1']
+
+    checks = [
+        # A: Juni-Oktober terbuka; Februari-Mei lunas dari bayar di muka, November belum ditagih
+        ("A menunggak 5 bulan (Jun-Okt)", a['bulan_tunggak'] == 5),
+        ("A: Oktober 1-30 hari", a['1-30 hari'] == DEFAULT_IURAN),
+        ("A: September 31-60 hari", a['31-60 hari'] == DEFAULT_IURAN),
+        ("A: Agustus 61-90 hari", a['61-90 hari'] == DEFAULT_IURAN),
+        ("A: Juni-Juli > 90 hari", a['> 90 hari'] == DEFAULT_IURAN * 2),
+        ("A: hari terlama dari jatuh tempo Juni", a['hari_terlama'] == 126),
+        # B: masuk September; Oktober terbayar setengah
+        ("B menunggak 2 bulan (Sep-Okt)", b['bulan_tunggak'] == 2),
+        ("B: sisa Oktober setengah iuran", b['1-30 hari'] == DEFAULT_IURAN - DEFAULT_IURAN // 2),
+        ("Total umur = sisa tagihan terbuka",
+         aging_totals(aging)['nominal'].sum() == arrears_summary(conn)['sisa'].sum()),
+        ("Tanpa tagihan terbuka hasilnya kosong",
+         arrears_aging(open_invoices(conn).iloc[0:0], BATAS_WAKTU, today=HARI_INI).empty),
+    ]
+
+    print("🔍 CEK UMUR TUNGGAKAN")
+    print("=" * 60)
+    print(aging[['bulan_tunggak', *AGING_LABELS, 'total', 'hari_terlama']].to_string())
+    print("-" * 60)
+    failures = 0
+    for label, ok in checks:
+        print(f"  {'✅' if ok else '❌'} {label}")
+        failures += not ok
+    print("=" * 60)
+    if failures:
+        print(f"❌ {failures} dari {len(checks)} pengecekan gagal")
+        return 1
+    print(f"✅ Semua {len(checks)} pengecekan lolos")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+CEK PARITAS ENGINE ANALITIK
+Menjalankan setiap query laporan (utils.analytics.REPORTS), query periode tertutup
+(utils.closing.SNAPSHOT_REPORTS) dan hasil gabungan keduanya (utils.closing.merge_report,
+seperti yang dibaca halaman laporan) di SQLite dan DuckDB (mode 'scan' dan 'copy') lalu
+membandingkan hasilnya baris per baris.
+Jalankan dari root project: python scripts/check_analytics_parity.py [path_database]
+Keluar dengan kode 1 jika ada hasil yang berbeda (bisa dipakai di CI/cron).
+
+Database dibuka read-only; DuckDB harus terpasang (pip install duckdb).
+"""
+
+import os
+import sqlite3
+import sys
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.analytics import REPORTS, DuckDBEngine, SQLiteEngine, load_duckdb
+from utils.closing import SNAPSHOT_REPORTS, merge_report
+
+DB_PATH = 'data/database.db'
+
+# Parameter per query: daftar tuple; None = tanpa parameter
+def report_params(db_path):
+    conn = sqlite3.connect(f"file:{os.path.abspath(db_path)}?mode=ro", uri=True)
+    try:
+        years = {row[0] for row in conn.execute("SELECT DISTINCT tahun FROM pembayaran")}
+        years |= {int(row[0]) for row in conn.execute(
+            "SELECT DISTINCT substr(tanggal, 1, 4) FROM pengeluaran WHERE tanggal GLOB '[0-9][0-9][0-9][0-9]*'")}
+    finally:
+        conn.close()
+    # Tahun tanpa data ikut diuji agar hasil kosong juga sama
+    years = sorted(years) + [1999]
+    per_year = [(year,) for year in years]
+    return {
+        'pembayaran_bulanan': per_year,
+        'pendapatan_tahunan': [()],
+        'pengeluaran_kategori': per_year,
+        'pengeluaran_bulanan': per_year,
+        'tunggakan_tahunan': per_year,
+    }
+
+def normalize(df):
+    """Samakan representasi antar engine: integer tanpa NULL ke int64, teks ke str"""
+    df = df.reset_index(drop=True).copy()
+    for column in df.columns:
+        values = df[column]
+        if pd.api.types.is_numeric_dtype(values):
+            df[column] = values.astype('int64') if values.notna().all() and (values % 1 == 0).all() else values.astype('float64')
+        else:
+            df[column] = values.astype(str)
+    return df
+
+def compare(expected, actual):
+    """None jika sama, selain itu pesan perbedaan singkat"""
+    try:
+        pd.testing.assert_frame_equal(normalize(expected), normalize(actual), check_dtype=False)
+        return None
+    except AssertionError as e:
+        return str(e).splitlines()[0] if str(e) else 'berbeda'
+
+# ==================== JALUR LAPORAN ====================
+# Setiap jalur: (label, nama laporan yang dicakup, fungsi(engine, name, params) -> DataFrame)
+
+def run_live(engine, name, params):
+    return engine.query(REPORTS[name], params)
+
+def run_frozen(engine, name, params):
+    return engine.query(SNAPSHOT_REPORTS[name], params)
+
+def run_merged(engine, name, params):
+    live, frozen = engine.query_all([(REPORTS[name], params), (SNAPSHOT_REPORTS[name], params)])
+    return merge_report(name, live, frozen)
+
+PATHS = [
+    ('live', REPORTS, run_live),
+    ('tutup buku', SNAPSHOT_REPORTS, run_frozen),
+    ('gabungan', SNAPSHOT_REPORTS, run_merged),
+]
+
+def main():
+    db_path = sys.argv[1] if len(sys.argv) > 1 else DB_PATH
+    if not os.path.exists(db_path):
+        print(f"❌ Database tidak ditemukan: {db_path}")
+        return 1
+    if load_duckdb() is None:
+        print("❌ DuckDB tidak terpasang (pip install duckdb); tidak ada yang bisa dibandingkan")
+        return 1
+
+    uri = f"file:{os.path.abspath(db_path)}?mode=ro"
+    sqlite = SQLiteEngine(lambda: sqlite3.connect(uri, uri=True))
+    engines = [DuckDBEngine(db_path, mode='scan'), DuckDBEngine(db_path, mode='copy')]
+
+    print("🔍 CEK PARITAS ENGINE ANALITIK")
+    print("=" * 60)
+    print(f"Database: {db_path}")
+    failures = 0
+    checks = 0
+    params_by_name = report_params(db_path)
+    assert set(params_by_name) == set(REPORTS) and set(SNAPSHOT_REPORTS) <= set(REPORTS)
+    for label, reports, run in PATHS:
+        for name in reports:
+            param_sets = params_by_name[name]
+            before = failures
+            for params in param_sets:
+                expected = run(sqlite, name, params)
+                for engine in engines:
+                    checks += 1
+                    try:
+                        problem = compare(expected, run(engine, name, params))
+                    except Exception as e:
+                        problem = f"error: {e}"
+                    if problem:
+                        failures += 1
+                        print(f"  ❌ {name}{params} ({label}) [duckdb-{engine.mode}]: {problem}")
+            if failures == before:
+                print(f"  ✅ {name} ({label}): {len(param_sets)} set parameter identik")
+
+    print("=" * 60)
+    if failures:
+        print(f"❌ {failures} dari {checks} perbandingan berbeda")
+        return 1
+    print(f"✅ Semua {checks} perbandingan identik")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
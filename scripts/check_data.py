@@ -3,207 +3,328 @@
 CHECK DATA TOOL
 Untuk diagnosis dan cek kondisi database
 Jalankan: python scripts/check_data.py
+Tambahkan --live untuk membaca langsung dari database utama (tanpa snapshot)
+Tambahkan --json untuk output yang bisa dibaca mesin (monitoring)
+
+Semua agregasi dijalankan di SQLite (COUNT/SUM/GROUP BY), sehingga pemakaian
+memori tetap konstan berapapun jumlah baris ledger.
 """
 
 import sqlite3
-import pandas as pd
+import json
 import os
+import sys
+import tempfile
 from datetime import datetime
 
-def check_database_health():
-    """Cek kesehatan database secara menyeluruh"""
-    print("🔍 DATABASE HEALTH CHECK")
-    print("=" * 60)
-    
-    db_path = 'data/database.db'
-    
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.snapshot import refresh_snapshot
+
+DB_PATH = 'data/database.db'
+
+# ==================== PENGUMPULAN DATA ====================
+
+def _grouped(cursor, query):
+    """Jalankan query GROUP BY dua kolom (kunci, jumlah) menjadi dict berurutan"""
+    return {str(key): count for key, count in cursor.execute(query)}
+
+def _table_exists(cursor, table_name):
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name=?", (table_name,))
+    return cursor.fetchone() is not None
+
+def collect_tables(cursor):
+    """Daftar tabel beserta jumlah baris dan strukturnya"""
+    tables = []
+    for (table_name,) in cursor.execute("SELECT name FROM sqlite_master WHERE type='table'").fetchall():
+        count = cursor.execute(f'SELECT COUNT(*) FROM "{table_name}"').fetchone()[0]
+        columns = [{'name': col[1], 'type': col[2]}
+                   for col in cursor.execute(f'PRAGMA table_info("{table_name}")').fetchall()]
+        tables.append({'name': table_name, 'rows': count, 'columns': columns})
+    return tables
+
+def collect_pembayaran(cursor):
+    """Distribusi, statistik keuangan, dan anomali tabel pembayaran"""
+    total, total_nilai, rata_rata, tertinggi, terendah = cursor.execute(
+        "SELECT COUNT(*), SUM(jumlah), AVG(jumlah), MAX(jumlah), MIN(jumlah) FROM pembayaran"
+    ).fetchone()
+    result = {'total': total}
+    if total == 0:
+        return result
+
+    result['per_tahun'] = _grouped(cursor, "SELECT tahun, COUNT(*) FROM pembayaran GROUP BY tahun ORDER BY tahun")
+    result['per_status'] = _grouped(cursor, "SELECT status, COUNT(*) FROM pembayaran GROUP BY status ORDER BY COUNT(*) DESC")
+    result['per_bulan'] = _grouped(cursor, "SELECT bulan, COUNT(*) FROM pembayaran GROUP BY bulan ORDER BY bulan")
+    result['keuangan'] = {
+        'total': total_nilai or 0,
+        'rata_rata': rata_rata or 0,
+        'tertinggi': tertinggi or 0,
+        'terendah': terendah or 0,
+    }
+
+    invalid_warga = cursor.execute("""
+        SELECT COUNT(*)
+        FROM pembayaran p
+        LEFT JOIN warga w ON p.warga_id = w.id
+        WHERE w.id IS NULL
+    """).fetchone()[0]
+    duplicate_bukti = cursor.execute("""
+        SELECT COUNT(*) FROM (
+            SELECT bukti_bayar
+            FROM pembayaran
+            WHERE bukti_bayar != ''
+            GROUP BY bukti_bayar
+            HAVING COUNT(*) > 1
+        )
+    """).fetchone()[0]
+    duplicate_periode = cursor.execute("""
+        SELECT COUNT(*) FROM (
+            SELECT warga_id
+            FROM pembayaran
+            GROUP BY warga_id, bulan, tahun
+            HAVING COUNT(*) > 1
+        )
+    """).fetchone()[0]
+    result['anomali'] = {
+        'warga_id_tidak_valid': invalid_warga,
+        'bukti_bayar_duplikat': duplicate_bukti,
+        'periode_duplikat': duplicate_periode,
+    }
+    return result
+
+def collect_warga(cursor):
+    """Status, anggota keluarga, dan warga tanpa pembayaran"""
+    total, total_anggota, rata_anggota = cursor.execute(
+        "SELECT COUNT(*), SUM(anggota_keluarga), AVG(anggota_keluarga) FROM warga"
+    ).fetchone()
+    result = {'total': total}
+    if total == 0:
+        return result
+
+    result['per_status'] = _grouped(cursor, "SELECT status, COUNT(*) FROM warga GROUP BY status ORDER BY COUNT(*) DESC")
+    result['total_anggota'] = total_anggota or 0
+    result['rata_rata_anggota'] = rata_anggota or 0
+    result['tanpa_pembayaran'] = cursor.execute("""
+        SELECT COUNT(*)
+        FROM warga w
+        WHERE NOT EXISTS (SELECT 1 FROM pembayaran p WHERE p.warga_id = w.id)
+    """).fetchone()[0]
+    return result
+
+def collect_health(db_path=DB_PATH, use_snapshot=True):
+    """Kumpulkan seluruh hasil health check ke dalam satu dict"""
+    health = {
+        'checked_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'database': db_path,
+        'status': 'ok',
+        'errors': [],
+    }
+
     # 1. Cek file database
     if not os.path.exists(db_path):
-        print("❌ Database file tidak ditemukan!")
-        print(f"📁 Expected: {os.path.abspath(db_path)}")
-        return
-    
-    file_size = os.path.getsize(db_path) / 1024  # KB
-    print(f"📁 Database file: {db_path}")
-    print(f"📏 Size: {file_size:.2f} KB")
-    print(f"📅 Modified: {datetime.fromtimestamp(os.path.getmtime(db_path))}")
-    
+        health['status'] = 'error'
+        health['errors'].append(f"Database file tidak ditemukan: {os.path.abspath(db_path)}")
+        return health
+
+    health['file'] = {
+        'size_kb': round(os.path.getsize(db_path) / 1024, 2),
+        'modified': datetime.fromtimestamp(os.path.getmtime(db_path)).strftime('%Y-%m-%d %H:%M:%S'),
+    }
+
     # 2. Koneksi dan cek integritas
+    read_path = None
+    try:
+        if use_snapshot:
+            # Analisis berjalan di salinan pribadi agar tidak menahan transaksi baca di database
+            # utama dan tidak mengganti snapshot laporan milik aplikasi di luar generasinya
+            fd, read_path = tempfile.mkstemp(prefix='check_data.', suffix='.db',
+                                             dir=os.path.dirname(db_path) or '.')
+            os.close(fd)
+            refresh_snapshot(db_path, read_path)
+            health['snapshot'] = 'salinan sementara (dihapus setelah cek)'
+            conn = sqlite3.connect(f"file:{os.path.abspath(read_path)}?mode=ro", uri=True)
+        else:
+            conn = sqlite3.connect(db_path)
+    except sqlite3.Error as e:
+        if read_path and os.path.exists(read_path):
+            os.remove(read_path)
+        health['status'] = 'error'
+        health['errors'].append(f"Database error: {e}")
+        return health
+
     try:
-        conn = sqlite3.connect(db_path)
         cursor = conn.cursor()
-        
-        print("\n✅ Database bisa diakses")
-        
-        # Cek integrity
-        cursor.execute("PRAGMA integrity_check")
-        integrity = cursor.fetchone()[0]
-        print(f"🔧 Integrity check: {integrity}")
-        
-        if integrity != "ok":
-            print("❌ DATABASE RUSAK! Perlu perbaikan.")
-        
+        health['integrity'] = cursor.execute("PRAGMA integrity_check").fetchone()[0]
+        if health['integrity'] != 'ok':
+            health['status'] = 'error'
+
         # 3. Cek semua tabel
-        print("\n📋 TABEL DATABASE:")
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-        tables = cursor.fetchall()
-        
-        for table in tables:
-            table_name = table[0]
-            cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
-            count = cursor.fetchone()[0]
-            
-            # Cek struktur
-            cursor.execute(f"PRAGMA table_info({table_name})")
-            columns = cursor.fetchall()
-            
-            print(f"\n  🏷️  {table_name} ({count} rows)")
-            for col in columns:
-                print(f"     - {col[1]} ({col[2]})")
-        
-        # 4. ANALISIS DATA PEMBAYARAN
-        print("\n" + "=" * 60)
-        print("📊 ANALISIS DATA PEMBAYARAN")
-        print("=" * 60)
-        
-        try:
-            df = pd.read_sql_query("SELECT * FROM pembayaran", conn)
-            
-            if df.empty:
-                print("📭 Tabel pembayaran kosong")
-            else:
-                print(f"📈 Total data: {len(df)}")
-                
-                # Per tahun
-                print("\n📅 Distribusi per tahun:")
-                year_counts = df['tahun'].value_counts().sort_index()
-                for year, count in year_counts.items():
-                    print(f"  - {year}: {count} data")
-                
-                # Per status
-                print("\n🏷️ Distribusi per status:")
-                status_counts = df['status'].value_counts()
-                for status, count in status_counts.items():
-                    print(f"  - {status}: {count} data")
-                
-                # Per bulan
-                print("\n📆 Distribusi per bulan:")
-                month_counts = df['bulan'].value_counts().sort_index()
-                for month, count in month_counts.items():
-                    month_name = datetime(2000, month, 1).strftime('%B')
-                    print(f"  - {month_name}: {count} data")
-                
-                # Statistik keuangan
-                print("\n💰 STATISTIK KEUANGAN:")
-                total_amount = df['jumlah'].sum()
-                avg_amount = df['jumlah'].mean()
-                print(f"  - Total nilai: Rp {total_amount:,}")
-                print(f"  - Rata-rata per transaksi: Rp {avg_amount:,.0f}")
-                print(f"  - Nilai tertinggi: Rp {df['jumlah'].max():,}")
-                print(f"  - Nilai terendah: Rp {df['jumlah'].min():,}")
-                
-                # Cek data anomali
-                print("\n⚠️  CEK ANOMALI:")
-                
-                # Warga_id tidak valid
-                cursor.execute("""
-                    SELECT COUNT(*) 
-                    FROM pembayaran p 
-                    LEFT JOIN warga w ON p.warga_id = w.id 
-                    WHERE w.id IS NULL
-                """)
-                invalid_warga = cursor.fetchone()[0]
-                if invalid_warga > 0:
-                    print(f"  ❌ {invalid_warga} data dengan warga_id tidak valid")
-                
-                # Duplikat bukti bayar
-                cursor.execute("""
-                    SELECT bukti_bayar, COUNT(*) as jumlah 
-                    FROM pembayaran 
-                    WHERE bukti_bayar != '' 
-                    GROUP BY bukti_bayar 
-                    HAVING COUNT(*) > 1
-                """)
-                duplicates = cursor.fetchall()
-                if duplicates:
-                    print(f"  ⚠️  {len(duplicates)} bukti bayar duplikat ditemukan")
-        
-        except Exception as e:
-            print(f"❌ Error analisis pembayaran: {e}")
-        
-        # 5. ANALISIS DATA WARGA
-        print("\n" + "=" * 60)
-        print("👥 ANALISIS DATA WARGA")
-        print("=" * 60)
-        
-        try:
-            df_warga = pd.read_sql_query("SELECT * FROM warga", conn)
-            
-            if df_warga.empty:
-                print("📭 Tabel warga kosong")
-            else:
-                print(f"👤 Total warga: {len(df_warga)}")
-                
-                # Per status
-                print("\n🏷️ Status warga:")
-                status_counts = df_warga['status'].value_counts()
-                for status, count in status_counts.items():
-                    print(f"  - {status}: {count} warga")
-                
-                # Jumlah anggota keluarga
-                total_anggota = df_warga['anggota_keluarga'].sum()
-                avg_anggota = df_warga['anggota_keluarga'].mean()
-                print(f"\n👨‍👩‍👧‍👦 Total anggota keluarga: {total_anggota}")
-                print(f"📊 Rata-rata anggota per keluarga: {avg_anggota:.1f}")
-                
-                # Warga tanpa pembayaran
-                cursor.execute("""
-                    SELECT COUNT(*) 
-                    FROM warga w 
-                    LEFT JOIN pembayaran p ON w.id = p.warga_id 
-                    WHERE p.id IS NULL
-                """)
-                warga_tanpa_bayar = cursor.fetchone()[0]
-                if warga_tanpa_bayar > 0:
-                    print(f"\n⚠️  {warga_tanpa_bayar} warga belum pernah bayar")
-        
-        except Exception as e:
-            print(f"❌ Error analisis warga: {e}")
-        
+        health['tables'] = collect_tables(cursor)
+
+        # 4-5. Analisis pembayaran dan warga
+        for key, table, collector in (('pembayaran', 'pembayaran', collect_pembayaran),
+                                      ('warga', 'warga', collect_warga)):
+            if not _table_exists(cursor, table):
+                health['errors'].append(f"Tabel {table} tidak ditemukan")
+                continue
+            try:
+                health[key] = collector(cursor)
+            except sqlite3.Error as e:
+                health['errors'].append(f"Error analisis {key}: {e}")
+    finally:
         conn.close()
-        print("\n✅ Health check selesai!")
-        
-    except sqlite3.Error as e:
-        print(f"❌ Database error: {e}")
-    except Exception as e:
-        print(f"❌ Unexpected error: {e}")
+        if read_path and os.path.exists(read_path):
+            os.remove(read_path)
+
+    anomali = health.get('pembayaran', {}).get('anomali', {})
+    if health['status'] == 'ok' and (health['errors'] or any(anomali.values())):
+        health['status'] = 'warning'
+    return health
+
+# ==================== OUTPUT ====================
+
+def print_report(health):
+    """Cetak hasil health check dalam format yang mudah dibaca"""
+    print("🔍 DATABASE HEALTH CHECK")
+    print("=" * 60)
+
+    if 'file' not in health:
+        for err in health['errors']:
+            print(f"❌ {err}")
+        return
+
+    print(f"📁 Database file: {health['database']}")
+    print(f"📏 Size: {health['file']['size_kb']:.2f} KB")
+    print(f"📅 Modified: {health['file']['modified']}")
+    if 'snapshot' in health:
+        print(f"📸 Snapshot analisis: {health['snapshot']}")
+
+    if 'integrity' not in health:
+        for err in health['errors']:
+            print(f"❌ {err}")
+        return
+
+    print("\n✅ Database bisa diakses")
+    print(f"🔧 Integrity check: {health['integrity']}")
+    if health['integrity'] != "ok":
+        print("❌ DATABASE RUSAK! Perlu perbaikan.")
+
+    print("\n📋 TABEL DATABASE:")
+    for table in health['tables']:
+        print(f"\n  🏷️  {table['name']} ({table['rows']} rows)")
+        for col in table['columns']:
+            print(f"     - {col['name']} ({col['type']})")
+
+    # Analisis pembayaran
+    print("\n" + "=" * 60)
+    print("📊 ANALISIS DATA PEMBAYARAN")
+    print("=" * 60)
+
+    pembayaran = health.get('pembayaran')
+    if pembayaran is None:
+        pass
+    elif pembayaran['total'] == 0:
+        print("📭 Tabel pembayaran kosong")
+    else:
+        print(f"📈 Total data: {pembayaran['total']}")
+
+        print("\n📅 Distribusi per tahun:")
+        for year, count in pembayaran['per_tahun'].items():
+            print(f"  - {year}: {count} data")
+
+        print("\n🏷️ Distribusi per status:")
+        for status, count in pembayaran['per_status'].items():
+            print(f"  - {status}: {count} data")
+
+        print("\n📆 Distribusi per bulan:")
+        for month, count in pembayaran['per_bulan'].items():
+            try:
+                month_name = datetime(2000, int(month), 1).strftime('%B')
+            except ValueError:
+                month_name = f"Bulan {month}"
+            print(f"  - {month_name}: {count} data")
+
+        keuangan = pembayaran['keuangan']
+        print("\n💰 STATISTIK KEUANGAN:")
+        print(f"  - Total nilai: Rp {keuangan['total']:,}")
+        print(f"  - Rata-rata per transaksi: Rp {keuangan['rata_rata']:,.0f}")
+        print(f"  - Nilai tertinggi: Rp {keuangan['tertinggi']:,}")
+        print(f"  - Nilai terendah: Rp {keuangan['terendah']:,}")
+
+        anomali = pembayaran['anomali']
+        print("\n⚠️  CEK ANOMALI:")
+        if anomali['warga_id_tidak_valid'] > 0:
+            print(f"  ❌ {anomali['warga_id_tidak_valid']} data dengan warga_id tidak valid")
+        if anomali['bukti_bayar_duplikat'] > 0:
+            print(f"  ⚠️  {anomali['bukti_bayar_duplikat']} bukti bayar duplikat ditemukan")
+        if anomali['periode_duplikat'] > 0:
+            print(f"  ⚠️  {anomali['periode_duplikat']} periode warga tercatat lebih dari sekali")
+
+    # Analisis warga
+    print("\n" + "=" * 60)
+    print("👥 ANALISIS DATA WARGA")
+    print("=" * 60)
+
+    warga = health.get('warga')
+    if warga is None:
+        pass
+    elif warga['total'] == 0:
+        print("📭 Tabel warga kosong")
+    else:
+        print(f"👤 Total warga: {warga['total']}")
+
+        print("\n🏷️ Status warga:")
+        for status, count in warga['per_status'].items():
+            print(f"  - {status}: {count} warga")
+
+        print(f"\n👨‍👩‍👧‍👦 Total anggota keluarga: {warga['total_anggota']}")
+        print(f"📊 Rata-rata anggota per keluarga: {warga['rata_rata_anggota']:.1f}")
+
+        if warga['tanpa_pembayaran'] > 0:
+            print(f"\n⚠️  {warga['tanpa_pembayaran']} warga belum pernah bayar")
+
+    for err in health['errors']:
+        print(f"❌ {err}")
+    print("\n✅ Health check selesai!")
+
+def check_database_health(use_snapshot=True, as_json=False):
+    """Cek kesehatan database secara menyeluruh"""
+    health = collect_health(DB_PATH, use_snapshot)
+    if as_json:
+        print(json.dumps(health, ensure_ascii=False, indent=2))
+    else:
+        print_report(health)
+    return health
 
-def export_report():
+def export_report(use_snapshot=True, as_json=False):
     """Export report ke file"""
     print("\n📤 GENERATING REPORT...")
-    
+
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    report_file = f"data/database_report_{timestamp}.txt"
-    
+    report_file = f"data/database_report_{timestamp}.{'json' if as_json else 'txt'}"
+
     try:
         # Redirect output ke file
-        import sys
         original_stdout = sys.stdout
-        
+
         with open(report_file, 'w', encoding='utf-8') as f:
             sys.stdout = f
-            check_database_health()
-            sys.stdout = original_stdout
-        
+            try:
+                check_database_health(use_snapshot, as_json)
+            finally:
+                sys.stdout = original_stdout
+
         print(f"✅ Report disimpan ke: {report_file}")
-        
+
     except Exception as e:
         print(f"❌ Gagal export report: {e}")
 
 if __name__ == "__main__":
-    import sys
-    
+    use_snapshot = "--live" not in sys.argv
+    as_json = "--json" in sys.argv
+
     if len(sys.argv) > 1 and sys.argv[1] == "export":
-        export_report()
+        export_report(use_snapshot, as_json)
     else:
-        check_database_health()
\ No newline at end of file
+        health = check_database_health(use_snapshot, as_json)
+        # Kode keluar untuk monitoring: 0 = ok, 1 = warning, 2 = error
+        sys.exit({'ok': 0, 'warning': 1}.get(health['status'], 2))
@@ -141,6 +141,9 @@ def reset_database():
         print("   - Data Pengeluaran: 0 (Kosong)")
         print("   - User Tersedia   : 1 (Admin)")
         
+        print("\n♻️  Jika server Streamlit sedang berjalan, restart server atau klik")
+        print("   'Inisialisasi Ulang Skema' di menu Pengaturan agar skema dilengkapi.")
+        
         print("\n🔑 LOGIN ADMIN:")
         print("   Username: admin")
         print("   Password: admin123")
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+BILLING RUN TAGIHAN
+Membuat tagihan (tabel tagihan) untuk semua warga aktif per periode, lalu
+mengalokasikan pembayaran terverifikasi yang sudah ada ke tagihan tersebut.
+Aman dijalankan ulang: tagihan yang sudah ada tidak diubah.
+
+Jalankan dari root project:
+  python scripts/run_billing.py                   # periode bulan berjalan
+  python scripts/run_billing.py 2026-10           # satu periode
+  python scripts/run_billing.py 2024-01 2026-10   # rentang periode (backfill)
+"""
+
+import os
+import sqlite3
+import sys
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from streamlit.logger import set_log_level
+
+set_log_level("error")
+
+from utils.billing import billing_run, period_label
+from utils.closing import PeriodClosedError
+from utils.database import init_db
+from utils.tarif import TarifSchedule, load_tarif_rows
+
+DB_PATH = 'data/database.db'
+
+def parse_period(text):
+    """'YYYY-MM' -> (tahun, bulan)"""
+    try:
+        period = datetime.strptime(text, '%Y-%m')
+    except ValueError:
+        raise SystemExit(f"❌ Periode tidak valid: {text} (format YYYY-MM)")
+    return period.year, period.month
+
+def periods(start, end):
+    tahun, bulan = start
+    while (tahun, bulan) <= end:
+        yield tahun, bulan
+        tahun, bulan = (tahun + 1, 1) if bulan == 12 else (tahun, bulan + 1)
+
+def main():
+    now = datetime.now()
+    start = parse_period(sys.argv[1]) if len(sys.argv) > 1 else (now.year, now.month)
+    end = parse_period(sys.argv[2]) if len(sys.argv) > 2 else start
+    if end < start:
+        print("❌ Periode akhir lebih awal dari periode awal")
+        return 1
+
+    init_db()
+    conn = sqlite3.connect(DB_PATH)
+    conn.execute("PRAGMA foreign_keys = ON")
+    try:
+        schedule = TarifSchedule(load_tarif_rows(conn))
+        print("🧾 BILLING RUN TAGIHAN")
+        print("=" * 60)
+        total_created = total_allocated = 0
+        for tahun, bulan in periods(start, end):
+            try:
+                created, allocated = billing_run(conn, tahun, bulan, schedule)
+            except PeriodClosedError:
+                print(f"  {period_label(tahun, bulan)}: ⏭️  sudah ditutup buku, dilewati")
+                continue
+            conn.commit()
+            total_created += created
+            total_allocated += allocated
+            print(f"  {period_label(tahun, bulan)}: {created:5d} tagihan baru, Rp {allocated:,} dialokasikan")
+        print("=" * 60)
+        print(f"✅ {total_created} tagihan dibuat, Rp {total_allocated:,} pembayaran dialokasikan")
+    finally:
+        conn.close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
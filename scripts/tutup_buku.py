@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+TUTUP BUKU PERIODE
+Menutup buku satu periode (ringkasan dibekukan, periode dikunci dari penulisan) atau
+memeriksa apakah data live periode-periode tertutup masih cocok dengan ringkasan bekunya.
+Perubahan langsung ke database (di luar aplikasi) tidak tertahan kunci, pemeriksaan ini
+yang mendeteksinya.
+
+Jalankan dari root project:
+  python scripts/tutup_buku.py                    # periksa semua periode tertutup
+  python scripts/tutup_buku.py 2026-09            # tutup buku satu periode
+  python scripts/tutup_buku.py 2026-09 --paksa    # tutup walau masih ada pembayaran pending
+"""
+
+import os
+import sqlite3
+import sys
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from streamlit.logger import set_log_level
+
+set_log_level("error")
+
+from utils.billing import period_label
+from utils.closing import close_period, closed_periods, verify_period
+from utils.database import init_db
+
+DB_PATH = 'data/database.db'
+
+def parse_period(text):
+    """'YYYY-MM' -> (tahun, bulan)"""
+    try:
+        period = datetime.strptime(text, '%Y-%m')
+    except ValueError:
+        raise SystemExit(f"❌ Periode tidak valid: {text} (format YYYY-MM)")
+    return period.year, period.month
+
+def close(conn, tahun, bulan, force):
+    try:
+        summary = close_period(conn, tahun, bulan, closed_by='script', force=force)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+    conn.commit()
+    print(f"🔒 Periode {period_label(tahun, bulan)} ditutup")
+    print(f"  pemasukan terverifikasi : Rp {summary['pemasukan']:,}")
+    print(f"  pengeluaran             : Rp {summary['pengeluaran']:,}")
+    print(f"  pembayar                : {summary['jumlah_pembayar']} (hash {summary['hash_pembayar'][:12]})")
+    return 0
+
+def check(conn):
+    periods = closed_periods(conn)
+    print(f"🔍 PEMERIKSAAN TUTUP BUKU ({len(periods)} periode)")
+    print("=" * 60)
+    broken = 0
+    for row in periods.itertuples():
+        differences = verify_period(conn, row.tahun, row.bulan)
+        if differences:
+            broken += 1
+            print(f"  ❌ {period_label(row.tahun, row.bulan)}: berbeda pada {', '.join(differences)}")
+        else:
+            print(f"  ✅ {period_label(row.tahun, row.bulan)}")
+    print("=" * 60)
+    if broken:
+        print(f"⚠️  {broken} periode tertutup berubah setelah ditutup")
+        return 1
+    print("✅ Semua periode tertutup utuh")
+    return 0
+
+def main():
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    init_db()
+    conn = sqlite3.connect(DB_PATH)
+    conn.execute("PRAGMA foreign_keys = ON")
+    try:
+        if args:
+            tahun, bulan = parse_period(args[0])
+            return close(conn, tahun, bulan, force='--paksa' in sys.argv)
+        return check(conn)
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+
+# ==================== KELOMPOK UMUR ====================
+# Umur tunggakan = hari sejak jatuh tempo; jatuh tempo periode = tanggal ke-batas_waktu
+# di bulan periode itu (dihitung sebagai hari, sehingga batas_waktu 31 di Februari jatuh di Maret)
+
+DEFAULT_BATAS_WAKTU = 15
+
+# Batas atas (inklusif) hari terlambat per kelompok; sisanya masuk kelompok terakhir
+AGING_EDGES = np.array([0, 30, 60, 90])
+AGING_LABELS = ('Belum jatuh tempo', '1-30 hari', '31-60 hari', '61-90 hari', '> 90 hari')
+
+AGING_COLUMNS = ['no_rumah', 'nama_kepala_keluarga', 'bulan_tunggak', *AGING_LABELS, 'total', 'hari_terlama']
+
+def due_dates(tahun, bulan, batas_waktu=DEFAULT_BATAS_WAKTU):
+    """Tanggal jatuh tempo per periode (tahun, bulan) sebagai datetime64[D]"""
+    tahun = np.asarray(tahun, dtype=np.int64)
+    bulan = np.asarray(bulan, dtype=np.int64)
+    month_start = ((tahun - 1970) * 12 + bulan - 1).astype('datetime64[M]').astype('datetime64[D]')
+    return month_start + np.timedelta64(max(int(batas_waktu), 1) - 1, 'D')
+
+def aging_bucket(days):
+    """Indeks kelompok AGING_LABELS untuk setiap nilai hari terlambat"""
+    return np.searchsorted(AGING_EDGES, days, side='left')
+
+# ==================== MESIN UMUR TUNGGAKAN ====================
+
+def arrears_aging(invoices, batas_waktu=DEFAULT_BATAS_WAKTU, today=None):
+    """Umur tunggakan per warga dari tagihan terbuka (utils.billing.open_invoices).
+
+    Setiap tagihan terbuka menyumbang sisanya (jumlah - terbayar) ke kelompok umur menurut
+    jatuh tempo periode tagihannya. Bulan yang sudah dibayar di muka sudah lunas lewat
+    alokasi dan bulan yang belum ditagih tidak punya tagihan, jadi keduanya tidak ikut.
+
+    Mengembalikan DataFrame per warga: no_rumah, nama_kepala_keluarga, bulan_tunggak, satu
+    kolom nominal per AGING_LABELS, total dan hari_terlama (hanya warga yang menunggak).
+    """
+    open_rows = invoices[invoices['sisa'] > 0]
+    if open_rows.empty:
+        return pd.DataFrame(columns=AGING_COLUMNS)
+
+    now = pd.Timestamp(today) if today is not None else pd.Timestamp.now()
+    days = (np.datetime64(now.date(), 'D')
+            - due_dates(open_rows['tahun'], open_rows['bulan'], batas_waktu)).astype(np.int64)
+    labels = np.asarray(AGING_LABELS, dtype=object)[aging_bucket(days)]
+
+    keys = ['warga_id', 'no_rumah', 'nama_kepala_keluarga']
+    nominal = (open_rows.assign(kelompok=labels)
+               .pivot_table(index=keys, columns='kelompok', values='sisa', aggfunc='sum', fill_value=0)
+               .reindex(columns=list(AGING_LABELS), fill_value=0))
+    nominal.columns.name = None
+    summary = (open_rows.assign(hari=days)
+               .groupby(keys).agg(bulan_tunggak=('sisa', 'size'), hari_terlama=('hari', 'max')))
+
+    result = nominal.join(summary)
+    result['total'] = result[list(AGING_LABELS)].sum(axis=1)
+    result['hari_terlama'] = result['hari_terlama'].clip(lower=0)
+    return (result.reset_index()[AGING_COLUMNS]
+            .sort_values(['hari_terlama', 'total'], ascending=False)
+            .reset_index(drop=True))
+
+def aging_totals(aging):
+    """Total nominal dan jumlah warga per kelompok umur"""
+    return pd.DataFrame({
+        'kelompok': list(AGING_LABELS),
+        'nominal': [int(aging[label].sum()) for label in AGING_LABELS],
+        'warga': [int((aging[label] > 0).sum()) for label in AGING_LABELS],
+    })
@@ -0,0 +1,203 @@
+import os
+import threading
+
+import pandas as pd
+
+# ==================== KONFIGURASI ENGINE ====================
+# 'auto' memakai DuckDB bila terpasang (pip install duckdb), selain itu SQLite;
+# 'duckdb' / 'sqlite' memaksa engine tertentu (DuckDB tetap jatuh ke SQLite bila gagal)
+ANALYTICS_ENGINE = os.environ.get('GK_ANALYTICS_ENGINE', 'auto')
+# 'copy': tabel laporan disalin ke tabel kolumnar DuckDB setiap file sumber berubah
+# 'scan': setiap query membaca file SQLite langsung lewat sqlite scanner
+DUCKDB_MODE = os.environ.get('GK_DUCKDB_MODE', 'copy')
+
+# Tabel dan kolom yang dibaca query laporan. Hanya kolom ini yang diproyeksikan karena
+# scanner DuckDB memeriksa tipe per kolom, sedangkan SQLite mengizinkan nilai teks di
+# kolom INTEGER (misal pengeluaran.disetujui_oleh berisi nama)
+REPORT_TABLES = {
+    'warga': ('id', 'no_rumah', 'nama_kepala_keluarga', 'status'),
+    'pembayaran': ('id', 'warga_id', 'bulan', 'tahun', 'jumlah', 'status'),
+    'pengeluaran': ('id', 'kategori', 'jumlah', 'tanggal'),
+    'tutup_buku': ('tahun', 'bulan'),
+    'tutup_buku_rincian': ('tahun', 'bulan', 'jenis', 'status', 'kategori', 'jumlah', 'transaksi'),
+}
+
+# ==================== QUERY LAPORAN ====================
+# SQL ditulis dalam subset yang sama-sama valid di SQLite dan DuckDB: parameter '?',
+# SUM di-CAST ke BIGINT (DuckDB mengembalikan HUGEINT), dan tahun/bulan dari kolom
+# tanggal diambil lewat teks agar tidak bergantung pada fungsi tanggal masing-masing engine.
+
+def _year(column):
+    return f"CAST(substr(CAST({column} AS VARCHAR), 1, 4) AS INTEGER)"
+
+def _month(column):
+    return f"CAST(substr(CAST({column} AS VARCHAR), 6, 2) AS INTEGER)"
+
+def _open_period(tahun, bulan):
+    """Predikat periode belum ditutup buku; periode tertutup dibaca dari snapshot (utils.closing)"""
+    return f"NOT EXISTS (SELECT 1 FROM tutup_buku t WHERE t.tahun = {tahun} AND t.bulan = {bulan})"
+
+# Laporan yang punya padanan di utils.closing.SNAPSHOT_REPORTS hanya membaca periode terbuka
+REPORTS = {
+    # Laporan Bulanan: total, transaksi, verified dan pending per bulan dalam satu tahun
+    'pembayaran_bulanan': f"""
+        SELECT
+            bulan,
+            CAST(SUM(jumlah) AS BIGINT) AS total_pembayaran,
+            COUNT(id) AS jumlah_transaksi,
+            CAST(SUM(CASE WHEN status='verified' THEN jumlah ELSE 0 END) AS BIGINT) AS verified_payment,
+            CAST(SUM(CASE WHEN status='pending' THEN jumlah ELSE 0 END) AS BIGINT) AS pending_payment
+        FROM pembayaran
+        WHERE tahun = ? AND {_open_period('pembayaran.tahun', 'pembayaran.bulan')}
+        GROUP BY bulan ORDER BY bulan
+    """,
+    # Laporan Tahunan: pendapatan terverifikasi per tahun
+    'pendapatan_tahunan': f"""
+        SELECT tahun, CAST(SUM(jumlah) AS BIGINT) AS total, COUNT(id) AS transaksi
+        FROM pembayaran WHERE status='verified' AND {_open_period('pembayaran.tahun', 'pembayaran.bulan')}
+        GROUP BY tahun ORDER BY tahun DESC
+    """,
+    # Analisis Pengeluaran: total per kategori dalam satu tahun
+    'pengeluaran_kategori': f"""
+        SELECT kategori, CAST(SUM(jumlah) AS BIGINT) AS jumlah
+        FROM pengeluaran WHERE {_year('tanggal')} = ? AND {_open_period(_year('tanggal'), _month('tanggal'))}
+        GROUP BY kategori ORDER BY kategori
+    """,
+    # Analisis Pengeluaran: tren per bulan dalam satu tahun
+    'pengeluaran_bulanan': f"""
+        SELECT {_month('tanggal')} AS bulan, CAST(SUM(jumlah) AS BIGINT) AS jumlah
+        FROM pengeluaran WHERE {_year('tanggal')} = ? AND {_open_period(_year('tanggal'), _month('tanggal'))}
+        GROUP BY 1 ORDER BY 1
+    """,
+    # Tunggakan per warga aktif dalam satu tahun (dipakai parity/benchmark; halaman memakai kubus)
+    'tunggakan_tahunan': """
+        SELECT w.no_rumah, w.nama_kepala_keluarga,
+               COUNT(DISTINCT CASE WHEN p.status='verified' THEN p.bulan END) AS lunas
+        FROM warga w
+        LEFT JOIN pembayaran p ON p.warga_id = w.id AND p.tahun = ?
+        WHERE w.status='aktif'
+        GROUP BY w.id, w.no_rumah, w.nama_kepala_keluarga
+        ORDER BY w.no_rumah
+    """,
+}
+
+# ==================== ENGINE ====================
+
+class SQLiteEngine:
+    """Engine bawaan: query laporan langsung ke SQLite lewat pandas"""
+
+    name = 'sqlite'
+
+    def __init__(self, connect):
+        self._connect = connect
+
+    def query(self, sql, params=()):
+        return self.query_all([(sql, params)])[0]
+
+    def query_all(self, queries):
+        """Beberapa (sql, params) dalam satu transaksi baca pada satu koneksi (satu keadaan data)"""
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN")
+            return [pd.read_sql_query(sql, conn, params=list(params)) for sql, params in queries]
+        finally:
+            conn.rollback()
+            conn.close()
+
+def load_duckdb():
+    """Modul duckdb, atau None jika tidak terpasang (dependensi opsional)"""
+    try:
+        import duckdb
+    except ImportError:
+        return None
+    return duckdb
+
+def _load_sqlite_extension(con):
+    """Muat ekstensi sqlite: dari cache lokal, dari paket pip duckdb-extension-sqlite-scanner, lalu unduhan"""
+    try:
+        con.execute("LOAD sqlite")
+        return
+    except Exception:
+        pass
+    try:
+        import duckdb_extensions
+        duckdb_extensions.import_extension('sqlite_scanner')
+    except Exception:
+        con.execute("INSTALL sqlite")
+    con.execute("LOAD sqlite")
+
+class DuckDBEngine:
+    """Engine DuckDB di atas file SQLite (read-only).
+
+    Mode 'scan' membuat view ke tabel SQLite yang di-ATTACH; mode 'copy' menyalin
+    tabel laporan ke tabel kolumnar DuckDB. Keduanya disinkronkan ulang saat mtime
+    file sumber berubah (misal snapshot laporan diperbarui).
+    """
+
+    name = 'duckdb'
+
+    def __init__(self, source, mode=DUCKDB_MODE, tables=REPORT_TABLES, duckdb=None):
+        duckdb = duckdb or load_duckdb()
+        if duckdb is None:
+            raise ImportError("duckdb tidak terpasang")
+        self._source = source if callable(source) else (lambda: source)
+        self.mode = mode
+        self.tables = dict(tables)
+        self._con = duckdb.connect()
+        _load_sqlite_extension(self._con)
+        self._synced = None
+        self._lock = threading.Lock()
+
+    def _sync(self):
+        path = os.path.abspath(self._source())
+        stamp = (path, os.path.getmtime(path))
+        if stamp == self._synced:
+            return
+        con = self._con
+        con.execute("DETACH DATABASE IF EXISTS src")
+        con.execute(f"ATTACH '{path}' AS src (TYPE sqlite, READ_ONLY)")
+        kind = 'TABLE' if self.mode == 'copy' else 'VIEW'
+        try:
+            for table, columns in self.tables.items():
+                con.execute(f"CREATE OR REPLACE {kind} main.{table} AS SELECT {', '.join(columns)} FROM src.{table}")
+        finally:
+            if self.mode == 'copy':
+                con.execute("DETACH DATABASE IF EXISTS src")
+        self._synced = stamp
+
+    def query(self, sql, params=()):
+        """Satu query; lock ditahan sampai hasil diambil agar sync lain tidak mengganti tabel di tengahnya"""
+        return self.query_all([(sql, params)])[0]
+
+    def query_all(self, queries):
+        """Beberapa (sql, params) pada satu sinkronisasi sumber; lock ditahan agar tidak ada sync di antaranya"""
+        with self._lock:
+            self._sync()
+            cursor = self._con.cursor()
+            try:
+                return [cursor.execute(sql, list(params)).df() for sql, params in queries]
+            finally:
+                cursor.close()
+
+def create_engine(source, connect, engine=ANALYTICS_ENGINE, mode=DUCKDB_MODE):
+    """Engine laporan sesuai konfigurasi; DuckDB jatuh ke SQLite bila tidak terpasang atau gagal dimuat"""
+    if engine != 'sqlite' and load_duckdb() is not None:
+        try:
+            return DuckDBEngine(source, mode=mode)
+        except Exception as e:
+            print(f"DuckDB tidak dapat dipakai, memakai SQLite: {e}")
+    return SQLiteEngine(connect)
+
+def run_queries(engine, queries, fallback=None, label='laporan'):
+    """Jalankan beberapa (sql, params) dalam satu pembacaan engine; jika engine gagal, ulangi dengan fallback"""
+    try:
+        return engine.query_all(queries)
+    except Exception as e:
+        if fallback is None or fallback.name == engine.name:
+            raise
+        print(f"Query {label} gagal di {engine.name}, memakai {fallback.name}: {e}")
+        return fallback.query_all(queries)
+
+def run_report(engine, name, params=(), fallback=None):
+    """Jalankan query laporan REPORTS[name]; jika engine gagal, ulangi dengan engine fallback"""
+    return run_queries(engine, [(REPORTS[name], params)], fallback, label=f"laporan '{name}'")[0]
@@ -0,0 +1,188 @@
+import pandas as pd
+
+from utils.closing import ensure_open
+
+# ==================== KONSTANTA ====================
+
+# Status tagihan; hanya tagihan 'terbuka' yang masuk index parsial idx_tagihan_terbuka
+TERBUKA, LUNAS = 'terbuka', 'lunas'
+
+# Periode sebagai nomor bulan absolut, sama dengan utils.tarif.month_key
+PERIODE_SQL = "(tahun * 12 + bulan - 1)"
+
+def period_label(tahun, bulan):
+    """Label periode 'YYYY-MM' (pembanding teks untuk tanggal_masuk)"""
+    return f"{int(tahun):04d}-{int(bulan):02d}"
+
+# ==================== BILLING RUN ====================
+
+def billing_run(conn, tahun, bulan, schedule):
+    """Buat tagihan satu periode untuk semua warga aktif dengan satu INSERT ... SELECT.
+
+    Tarif per tipe rumah diselesaikan sekali lewat schedule.resolve lalu di-join sebagai
+    VALUES; warga yang tanggal_masuk-nya setelah periode tidak ditagih, dan tagihan yang
+    sudah ada tidak diubah (aman dijalankan ulang). Kredit pembayaran terverifikasi yang
+    belum teralokasi (termasuk bayar di muka) langsung dialokasikan ke tagihan baru.
+    Periode yang sudah ditutup buku ditolak (PeriodClosedError) sebelum ada yang ditulis.
+    Tidak melakukan commit. Mengembalikan (jumlah tagihan baru, nominal teralokasi).
+    """
+    ensure_open(conn, tahun, bulan)
+    tipe = [row[0] for row in conn.execute(
+        "SELECT DISTINCT COALESCE(tipe_rumah, '') FROM warga WHERE status='aktif'")]
+    if not tipe:
+        return 0, 0
+    amounts = schedule.resolve(tahun, bulan, tipe).tolist()
+    values = ", ".join(["(?, ?)"] * len(tipe))
+    # rowcount modul sqlite3 bernilai -1 untuk statement yang diawali WITH
+    before = conn.total_changes
+    conn.execute(f'''
+        WITH tarif_periode(tipe_rumah, jumlah) AS (VALUES {values})
+        INSERT INTO tagihan (warga_id, tahun, bulan, jumlah)
+        SELECT w.id, ?, ?, t.jumlah
+        FROM warga w
+        JOIN tarif_periode t ON t.tipe_rumah = COALESCE(w.tipe_rumah, '')
+        WHERE w.status='aktif' AND COALESCE(substr(w.tanggal_masuk, 1, 7), '') <= ?
+        ON CONFLICT(warga_id, tahun, bulan) DO NOTHING
+    ''', (*[item for pair in zip(tipe, amounts) for item in pair], int(tahun), int(bulan), period_label(tahun, bulan)))
+    created = conn.total_changes - before
+    allocated = allocate(conn, warga_sql=(
+        f"SELECT warga_id FROM tagihan WHERE status='{TERBUKA}' AND tahun=? AND bulan=?", (int(tahun), int(bulan))))
+    return created, allocated
+
+# ==================== ALOKASI PEMBAYARAN ====================
+
+def allocate(conn, pembayaran_ids=None, warga_sql=None):
+    """Alokasikan sisa pembayaran terverifikasi ke tagihan terbuka warga yang sama.
+
+    Per pembayaran: tagihan periode pembayaran itu dulu, lalu periode sesudahnya secara
+    berurutan (bayar di muka beberapa bulan). Sisa yang belum ada tagihannya tetap menjadi
+    kredit dan dialokasikan oleh billing run berikutnya. pembayaran_ids / warga_sql
+    (subquery warga_id beserta parameternya) membatasi pembayaran yang diproses.
+    Tidak melakukan commit. Mengembalikan total nominal yang dialokasikan.
+    """
+    where, params = ["p.status='verified'"], []
+    if pembayaran_ids is not None:
+        pembayaran_ids = [int(pid) for pid in pembayaran_ids]
+        if not pembayaran_ids:
+            return 0
+        where.append(f"p.id IN ({', '.join('?' * len(pembayaran_ids))})")
+        params += pembayaran_ids
+    if warga_sql is not None:
+        where.append(f"p.warga_id IN ({warga_sql[0]})")
+        params += list(warga_sql[1])
+    credits = conn.execute(f'''
+        SELECT p.id, p.warga_id, p.tahun * 12 + p.bulan - 1,
+               p.jumlah - COALESCE((SELECT SUM(a.jumlah) FROM alokasi_pembayaran a WHERE a.pembayaran_id = p.id), 0)
+        FROM pembayaran p
+        WHERE {' AND '.join(where)}
+        ORDER BY p.warga_id, p.tahun, p.bulan, p.id
+    ''', params).fetchall()
+
+    total = 0
+    for pembayaran_id, warga_id, periode, sisa in credits:
+        if not sisa or sisa <= 0:
+            continue
+        invoices = conn.execute(f'''
+            SELECT id, jumlah - terbayar FROM tagihan
+            WHERE status='{TERBUKA}' AND warga_id=? AND {PERIODE_SQL} >= ?
+            ORDER BY tahun, bulan
+        ''', (warga_id, periode)).fetchall()
+        for tagihan_id, kurang in invoices:
+            porsi = min(sisa, kurang)
+            if porsi <= 0:
+                continue
+            conn.execute("INSERT INTO alokasi_pembayaran (pembayaran_id, tagihan_id, jumlah) VALUES (?, ?, ?)",
+                         (pembayaran_id, tagihan_id, porsi))
+            conn.execute(f'''
+                UPDATE tagihan SET terbayar = terbayar + ?,
+                    status = CASE WHEN terbayar + ? >= jumlah THEN '{LUNAS}' ELSE '{TERBUKA}' END
+                WHERE id = ?
+            ''', (porsi, porsi, tagihan_id))
+            sisa -= porsi
+            total += porsi
+            if sisa <= 0:
+                break
+    return total
+
+def release(conn, pembayaran_id):
+    """Batalkan alokasi satu pembayaran (status berubah dari verified) lalu hitung ulang tagihannya"""
+    tagihan_ids = [row[0] for row in conn.execute(
+        "SELECT DISTINCT tagihan_id FROM alokasi_pembayaran WHERE pembayaran_id = ?", (int(pembayaran_id),))]
+    if tagihan_ids:
+        conn.execute("DELETE FROM alokasi_pembayaran WHERE pembayaran_id = ?", (int(pembayaran_id),))
+        refresh_invoices(conn, tagihan_ids)
+    return len(tagihan_ids)
+
+def refresh_invoices(conn, tagihan_ids=None):
+    """Hitung ulang terbayar dan status tagihan dari tabel alokasi (None = semua tagihan)"""
+    where, params = "", ()
+    if tagihan_ids is not None:
+        tagihan_ids = [int(tid) for tid in tagihan_ids]
+        where, params = f"WHERE id IN ({', '.join('?' * len(tagihan_ids))})", tagihan_ids
+    conn.execute(f'''
+        UPDATE tagihan SET terbayar = COALESCE(
+            (SELECT SUM(a.jumlah) FROM alokasi_pembayaran a WHERE a.tagihan_id = tagihan.id), 0)
+        {where}
+    ''', params)
+    conn.execute(f'''
+        UPDATE tagihan SET status = CASE WHEN terbayar >= jumlah THEN '{LUNAS}' ELSE '{TERBUKA}' END
+        {where}
+    ''', params)
+
+# ==================== QUERY TAGIHAN ====================
+# Semua query tagihan terbuka memakai status='terbuka' literal agar index parsial terpakai
+
+def open_invoices(conn, warga_id=None):
+    """Tagihan terbuka (semua periode) beserta sisa per tagihan; warga_id membatasi satu warga"""
+    where, params = "", []
+    if warga_id is not None:
+        where, params = "AND t.warga_id = ?", [int(warga_id)]
+    return pd.read_sql_query(f'''
+        SELECT t.id, t.warga_id, w.no_rumah, w.nama_kepala_keluarga, t.tahun, t.bulan,
+               t.jumlah, t.terbayar, t.jumlah - t.terbayar AS sisa
+        FROM tagihan t JOIN warga w ON w.id = t.warga_id
+        WHERE t.status='{TERBUKA}' {where}
+        ORDER BY w.no_rumah, t.tahun, t.bulan
+    ''', conn, params=params)
+
+def arrears_summary(conn):
+    """Ringkasan tunggakan per warga dari tagihan terbuka (untuk daftar tunggakan dan pengingat)"""
+    return pd.read_sql_query(f'''
+        SELECT t.warga_id, w.no_rumah, w.nama_kepala_keluarga, w.telepon,
+               COUNT(*) AS bulan_terbuka, SUM(t.jumlah - t.terbayar) AS sisa,
+               MIN(printf('%04d-%02d', t.tahun, t.bulan)) AS periode_tertua
+        FROM tagihan t JOIN warga w ON w.id = t.warga_id
+        WHERE t.status='{TERBUKA}'
+        GROUP BY t.warga_id
+        ORDER BY sisa DESC, w.no_rumah
+    ''', conn)
+
+def year_arrears(conn, tahun):
+    """Tagihan satu tahun per warga: bulan ditagih, lunas, tunggak dan sisa nominal.
+
+    Hanya periode yang sudah ditagih (billing run) yang dihitung, sehingga bulan yang belum
+    datang dan bulan sebelum tanggal_masuk warga tidak ikut menjadi tunggakan.
+    """
+    return pd.read_sql_query(f'''
+        SELECT t.warga_id, w.no_rumah, w.nama_kepala_keluarga,
+               COUNT(*) AS bulan_ditagih,
+               SUM(CASE WHEN t.status='{LUNAS}' THEN 1 ELSE 0 END) AS lunas,
+               SUM(CASE WHEN t.status='{TERBUKA}' THEN 1 ELSE 0 END) AS tunggak,
+               SUM(CASE WHEN t.status='{TERBUKA}' THEN t.jumlah - t.terbayar ELSE 0 END) AS nominal_tunggakan
+        FROM tagihan t JOIN warga w ON w.id = t.warga_id
+        WHERE t.tahun = ?
+        GROUP BY t.warga_id
+        ORDER BY tunggak DESC, nominal_tunggakan DESC, w.no_rumah
+    ''', conn, params=[int(tahun)])
+
+def statement(conn, warga_id):
+    """Rekening koran satu warga: semua tagihan beserta pembayaran yang dialokasikan"""
+    return pd.read_sql_query('''
+        SELECT t.tahun, t.bulan, t.jumlah AS tagihan, t.terbayar, t.jumlah - t.terbayar AS sisa, t.status,
+               GROUP_CONCAT(a.pembayaran_id) AS pembayaran
+        FROM tagihan t
+        LEFT JOIN alokasi_pembayaran a ON a.tagihan_id = t.id
+        WHERE t.warga_id = ?
+        GROUP BY t.id
+        ORDER BY t.tahun DESC, t.bulan DESC
+    ''', conn, params=[int(warga_id)])
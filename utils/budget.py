@@ -0,0 +1,119 @@
+import numpy as np
+import pandas as pd
+
+from utils.ledger import TANGGAL_PENGELUARAN, date_key
+
+# ==================== REKAP PENGELUARAN ====================
+# rekap_pengeluaran menyimpan total pengeluaran per kategori per bulan (tanggal kas yang sama
+# dengan utils.ledger). Diperbarui per transaksi oleh add/delete_pengeluaran sehingga tampilan
+# anggaran hanya membaca baris rekap, bukan tabel pengeluaran.
+
+def record_spend(conn, kategori, tanggal, jumlah, sign=1):
+    """Tambah (sign=1) atau kurangi (sign=-1) satu transaksi di rekap bulan tanggal. Tidak melakukan commit."""
+    key = date_key(tanggal)
+    if key is None:
+        return
+    tahun, bulan = key // 12, key % 12 + 1
+    conn.execute('''
+        INSERT INTO rekap_pengeluaran (kategori, tahun, bulan, jumlah, transaksi) VALUES (?, ?, ?, ?, ?)
+        ON CONFLICT(kategori, tahun, bulan) DO UPDATE SET
+            jumlah = jumlah + excluded.jumlah, transaksi = transaksi + excluded.transaksi
+    ''', (kategori, tahun, bulan, sign * int(jumlah), sign))
+    if sign < 0:
+        conn.execute("DELETE FROM rekap_pengeluaran WHERE kategori=? AND tahun=? AND bulan=? AND transaksi <= 0",
+                     (kategori, tahun, bulan))
+
+def refresh_spend(conn):
+    """Bangun ulang seluruh rekap dari tabel pengeluaran; mengembalikan jumlah baris rekap. Tidak melakukan commit."""
+    conn.execute("DELETE FROM rekap_pengeluaran")
+    before = conn.total_changes
+    conn.execute(f'''
+        INSERT INTO rekap_pengeluaran (kategori, tahun, bulan, jumlah, transaksi)
+        SELECT kategori, CAST(substr(t, 1, 4) AS INTEGER), CAST(substr(t, 6, 2) AS INTEGER), SUM(jumlah), COUNT(*)
+        FROM (SELECT kategori, jumlah, {TANGGAL_PENGELUARAN} AS t FROM pengeluaran)
+        WHERE t IS NOT NULL
+        GROUP BY 1, 2, 3
+    ''')
+    return conn.total_changes - before
+
+def spend_matrix(conn, tahun):
+    """Realisasi pengeluaran [kategori x bulan 1..12] satu tahun dari rekap"""
+    df = pd.read_sql_query(
+        "SELECT kategori, bulan, jumlah FROM rekap_pengeluaran WHERE tahun=?", conn, params=[int(tahun)])
+    return (df.pivot_table(index='kategori', columns='bulan', values='jumlah', aggfunc='sum', fill_value=0)
+              .reindex(columns=range(1, 13), fill_value=0))
+
+# ==================== ANGGARAN ====================
+# Baris anggaran berlaku untuk satu kategori di satu tahun: bulan 1..12 untuk anggaran
+# bulanan, bulan 0 (ANGGARAN_TAHUNAN) untuk anggaran setahun.
+
+ANGGARAN_TAHUNAN = 0
+# Realisasi mulai ambang ini (fraksi anggaran) ditandai hampir habis
+AMBANG_PERINGATAN = 0.9
+STATUS_ANGGARAN = ('Tanpa anggaran', 'Aman', 'Hampir habis', 'Melebihi')
+
+def set_budget(conn, kategori, tahun, bulan, jumlah, created_by=None):
+    """Simpan anggaran (upsert per kategori, tahun, bulan). Tidak melakukan commit."""
+    conn.execute('''
+        INSERT INTO anggaran (kategori, tahun, bulan, jumlah, created_by) VALUES (?, ?, ?, ?, ?)
+        ON CONFLICT(kategori, tahun, bulan) DO UPDATE SET
+            jumlah=excluded.jumlah, created_by=excluded.created_by, created_at=CURRENT_TIMESTAMP
+    ''', (kategori, int(tahun), int(bulan), int(jumlah), created_by))
+
+def budgets(conn, tahun):
+    """Daftar anggaran satu tahun (bulan 0 = tahunan)"""
+    return pd.read_sql_query('''
+        SELECT id, kategori, bulan, jumlah FROM anggaran WHERE tahun=? ORDER BY kategori, bulan
+    ''', conn, params=[int(tahun)])
+
+def budget_status(anggaran, realisasi):
+    """Label STATUS_ANGGARAN per baris (anggaran NaN = tanpa anggaran)"""
+    anggaran = np.asarray(anggaran, dtype=float)
+    realisasi = np.asarray(realisasi, dtype=float)
+    index = np.select(
+        [np.isnan(anggaran), realisasi > anggaran, realisasi >= anggaran * AMBANG_PERINGATAN],
+        [0, 3, 2], default=1)
+    return np.asarray(STATUS_ANGGARAN, dtype=object)[index]
+
+def _with_status(df):
+    # Hasil kosong / anggaran NULL terbaca sebagai object: tetapkan tipe numerik
+    df['anggaran'] = df['anggaran'].astype('float64')
+    df['realisasi'] = df['realisasi'].astype('int64')
+    df['sisa'] = df['anggaran'] - df['realisasi']
+    df['persen'] = (df['realisasi'] / df['anggaran'].where(df['anggaran'] > 0) * 100).round(1)
+    df['status'] = budget_status(df['anggaran'], df['realisasi'])
+    return df
+
+def annual_budget_vs_actual(conn, tahun):
+    """Anggaran vs realisasi per kategori untuk satu tahun.
+
+    Anggaran tahunan memakai baris bulan 0; kategori yang hanya punya anggaran bulanan
+    memakai jumlah anggaran bulanannya. Kategori dengan realisasi tanpa anggaran tetap tampil.
+    """
+    df = pd.read_sql_query('''
+        WITH a AS (
+            SELECT kategori, COALESCE(MAX(CASE WHEN bulan = 0 THEN jumlah END),
+                                      SUM(CASE WHEN bulan > 0 THEN jumlah END)) AS anggaran
+            FROM anggaran WHERE tahun = :tahun GROUP BY kategori
+        ),
+        r AS (
+            SELECT kategori, SUM(jumlah) AS realisasi, SUM(transaksi) AS transaksi
+            FROM rekap_pengeluaran WHERE tahun = :tahun GROUP BY kategori
+        ),
+        k AS (SELECT kategori FROM a UNION SELECT kategori FROM r)
+        SELECT k.kategori, a.anggaran, COALESCE(r.realisasi, 0) AS realisasi, COALESCE(r.transaksi, 0) AS transaksi
+        FROM k LEFT JOIN a ON a.kategori = k.kategori LEFT JOIN r ON r.kategori = k.kategori
+        ORDER BY k.kategori
+    ''', conn, params={'tahun': int(tahun)})
+    return _with_status(df)
+
+def monthly_budget_vs_actual(conn, tahun):
+    """Anggaran bulanan vs realisasi bulan yang sama (hanya sel kategori-bulan yang punya anggaran bulanan)"""
+    df = pd.read_sql_query('''
+        SELECT a.kategori, a.bulan, a.jumlah AS anggaran, COALESCE(r.jumlah, 0) AS realisasi
+        FROM anggaran a
+        LEFT JOIN rekap_pengeluaran r ON r.kategori = a.kategori AND r.tahun = a.tahun AND r.bulan = a.bulan
+        WHERE a.tahun = ? AND a.bulan > 0
+        ORDER BY a.kategori, a.bulan
+    ''', conn, params=[int(tahun)])
+    return _with_status(df)
@@ -0,0 +1,156 @@
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+from utils.lazy import px, pio
+
+# ==================== KONFIGURASI CACHE GRAFIK ====================
+# Figure Plotly disimpan sebagai JSON per (id grafik, versi data, parameter). Grafik yang
+# datanya tidak berubah dibangun ulang dari JSON, bukan lewat plotly.express, dan setiap
+# pemanggil mendapat objek figure sendiri (tidak ada figure hidup yang dipakai bersama sesi).
+FIGURE_CACHE_SIZE = int(os.environ.get('GK_FIGURE_CACHE_SIZE', '64'))
+
+_figure_cache = OrderedDict()
+_cache_lock = threading.Lock()
+_cache_stats = {'hits': 0, 'misses': 0}
+
+CHART_KINDS = ('line', 'bar', 'pie')
+
+# ==================== KONFIGURASI DERET WAKTU ====================
+# Deret panjang diringkas di server sebelum dikirim ke browser: jumlah titik dibatasi
+# POINT_BUDGET, dan trace memakai WebGL bila titiknya masih di atas WEBGL_THRESHOLD.
+POINT_BUDGET = int(os.environ.get('GK_CHART_POINT_BUDGET', '2000'))
+WEBGL_THRESHOLD = int(os.environ.get('GK_CHART_WEBGL_THRESHOLD', '1000'))
+
+# Granularitas agregasi tanggal, dari yang paling rinci
+GRANULARITIES = (('D', 'harian'), ('W', 'mingguan'), ('MS', 'bulanan'))
+
+# ==================== KUNCI CACHE ====================
+
+def _freeze(value):
+    """Ubah parameter grafik menjadi bentuk hashable untuk kunci cache"""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, pd.Series):
+        return ('series', tuple(value.tolist()))
+    return value
+
+# ==================== CACHE FIGURE ====================
+
+def cached_figure(chart_id, kind, data=None, version=None, layout=None, **params):
+    """Figure plotly.express (kind: 'line', 'bar', 'pie') dari cache LRU.
+
+    version adalah kunci isi data dari sisi penulis, misal (data_generation(), tahun):
+    generasi data naik setiap commit sehingga isi DataFrame tidak perlu di-hash setiap
+    rerun. Grafik dengan data tetapi tanpa version selalu dibangun ulang (tidak di-cache).
+    Setiap panggilan mengembalikan figure baru yang boleh diubah pemanggil.
+    """
+    if kind not in CHART_KINDS:
+        raise ValueError(f"Jenis grafik tidak didukung: {kind}")
+    cacheable = data is None or version is not None
+    key = (chart_id, kind, version, _freeze(params), _freeze(layout or {}))
+    if cacheable:
+        with _cache_lock:
+            fig_json = _figure_cache.get(key)
+            if fig_json is not None:
+                _figure_cache.move_to_end(key)
+                _cache_stats['hits'] += 1
+        if fig_json is not None:
+            return pio.from_json(fig_json)
+
+    args = (data,) if data is not None else ()
+    fig = getattr(px, kind)(*args, **params)
+    if layout:
+        fig.update_layout(**layout)
+
+    with _cache_lock:
+        _cache_stats['misses'] += 1
+        if cacheable:
+            _figure_cache[key] = fig.to_json()
+            _figure_cache.move_to_end(key)
+            while len(_figure_cache) > FIGURE_CACHE_SIZE:
+                _figure_cache.popitem(last=False)
+    return fig
+
+def clear_figure_cache():
+    """Kosongkan cache figure beserta statistiknya"""
+    with _cache_lock:
+        _figure_cache.clear()
+        _cache_stats['hits'] = 0
+        _cache_stats['misses'] = 0
+
+def figure_cache_info():
+    """Statistik cache figure: hits, misses, jumlah entri dan batasnya"""
+    with _cache_lock:
+        return {**_cache_stats, 'size': len(_figure_cache), 'maxsize': FIGURE_CACHE_SIZE}
+
+# ==================== DOWNSAMPLING ====================
+
+def lttb_indices(x, y, threshold):
+    """Indeks titik hasil Largest-Triangle-Three-Buckets (titik pertama dan terakhir selalu ikut)"""
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    every = (n - 2) / (threshold - 2)
+    indices = np.empty(threshold, dtype=np.int64)
+    indices[0], indices[-1] = 0, n - 1
+    a = 0
+    for i in range(threshold - 2):
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, n)
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(area))
+        indices[i + 1] = a
+    return indices
+
+def _numeric_axis(values):
+    """Sumbu x sebagai angka untuk LTTB (tanggal -> nanodetik, teks -> urutan)"""
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values.astype('int64').to_numpy()
+    if pd.api.types.is_numeric_dtype(values):
+        return values.to_numpy()
+    return np.arange(len(values))
+
+def downsample_series(data, x, y, max_points=POINT_BUDGET, agg='sum'):
+    """Ringkas deret waktu agar paling banyak max_points titik.
+
+    Kolom x bertipe tanggal diagregasi ke granularitas terkecil yang muat
+    (harian, mingguan, bulanan). Jika masih terlalu banyak, atau x bukan tanggal,
+    dipakai LTTB. Mengembalikan (DataFrame, nama granularitas atau 'lttb' atau None).
+    """
+    if len(data) <= max_points:
+        return data, None
+
+    granularity = None
+    if pd.api.types.is_datetime64_any_dtype(data[x]):
+        series = data.set_index(x)[y]
+        for freq, name in GRANULARITIES:
+            resampled = series.resample(freq).agg(agg)
+            granularity = name
+            if len(resampled) <= max_points:
+                break
+        data = resampled.reset_index()
+        if len(data) <= max_points:
+            return data, granularity
+
+    keep = lttb_indices(_numeric_axis(data[x]), data[y].to_numpy(), max_points)
+    return data.iloc[keep].reset_index(drop=True), 'lttb'
+
+def time_series_figure(chart_id, data, x, y, max_points=POINT_BUDGET, agg='sum', version=None, layout=None, **params):
+    """Grafik garis untuk deret panjang: diringkas di server, WebGL untuk deret besar, lalu di-cache per version"""
+    reduced, granularity = downsample_series(data[[x, y]], x, y, max_points=max_points, agg=agg)
+    if len(reduced) > WEBGL_THRESHOLD:
+        params['render_mode'] = 'webgl'
+    if granularity in ('mingguan', 'bulanan'):
+        layout = {**(layout or {}), 'xaxis_title': f"{params.get('labels', {}).get(x, x)} ({granularity})"}
+    return cached_figure(chart_id, 'line', reduced, version=version, x=x, y=y, layout=layout, **params)
@@ -0,0 +1,180 @@
+import hashlib
+from datetime import datetime
+
+import pandas as pd
+
+# ==================== TUTUP BUKU ====================
+# Periode = bulan iuran (pembayaran.tahun/bulan) untuk pemasukan dan bulan tanggal untuk
+# pengeluaran. Periode yang ditutup tidak bisa ditulis lagi; ringkasannya dibekukan di
+# tutup_buku (total + hash daftar pembayar) dan tutup_buku_rincian (per status/metode/kategori).
+
+TAHUN_PENGELUARAN = "CAST(substr(tanggal, 1, 4) AS INTEGER)"
+BULAN_PENGELUARAN = "CAST(substr(tanggal, 6, 2) AS INTEGER)"
+
+class PeriodClosedError(ValueError):
+    """Penulisan ke periode yang sudah ditutup buku"""
+
+def is_closed(conn, tahun, bulan):
+    return conn.execute("SELECT 1 FROM tutup_buku WHERE tahun=? AND bulan=?", (int(tahun), int(bulan))).fetchone() is not None
+
+def ensure_open(conn, tahun, bulan):
+    """Lempar PeriodClosedError jika periode sudah ditutup"""
+    if is_closed(conn, tahun, bulan):
+        raise PeriodClosedError(f"Periode {int(bulan):02d}/{int(tahun)} sudah ditutup buku dan tidak bisa diubah")
+
+def ensure_open_date(conn, tanggal):
+    """Seperti ensure_open untuk tanggal 'YYYY-MM-DD' (pengeluaran)"""
+    text = str(tanggal)
+    ensure_open(conn, int(text[:4]), int(text[5:7]))
+
+def ensure_warga_open(conn, warga_id):
+    """Lempar PeriodClosedError jika warga punya pembayaran/tagihan di periode tertutup.
+
+    Menghapus warga ikut menghapus baris-baris itu (ON DELETE CASCADE) sehingga data
+    live periode tertutup tidak lagi cocok dengan ringkasan bekunya.
+    """
+    periods = conn.execute('''
+        SELECT t.tahun, t.bulan FROM tutup_buku t
+        WHERE EXISTS (SELECT 1 FROM pembayaran p WHERE p.warga_id = ? AND p.tahun = t.tahun AND p.bulan = t.bulan)
+           OR EXISTS (SELECT 1 FROM tagihan g WHERE g.warga_id = ? AND g.tahun = t.tahun AND g.bulan = t.bulan)
+        ORDER BY t.tahun, t.bulan
+    ''', (warga_id, warga_id)).fetchall()
+    if periods:
+        labels = ", ".join(f"{bulan:02d}/{tahun}" for tahun, bulan in periods)
+        raise PeriodClosedError(f"Warga punya transaksi di periode yang sudah ditutup buku ({labels}); "
+                                "nonaktifkan warga alih-alih menghapus")
+
+# ==================== RINGKASAN PERIODE ====================
+
+def payer_hash(warga_ids):
+    """SHA-256 daftar warga_id pembayar terverifikasi (urut), sidik jari isi periode"""
+    return hashlib.sha256(",".join(str(i) for i in sorted(int(w) for w in warga_ids)).encode()).hexdigest()
+
+def period_summary(conn, tahun, bulan):
+    """Ringkasan live satu periode: total yang dibekukan saat tutup buku"""
+    pemasukan, pending = conn.execute('''
+        SELECT COALESCE(SUM(CASE WHEN status='verified' THEN jumlah END), 0),
+               COUNT(CASE WHEN status='pending' THEN 1 END)
+        FROM pembayaran WHERE tahun=? AND bulan=?
+    ''', (int(tahun), int(bulan))).fetchone()
+    pengeluaran = conn.execute(
+        f"SELECT COALESCE(SUM(jumlah), 0) FROM pengeluaran WHERE {TAHUN_PENGELUARAN}=? AND {BULAN_PENGELUARAN}=?",
+        (int(tahun), int(bulan))).fetchone()[0]
+    payers = [row[0] for row in conn.execute(
+        "SELECT DISTINCT warga_id FROM pembayaran WHERE tahun=? AND bulan=? AND status='verified'",
+        (int(tahun), int(bulan)))]
+    return {
+        'pemasukan': pemasukan, 'pengeluaran': pengeluaran, 'pending': pending,
+        'jumlah_pembayar': len(payers), 'hash_pembayar': payer_hash(payers),
+    }
+
+def close_period(conn, tahun, bulan, closed_by=None, force=False, today=None):
+    """Tutup buku satu periode: bekukan ringkasan dan rincian lalu kunci periode.
+
+    Hanya bulan yang sudah lewat yang bisa ditutup; periode dengan pembayaran pending
+    ditolak kecuali force=True (pending-nya ikut terkunci). Tidak melakukan commit.
+    """
+    tahun, bulan = int(tahun), int(bulan)
+    today = today or datetime.now()
+    if (tahun, bulan) >= (today.year, today.month):
+        raise ValueError("Hanya bulan yang sudah lewat yang bisa ditutup buku")
+    ensure_open(conn, tahun, bulan)
+    summary = period_summary(conn, tahun, bulan)
+    if summary['pending'] and not force:
+        raise ValueError(f"Masih ada {summary['pending']} pembayaran pending di periode {bulan:02d}/{tahun}")
+
+    conn.execute('''
+        INSERT INTO tutup_buku (tahun, bulan, pemasukan, pengeluaran, jumlah_pembayar, hash_pembayar, ditutup_oleh)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    ''', (tahun, bulan, summary['pemasukan'], summary['pengeluaran'], summary['jumlah_pembayar'],
+          summary['hash_pembayar'], closed_by))
+    conn.execute('''
+        INSERT INTO tutup_buku_rincian (tahun, bulan, jenis, status, metode_bayar, kategori, jumlah, transaksi)
+        SELECT tahun, bulan, 'pemasukan', COALESCE(status, ''), COALESCE(metode_bayar, ''), '', SUM(jumlah), COUNT(*)
+        FROM pembayaran WHERE tahun=? AND bulan=?
+        GROUP BY status, metode_bayar
+    ''', (tahun, bulan))
+    conn.execute(f'''
+        INSERT INTO tutup_buku_rincian (tahun, bulan, jenis, status, metode_bayar, kategori, jumlah, transaksi)
+        SELECT ?, ?, 'pengeluaran', '', '', kategori, SUM(jumlah), COUNT(*)
+        FROM pengeluaran WHERE {TAHUN_PENGELUARAN}=? AND {BULAN_PENGELUARAN}=?
+        GROUP BY kategori
+    ''', (tahun, bulan, tahun, bulan))
+    return summary
+
+def reopen_period(conn, tahun, bulan):
+    """Buka kembali periode: snapshot dihapus (bukan diubah) sehingga dihitung live lagi"""
+    conn.execute("DELETE FROM tutup_buku_rincian WHERE tahun=? AND bulan=?", (int(tahun), int(bulan)))
+    return conn.execute("DELETE FROM tutup_buku WHERE tahun=? AND bulan=?", (int(tahun), int(bulan))).rowcount > 0
+
+def closed_periods(conn):
+    """Daftar periode yang ditutup beserta ringkasan bekunya"""
+    return pd.read_sql_query('''
+        SELECT tahun, bulan, pemasukan, pengeluaran, jumlah_pembayar, hash_pembayar, ditutup_oleh, ditutup_at
+        FROM tutup_buku ORDER BY tahun DESC, bulan DESC
+    ''', conn)
+
+def verify_period(conn, tahun, bulan):
+    """Bandingkan snapshot dengan data live; daftar kolom yang berbeda (kosong = utuh)"""
+    frozen = conn.execute('''
+        SELECT pemasukan, pengeluaran, jumlah_pembayar, hash_pembayar FROM tutup_buku WHERE tahun=? AND bulan=?
+    ''', (int(tahun), int(bulan))).fetchone()
+    if frozen is None:
+        return None
+    live = period_summary(conn, tahun, bulan)
+    keys = ('pemasukan', 'pengeluaran', 'jumlah_pembayar', 'hash_pembayar')
+    return [key for key, value in zip(keys, frozen) if live[key] != value]
+
+# ==================== LAPORAN DARI SNAPSHOT ====================
+# Padanan utils.analytics.REPORTS untuk periode tertutup; REPORTS sendiri hanya membaca
+# periode terbuka, hasil keduanya digabung oleh merge_report. Keduanya dijalankan engine
+# laporan yang sama dalam satu pembacaan (utils.analytics.run_queries), jadi SQL-nya
+# memakai subset SQLite/DuckDB yang sama (SUM di-CAST ke BIGINT).
+
+SNAPSHOT_REPORTS = {
+    'pembayaran_bulanan': """
+        SELECT bulan,
+               CAST(SUM(jumlah) AS BIGINT) AS total_pembayaran,
+               CAST(SUM(transaksi) AS BIGINT) AS jumlah_transaksi,
+               CAST(SUM(CASE WHEN status='verified' THEN jumlah ELSE 0 END) AS BIGINT) AS verified_payment,
+               CAST(SUM(CASE WHEN status='pending' THEN jumlah ELSE 0 END) AS BIGINT) AS pending_payment
+        FROM tutup_buku_rincian
+        WHERE jenis='pemasukan' AND tahun = ?
+        GROUP BY bulan ORDER BY bulan
+    """,
+    'pendapatan_tahunan': """
+        SELECT tahun, CAST(SUM(jumlah) AS BIGINT) AS total, CAST(SUM(transaksi) AS BIGINT) AS transaksi
+        FROM tutup_buku_rincian WHERE jenis='pemasukan' AND status='verified'
+        GROUP BY tahun ORDER BY tahun DESC
+    """,
+    'pengeluaran_kategori': """
+        SELECT kategori, CAST(SUM(jumlah) AS BIGINT) AS jumlah
+        FROM tutup_buku_rincian WHERE jenis='pengeluaran' AND tahun = ?
+        GROUP BY kategori ORDER BY kategori
+    """,
+    'pengeluaran_bulanan': """
+        SELECT bulan, CAST(SUM(jumlah) AS BIGINT) AS jumlah
+        FROM tutup_buku_rincian WHERE jenis='pengeluaran' AND tahun = ?
+        GROUP BY bulan ORDER BY bulan
+    """,
+}
+
+# Kolom kunci dan arah urutan hasil gabungan per laporan
+REPORT_KEYS = {
+    'pembayaran_bulanan': ('bulan', True),
+    'pendapatan_tahunan': ('tahun', False),
+    'pengeluaran_kategori': ('kategori', True),
+    'pengeluaran_bulanan': ('bulan', True),
+}
+
+def merge_report(name, live, frozen):
+    """Gabungkan hasil live (periode terbuka) dan snapshot (periode tertutup) per kunci laporan"""
+    if frozen is None or frozen.empty:
+        return live
+    if live.empty:
+        return frozen
+    key, ascending = REPORT_KEYS[name]
+    merged = pd.concat([live, frozen[live.columns]], ignore_index=True)
+    return (merged.groupby(key, as_index=False).sum()
+                  .sort_values(key, ascending=ascending)
+                  .reset_index(drop=True))
@@ -0,0 +1,217 @@
+import itertools
+import threading
+
+import numpy as np
+import pandas as pd
+
+from utils.helpers import MONTH_ABBR_ID
+
+# ==================== KODE STATUS ====================
+# Satu sel = satu warga pada satu bulan; status sel adalah status pembayaran terbaik
+# di sel itu (verified > pending > rejected > belum bayar)
+
+UNPAID, REJECTED, PENDING, VERIFIED = 0, 1, 2, 3
+STATUS_CODES = {'rejected': REJECTED, 'pending': PENDING, 'verified': VERIFIED}
+STATUS_NAMES = {UNPAID: 'belum bayar', REJECTED: 'ditolak', PENDING: 'pending', VERIFIED: 'lunas'}
+
+# Kolom pembayaran yang dibutuhkan untuk membangun kubus
+CUBE_COLUMNS = ('id', 'warga_id', 'tahun', 'bulan', 'jumlah', 'status')
+
+# Versi unik per proses (naik setiap kubus dibangun atau diubah), dipakai sebagai kunci cache turunan
+_VERSIONS = itertools.count(1)
+
+def status_code(status):
+    """Kode numerik untuk status teks (status tidak dikenal dianggap belum bayar)"""
+    return STATUS_CODES.get(str(status).lower(), UNPAID)
+
+# ==================== KUBUS PEMBAYARAN ====================
+
+class PaymentCube:
+    """Array NumPy padat [warga, tahun, bulan] berisi nominal lunas dan kode status.
+
+    Dibangun sekali dari satu scan pembayaran, lalu diperbarui per transaksi lewat
+    apply()/set_status() sehingga tidak perlu dibangun ulang setiap ada pembayaran.
+    Analitik (jumlah pembayar, heatmap/grid status) menjadi slice dan reduksi array. Urutan baris mengikuti household_ids; households (opsional) adalah
+    DataFrame keterangan per baris (no_rumah, nama, ...) dengan urutan yang sama.
+    """
+
+    def __init__(self, household_ids, payments, active=None, years=None, households=None):
+        self.household_ids = np.asarray(household_ids, dtype=np.int64)
+        self.households = households
+        self.active = (np.ones(len(self.household_ids), dtype=bool) if active is None
+                       else np.asarray(active, dtype=bool))
+        self._row = {int(hid): pos for pos, hid in enumerate(self.household_ids)}
+        self._lock = threading.Lock()
+
+        tahun = payments['tahun'].to_numpy(dtype=np.int64) if len(payments) else np.empty(0, np.int64)
+        if years is None:
+            years = (int(tahun.min()), int(tahun.max())) if len(tahun) else (0, -1)
+        self.first_year = years[0]
+        n_years = max(years[1] - years[0] + 1, 0)
+
+        n = len(self.household_ids)
+        self.paid = np.zeros((n, n_years, 12), dtype=np.int64)
+        # Jumlah transaksi per status per sel; status sel = kode tertinggi yang jumlahnya > 0
+        self.counts = np.zeros((n, n_years, 12, len(STATUS_NAMES)), dtype=np.int32)
+        self.status = np.zeros((n, n_years, 12), dtype=np.int8)
+        self._payments = {}
+        if len(payments):
+            self._load(payments, tahun)
+        self.version = next(_VERSIONS)
+
+    def _load(self, payments, tahun):
+        """Isi array dari DataFrame pembayaran secara vektor (np.add.at per sel)"""
+        if not len(self.household_ids):
+            return
+        warga_id = payments['warga_id'].to_numpy(dtype=np.int64)
+        order = np.argsort(self.household_ids, kind='stable')
+        pos = np.minimum(np.searchsorted(self.household_ids, warga_id, sorter=order), len(order) - 1)
+        rows = order[pos]
+        known = self.household_ids[rows] == warga_id
+
+        years = tahun - self.first_year
+        months = payments['bulan'].to_numpy(dtype=np.int64) - 1
+        codes = payments['status'].astype(str).str.lower().map(STATUS_CODES).fillna(UNPAID).to_numpy(dtype=np.int64)
+        jumlah = payments['jumlah'].fillna(0).to_numpy(dtype=np.int64)
+        valid = known & (months >= 0) & (months < 12) & (years >= 0) & (years < self.paid.shape[1])
+
+        rows, years, months, codes, jumlah = rows[valid], years[valid], months[valid], codes[valid], jumlah[valid]
+        np.add.at(self.counts, (rows, years, months, codes), 1)
+        verified = codes == VERIFIED
+        np.add.at(self.paid, (rows[verified], years[verified], months[verified]), jumlah[verified])
+        self._refresh_status()
+
+        ids = payments['id'].to_numpy(dtype=np.int64)[valid]
+        self._payments = dict(zip(ids.tolist(), zip(rows.tolist(), years.tolist(), months.tolist(),
+                                                    codes.tolist(), jumlah.tolist())))
+
+    def _refresh_status(self):
+        present = self.counts[..., 1:] > 0
+        # Indeks kode tertinggi yang ada; 0 jika tidak ada transaksi sama sekali
+        highest = present.shape[-1] - np.argmax(present[..., ::-1], axis=-1)
+        self.status = np.where(present.any(axis=-1), highest, UNPAID).astype(np.int8)
+
+    def __len__(self):
+        return len(self.household_ids)
+
+    @property
+    def years(self):
+        return np.arange(self.first_year, self.first_year + self.paid.shape[1])
+
+    @property
+    def nbytes(self):
+        return self.paid.nbytes + self.counts.nbytes + self.status.nbytes
+
+    # ==================== PEMBARUAN INKREMENTAL ====================
+
+    def _year_index(self, tahun):
+        """Indeks tahun; sumbu tahun diperlebar jika tahun di luar jangkauan"""
+        if self.paid.shape[1] == 0:
+            self.first_year = tahun
+        before = max(self.first_year - tahun, 0)
+        after = max(tahun - (self.first_year + self.paid.shape[1] - 1), 0)
+        if before or after:
+            self.paid = np.pad(self.paid, ((0, 0), (before, after), (0, 0)))
+            self.counts = np.pad(self.counts, ((0, 0), (before, after), (0, 0), (0, 0)))
+            self.status = np.pad(self.status, ((0, 0), (before, after), (0, 0)))
+            self.first_year -= before
+            if before:
+                self._payments = {pid: (r, y + before, m, c, j) for pid, (r, y, m, c, j) in self._payments.items()}
+        return tahun - self.first_year
+
+    def _set_cell_status(self, row, year, month):
+        present = np.nonzero(self.counts[row, year, month, 1:])[0]
+        self.status[row, year, month] = present[-1] + 1 if len(present) else UNPAID
+
+    def _add(self, row, year, month, code, jumlah, sign):
+        self.counts[row, year, month, code] += sign
+        if code == VERIFIED:
+            self.paid[row, year, month] += sign * jumlah
+        self._set_cell_status(row, year, month)
+        self.version = next(_VERSIONS)
+
+    def apply(self, payment_id, warga_id, tahun, bulan, jumlah, status):
+        """Tambah atau perbarui satu pembayaran; False jika warga tidak ada di kubus"""
+        row = self._row.get(int(warga_id))
+        if row is None or not 1 <= int(bulan) <= 12:
+            return False
+        with self._lock:
+            self._discard(payment_id)
+            year = self._year_index(int(tahun))
+            entry = (row, year, int(bulan) - 1, status_code(status), int(jumlah or 0))
+            self._payments[int(payment_id)] = entry
+            self._add(*entry, sign=1)
+        return True
+
+    def set_status(self, payment_id, status):
+        """Ubah status pembayaran yang sudah ada; False jika id tidak dikenal"""
+        with self._lock:
+            entry = self._payments.get(int(payment_id))
+            if entry is None:
+                return False
+            self._add(*entry, sign=-1)
+            entry = entry[:3] + (status_code(status), entry[4])
+            self._payments[int(payment_id)] = entry
+            self._add(*entry, sign=1)
+        return True
+
+    def _discard(self, payment_id):
+        entry = self._payments.pop(int(payment_id), None)
+        if entry is not None:
+            self._add(*entry, sign=-1)
+
+    # ==================== ANALITIK ====================
+
+    def _year(self, tahun):
+        year = int(tahun) - self.first_year
+        return year if 0 <= year < self.paid.shape[1] else None
+
+    def _rows(self, active_only):
+        return self.active if active_only else slice(None)
+
+    def heatmap(self, tahun, active_only=False):
+        """Kode status [warga, 12 bulan] untuk satu tahun"""
+        year = self._year(tahun)
+        if year is None:
+            return np.zeros((int(self.active.sum()) if active_only else len(self), 12), dtype=np.int8)
+        return self.status[self._rows(active_only), year, :]
+
+    def payer_count(self, tahun, bulan, active_only=False):
+        """Jumlah warga yang punya pembayaran terverifikasi tercatat untuk bulan iuran itu.
+
+        Artinya "pembayaran tercatat" (pembayaran.tahun/bulan), bukan "tagihan lunas": bayar di
+        muka beberapa bulan dalam satu pembayaran hanya terhitung di bulan pembayarannya.
+        Status lunas per tagihan ada di utils.billing (alokasi pembayaran).
+        """
+        return int((self.heatmap(tahun, active_only)[:, int(bulan) - 1] == VERIFIED).sum())
+
+# ==================== GRID WARGA × BULAN ====================
+
+# Simbol warna per kode status (indeks = kode); teks biasa sehingga tabel tetap tervirtualisasi
+GRID_SYMBOLS = np.array(['⬜', '🟥', '🟨', '🟩'], dtype=object)
+GRID_LEGEND = '🟩 lunas · 🟨 pending · 🟥 ditolak · ⬜ belum bayar'
+
+def house_blocks(no_rumah):
+    """Blok rumah dari nomor rumah: huruf di depan ('A-01' -> 'A'), selain itu 'Lainnya'"""
+    blocks = pd.Series(no_rumah).astype(str).str.extract(r'^\s*([A-Za-z]+)', expand=False)
+    return blocks.str.upper().fillna('Lainnya')
+
+def status_grid(cube, tahun):
+    """Pivot warga × 12 bulan dari kubus: no_rumah, nama, blok, aktif, simbol per bulan, lunas.
+
+    Dibangun sekali per (tahun, versi kubus) dengan lookup array; filter blok/status
+    cukup memakai kolom 'blok', 'aktif' dan array kode yang dikembalikan bersama frame.
+    """
+    codes = cube.heatmap(tahun)
+    households = cube.households
+    grid = pd.DataFrame({
+        'no_rumah': households['no_rumah'].to_numpy(),
+        'nama_kepala_keluarga': households['nama_kepala_keluarga'].to_numpy(),
+        'blok': house_blocks(households['no_rumah']).to_numpy(),
+        'aktif': cube.active,
+    })
+    symbols = GRID_SYMBOLS[codes]
+    for month in range(12):
+        grid[MONTH_ABBR_ID[month + 1]] = symbols[:, month]
+    grid['lunas'] = (codes == VERIFIED).sum(axis=1)
+    return grid, codes
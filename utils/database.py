@@ -1,8 +1,27 @@
 import sqlite3
+import hashlib
+import itertools
+import json
 import pandas as pd
 from datetime import datetime
 import os
 import streamlit as st
+from utils.snapshot import REPORT_MODE, DB_PATH, connect_snapshot, ensure_snapshot, request_refresh, snapshot_generation
+from utils.directory import resident_directory, user_directory
+from utils.frames import FrameRegistry
+from utils.cube import PaymentCube, CUBE_COLUMNS
+from utils.tarif import TarifSchedule, TIPE_STANDAR, load_tarif_rows
+from utils import billing
+from utils.aging import DEFAULT_BATAS_WAKTU, arrears_aging
+from utils import ledger
+from utils import closing
+from utils import budget
+from utils.closing import PeriodClosedError
+from utils.analytics import SQLiteEngine, create_engine, run_report, run_queries, REPORTS
+from utils.loaders import (
+    read_sql_typed, read_sql_arrow, apply_arrow_schema,
+    PEMBAYARAN_SCHEMA, PENGELUARAN_SCHEMA
+)
 
 # ==================== FUNGSI UTAMA ====================
 
@@ -14,13 +33,81 @@ def get_connection():
     conn.execute("PRAGMA foreign_keys = ON") # Tambahkan baris ini
     return conn
 
-def init_db():
-    """Inisialisasi database dan semua tabel yang dibutuhkan"""
-    conn = get_connection()
-    cursor = conn.cursor()
-    
+def get_report_connection():
+    """Koneksi untuk query laporan: snapshot read-only pada mode 'snapshot', database utama pada mode 'live'"""
+    if REPORT_MODE != 'snapshot':
+        return get_connection()
+    if not os.path.exists('data'):
+        os.makedirs('data')
+    return connect_snapshot()
+
+# ==================== FETCH ARROW ====================
+
+# Driver jalur Arrow: 'auto' (ADBC bila adbc-driver-sqlite terpasang), 'adbc', atau 'cursor'
+ARROW_DRIVER = os.environ.get('GK_ARROW_DRIVER', 'auto')
+
+def _adbc_dbapi():
+    """Modul DB-API ADBC SQLite, atau None jika tidak terpasang / dimatikan lewat GK_ARROW_DRIVER"""
+    if ARROW_DRIVER == 'cursor':
+        return None
+    try:
+        import adbc_driver_sqlite.dbapi as adbc
+    except ImportError:
+        return None
+    return adbc
+
+def fetch_arrow(query, params=(), schema=None, report=False):
+    """Hasil query sebagai pyarrow.Table bertipe, siap untuk st.dataframe/st.data_editor tanpa pandas.
+
+    Memakai ADBC (hasil langsung berupa Arrow) bila terpasang; jika tidak, atau jika ADBC menolak
+    kolom bertipe campuran, memakai builder cursor sqlite3 (utils.loaders.read_sql_arrow).
+    report=True membaca sumber laporan (snapshot pada mode 'snapshot').
+    """
+    adbc = _adbc_dbapi()
+    if adbc is not None:
+        path = ensure_snapshot() if report and REPORT_MODE == 'snapshot' else DB_PATH
+        try:
+            with adbc.connect(f"file:{os.path.abspath(path)}?mode=ro") as conn, conn.cursor() as cursor:
+                cursor.execute(query, tuple(params))
+                return apply_arrow_schema(cursor.fetch_arrow_table(), schema or {})
+        except (adbc.Error, OSError) as e:
+            # adbc.Error: driver menolak koneksi/query; OSError: stream Arrow berhenti karena
+            # tipe kolom campuran ("Type mismatch in column ..."). Kesalahan lain tetap naik.
+            print(f"fetch_arrow lewat ADBC gagal, memakai cursor sqlite3: {e}")
+    conn = get_report_connection() if report else get_connection()
+    try:
+        return read_sql_arrow(query, conn, schema, tuple(params))
+    finally:
+        conn.close()
+
+# ==================== GENERASI DATA ====================
+# Setiap penulis memanggil invalidate_data() setelah commit. Generasi data ikut naik sehingga
+# cache turunan (figure grafik) cukup memakai data_generation() sebagai kunci versi,
+# tanpa hashing isi DataFrame setiap rerun. Pada mode 'snapshot' snapshot laporan ikut
+# diminta refresh di latar belakang (utils.snapshot.request_refresh); turunan get_report
+# memakai report_generation() karena snapshot baru berubah setelah refresh itu selesai.
+
+_GENERATIONS = itertools.count(1)
+_data_generation = 0
+
+def data_generation():
+    """Generasi data saat ini (naik setiap kali penulis commit)"""
+    return _data_generation
+
+def invalidate_data():
+    """Bersihkan cache data dan naikkan generasi data setelah commit"""
+    global _data_generation
+    _data_generation = next(_GENERATIONS)
+    st.cache_data.clear()
+    if REPORT_MODE == 'snapshot':
+        request_refresh()
+
+# ==================== SKEMA DATABASE ====================
+
+# Urutan DDL dijalankan oleh init_db(); setiap perubahan otomatis mengubah SCHEMA_FINGERPRINT
+SCHEMA_DDL = [
     # 1. Tabel warga
-    cursor.execute('''
+    '''
         CREATE TABLE IF NOT EXISTS warga (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             no_rumah TEXT NOT NULL UNIQUE,
@@ -32,10 +119,9 @@ def init_db():
             status TEXT DEFAULT 'aktif',
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         )
-    ''')
-    
+    ''',
     # 2. Tabel pembayaran
-    cursor.execute('''
+    '''
         CREATE TABLE IF NOT EXISTS pembayaran (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             warga_id INTEGER,
@@ -53,10 +139,9 @@ def init_db():
             FOREIGN KEY (warga_id) REFERENCES warga (id) ON DELETE CASCADE,
             UNIQUE(warga_id, bulan, tahun)
         )
-    ''')
-    
+    ''',
     # 3. Tabel pengeluaran
-    cursor.execute('''
+    '''
         CREATE TABLE IF NOT EXISTS pengeluaran (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             kategori TEXT NOT NULL,
@@ -67,10 +152,9 @@ def init_db():
             disetujui_oleh INTEGER,
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         )
-    ''')
-    
+    ''',
     # 4. Tabel users
-    cursor.execute('''
+    '''
         CREATE TABLE IF NOT EXISTS users (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             username TEXT UNIQUE NOT NULL,
@@ -80,10 +164,9 @@ def init_db():
             status TEXT DEFAULT 'active',
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         )
-    ''')
-
+    ''',
     # 5. Tabel pending_changes
-    cursor.execute('''
+    '''
         CREATE TABLE IF NOT EXISTS pending_changes (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             table_name TEXT,
@@ -97,23 +180,272 @@ def init_db():
             review_date TIMESTAMP,
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         )
-    ''')
-    
-    conn.commit()
-    conn.close()
+    ''',
+    # 6. Tabel tarif (jadwal iuran per tanggal berlaku; tipe_rumah '' = tarif standar)
+    '''
+        CREATE TABLE IF NOT EXISTS tarif (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            berlaku_mulai DATE NOT NULL,
+            tipe_rumah TEXT NOT NULL DEFAULT '',
+            jumlah INTEGER NOT NULL,
+            keterangan TEXT DEFAULT '',
+            created_by INTEGER,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE(berlaku_mulai, tipe_rumah)
+        )
+    ''',
+    # 7. Tabel tagihan (satu per warga aktif per periode, dibuat oleh billing run)
+    '''
+        CREATE TABLE IF NOT EXISTS tagihan (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            warga_id INTEGER NOT NULL,
+            tahun INTEGER NOT NULL,
+            bulan INTEGER NOT NULL,
+            jumlah INTEGER NOT NULL,
+            terbayar INTEGER NOT NULL DEFAULT 0,
+            status TEXT NOT NULL DEFAULT 'terbuka',
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (warga_id) REFERENCES warga (id) ON DELETE CASCADE,
+            UNIQUE(warga_id, tahun, bulan)
+        )
+    ''',
+    # Index parsial: tunggakan/pengingat hanya membaca tagihan terbuka
+    '''
+        CREATE INDEX IF NOT EXISTS idx_tagihan_terbuka ON tagihan (warga_id, tahun, bulan)
+        WHERE status = 'terbuka'
+    ''',
+    # 8. Tabel alokasi_pembayaran (porsi pembayaran terverifikasi per tagihan)
+    '''
+        CREATE TABLE IF NOT EXISTS alokasi_pembayaran (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            pembayaran_id INTEGER NOT NULL,
+            tagihan_id INTEGER NOT NULL,
+            jumlah INTEGER NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (pembayaran_id) REFERENCES pembayaran (id) ON DELETE CASCADE,
+            FOREIGN KEY (tagihan_id) REFERENCES tagihan (id) ON DELETE CASCADE
+        )
+    ''',
+    'CREATE INDEX IF NOT EXISTS idx_alokasi_pembayaran ON alokasi_pembayaran (pembayaran_id)',
+    'CREATE INDEX IF NOT EXISTS idx_alokasi_tagihan ON alokasi_pembayaran (tagihan_id)',
+    # 9. Tabel saldo_bulanan (saldo penutupan kas per bulan, dimaterialisasi oleh utils.ledger)
+    '''
+        CREATE TABLE IF NOT EXISTS saldo_bulanan (
+            tahun INTEGER NOT NULL,
+            bulan INTEGER NOT NULL,
+            pemasukan INTEGER NOT NULL DEFAULT 0,
+            pengeluaran INTEGER NOT NULL DEFAULT 0,
+            saldo_akhir INTEGER NOT NULL DEFAULT 0,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (tahun, bulan)
+        )
+    ''',
+    # Index ekspresi tanggal kas: pembaruan saldo dan buku kas hanya membaca rentang tanggalnya
+    f"CREATE INDEX IF NOT EXISTS idx_pembayaran_kas ON pembayaran ({ledger.TANGGAL_PEMASUKAN}) WHERE status = 'verified'",
+    f"CREATE INDEX IF NOT EXISTS idx_pengeluaran_kas ON pengeluaran ({ledger.TANGGAL_PENGELUARAN})",
+    # 10. Tabel pengaturan (kunci-nilai, nilai disimpan sebagai JSON)
+    '''
+        CREATE TABLE IF NOT EXISTS pengaturan (
+            kunci TEXT PRIMARY KEY,
+            nilai TEXT,
+            updated_by TEXT,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''',
+    # 11. Tabel tutup_buku (periode terkunci beserta ringkasan beku, ditulis utils.closing)
+    '''
+        CREATE TABLE IF NOT EXISTS tutup_buku (
+            tahun INTEGER NOT NULL,
+            bulan INTEGER NOT NULL,
+            pemasukan INTEGER NOT NULL DEFAULT 0,
+            pengeluaran INTEGER NOT NULL DEFAULT 0,
+            jumlah_pembayar INTEGER NOT NULL DEFAULT 0,
+            hash_pembayar TEXT NOT NULL,
+            ditutup_oleh TEXT,
+            ditutup_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (tahun, bulan)
+        )
+    ''',
+    # 12. Tabel tutup_buku_rincian (pemasukan per status/metode dan pengeluaran per kategori)
+    '''
+        CREATE TABLE IF NOT EXISTS tutup_buku_rincian (
+            tahun INTEGER NOT NULL,
+            bulan INTEGER NOT NULL,
+            jenis TEXT NOT NULL,
+            status TEXT NOT NULL DEFAULT '',
+            metode_bayar TEXT NOT NULL DEFAULT '',
+            kategori TEXT NOT NULL DEFAULT '',
+            jumlah INTEGER NOT NULL DEFAULT 0,
+            transaksi INTEGER NOT NULL DEFAULT 0,
+            FOREIGN KEY (tahun, bulan) REFERENCES tutup_buku (tahun, bulan) ON DELETE CASCADE
+        )
+    ''',
+    'CREATE INDEX IF NOT EXISTS idx_tutup_buku_rincian ON tutup_buku_rincian (jenis, tahun, bulan)',
+    # 13. Tabel rekap_pengeluaran (total pengeluaran per kategori per bulan, dipelihara utils.budget)
+    '''
+        CREATE TABLE IF NOT EXISTS rekap_pengeluaran (
+            kategori TEXT NOT NULL,
+            tahun INTEGER NOT NULL,
+            bulan INTEGER NOT NULL,
+            jumlah INTEGER NOT NULL DEFAULT 0,
+            transaksi INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (kategori, tahun, bulan)
+        )
+    ''',
+    # 14. Tabel anggaran (per kategori per tahun; bulan 0 = anggaran tahunan)
+    '''
+        CREATE TABLE IF NOT EXISTS anggaran (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            kategori TEXT NOT NULL,
+            tahun INTEGER NOT NULL,
+            bulan INTEGER NOT NULL DEFAULT 0,
+            jumlah INTEGER NOT NULL,
+            created_by TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE(kategori, tahun, bulan)
+        )
+    ''',
+]
+
+# Kolom yang ditambahkan ke tabel lama (CREATE TABLE IF NOT EXISTS tidak mengubah tabel yang sudah ada)
+SCHEMA_ADD_COLUMNS = [
+    ('warga', 'tipe_rumah', "TEXT DEFAULT ''"),
+]
+
+# Fingerprint disimpan di PRAGMA user_version (integer 32-bit) sehingga cek skema cukup satu query
+SCHEMA_FINGERPRINT = int(hashlib.sha256("\n".join(
+    SCHEMA_DDL + [" ".join(column) for column in SCHEMA_ADD_COLUMNS]).encode()).hexdigest()[:7], 16)
+
+def apply_schema(conn):
+    """Jalankan SCHEMA_DDL lalu tambahkan kolom SCHEMA_ADD_COLUMNS yang belum ada"""
+    for ddl in SCHEMA_DDL:
+        conn.execute(ddl)
+    for table, column, definition in SCHEMA_ADD_COLUMNS:
+        existing = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+        if column not in existing:
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+
+# ==================== PROYEKSI KOLOM ====================
+
+def _schema_columns():
+    """Kolom per tabel menurut SCHEMA_DDL (dijalankan sekali di database in-memory)"""
+    conn = sqlite3.connect(':memory:')
+    try:
+        apply_schema(conn)
+        tables = [row[0] for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%'")]
+        return {table: tuple(row[1] for row in conn.execute(f"PRAGMA table_info({table})")) for table in tables}
+    finally:
+        conn.close()
+
+SCHEMA_COLUMNS = _schema_columns()
+
+# Kolom users yang aman ditampilkan (tanpa password)
+USER_COLUMNS = tuple(col for col in SCHEMA_COLUMNS['users'] if col != 'password')
+
+def select_list(table, columns=None, alias=None):
+    """Daftar kolom untuk SELECT, divalidasi terhadap skema (None = semua kolom tabel).
+
+    Kolom yang tidak ada di tabel langsung ditolak dengan ValueError sebelum query dijalankan.
+    """
+    known = SCHEMA_COLUMNS[table]
+    columns = known if columns is None else tuple(columns)
+    unknown = [col for col in columns if col not in known]
+    if unknown:
+        raise ValueError(f"Kolom tidak dikenal di tabel {table}: {', '.join(unknown)}")
+    prefix = f"{alias}." if alias else ""
+    return ", ".join(f"{prefix}{col}" for col in columns)
+
+def init_db(force=False):
+    """Inisialisasi database dan semua tabel yang dibutuhkan.
+
+    DDL hanya dijalankan jika fingerprint skema di database berbeda dari SCHEMA_FINGERPRINT
+    atau force=True. Mengembalikan True jika DDL dijalankan.
+    """
+    conn = get_connection()
+    try:
+        if not force and conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_FINGERPRINT:
+            return False
+
+        apply_schema(conn)
+        # Database lama: rekap pengeluaran diisi sekali, setelahnya dipelihara add/delete_pengeluaran
+        if conn.execute("SELECT 1 FROM rekap_pengeluaran LIMIT 1").fetchone() is None:
+            budget.refresh_spend(conn)
+        conn.execute(f"PRAGMA user_version = {SCHEMA_FINGERPRINT}")
+        conn.commit()
+        return True
+    finally:
+        conn.close()
+
+@st.cache_resource
+def ensure_db_initialized():
+    """Jalankan init_db() sekali per proses server; rerun Streamlit berikutnya tanpa query sama sekali"""
+    init_db()
+    return SCHEMA_FINGERPRINT
+
+def reinit_db():
+    """Jalur maintenance: paksa DDL ulang dan reset penanda init per proses"""
+    ensure_db_initialized.clear()
+    init_db(force=True)
+    return ensure_db_initialized()
+
+# ==================== FRAME BERSAMA ====================
+
+@st.cache_resource
+def get_frame_registry():
+    """Registry DataFrame read-only bersama: satu salinan per proses server, bukan per sesi.
+
+    'warga' berisi semua status dengan kolom direktori; 'users' tanpa kolom password.
+    Penulisan data memanggil invalidate_warga_frames() / invalidate_user_frames().
+    """
+    registry = FrameRegistry()
+    registry.register('warga', lambda: read_warga(False, WARGA_DIRECTORY_COLUMNS), ttl=300)
+    registry.register('users', get_all_users, ttl=300)
+    return registry
+
+def shared_frame(name):
+    """Frame bersama dari registry; jangan disalin ke session_state, simpan state filternya saja"""
+    return get_frame_registry().get(name)
 
 # ==================== FUNGSI WARGA ====================
 
-@st.cache_data(ttl=300)
-def get_all_warga(active_only=True):
-    """Ambil data warga dengan cache untuk mencegah kedap-kedip"""
+# Kolom yang dibutuhkan direktori warga (selectbox, tabel Data Warga dan aksi edit/nonaktifkan)
+WARGA_DIRECTORY_COLUMNS = ('id', 'no_rumah', 'nama_kepala_keluarga', 'anggota_keluarga',
+                           'telepon', 'email', 'tanggal_masuk', 'status', 'tipe_rumah')
+
+def read_warga(active_only=True, columns=None):
+    """Query data warga tanpa cache (columns: tuple kolom yang dipakai)"""
     conn = get_connection()
     try:
-        query = "SELECT * FROM warga WHERE status='aktif' ORDER BY no_rumah" if active_only else "SELECT * FROM warga ORDER BY no_rumah"
+        where = "WHERE status='aktif' " if active_only else ""
+        query = f"SELECT {select_list('warga', columns)} FROM warga {where}ORDER BY no_rumah"
         return pd.read_sql_query(query, conn)
     finally:
         conn.close()
 
+@st.cache_resource(ttl=300)
+def get_resident_directory(active_only=True):
+    """Direktori warga (urut natural no_rumah) dengan index id/no_rumah, label opsi dan index
+    pencarian (directory.search_index) siap pakai.
+
+    Objeknya dipakai bersama antar sesi; dibangun ulang saat TTL habis atau saat data warga ditulis.
+    """
+    frame = shared_frame('warga')
+    if active_only:
+        frame = frame[frame['status'] == 'aktif'].reset_index(drop=True)
+    return resident_directory(frame)
+
+def invalidate_warga_frames():
+    """Muat ulang frame bersama, direktori dan index pencarian warga (tombol Refresh)"""
+    get_frame_registry().invalidate('warga')
+    get_resident_directory.clear()
+    get_payment_cube.clear()
+
+def invalidate_warga_cache():
+    """Bersihkan cache data, direktori dan index pencarian warga setelah tabel warga berubah"""
+    invalidate_data()
+    invalidate_warga_frames()
+
 def add_warga(data):
     conn = get_connection()
     cursor = conn.cursor()
@@ -123,7 +455,7 @@ def add_warga(data):
             VALUES (?, ?, ?, ?, ?, ?, ?)
         ''', data)
         conn.commit()
-        st.cache_data.clear() # Reset cache agar data baru langsung muncul
+        invalidate_warga_cache() # Reset cache agar data baru langsung muncul
         return cursor.lastrowid
     except Exception as e:
         conn.rollback()
@@ -140,22 +472,26 @@ def update_warga(warga_id, data):
             telepon=?, email=?, tanggal_masuk=?, status=? WHERE id=?
         ''', (*data, warga_id))
         conn.commit()
-        st.cache_data.clear()
+        invalidate_warga_cache()
         return True
-    except:
+    except sqlite3.Error as e:
+        print(f"Error update_warga: {e}")
         return False
     finally:
         conn.close()
 
 def delete_warga(warga_id):
+    """Hapus warga beserta pembayaran dan tagihannya; PeriodClosedError jika ada di periode tertutup"""
     conn = get_connection()
     cursor = conn.cursor()
     try:
+        closing.ensure_warga_open(conn, warga_id)
         cursor.execute('DELETE FROM warga WHERE id = ?', (warga_id,))
         conn.commit()
-        st.cache_data.clear()
+        invalidate_warga_cache()
         return True
-    except:
+    except sqlite3.Error as e:
+        print(f"Error delete_warga: {e}")
         return False
     finally:
         conn.close()
@@ -168,38 +504,124 @@ def get_warga_by_id(warga_id):
     conn.close()
     return warga
 
-@st.cache_data(ttl=60)
-def search_warga(keyword):
-    if not keyword:
-        return get_all_warga()
+def set_tipe_rumah(warga_ids, tipe_rumah):
+    """Set tipe rumah (penentu override tarif) untuk beberapa warga sekaligus; '' = tarif standar"""
+    warga_ids = [int(warga_id) for warga_id in warga_ids]
+    if not warga_ids:
+        return 0
+    conn = get_connection()
+    try:
+        placeholders = ", ".join("?" * len(warga_ids))
+        cursor = conn.execute(f"UPDATE warga SET tipe_rumah=? WHERE id IN ({placeholders})",
+                              ((tipe_rumah or TIPE_STANDAR).strip(), *warga_ids))
+        conn.commit()
+        invalidate_warga_cache()
+        return cursor.rowcount
+    finally:
+        conn.close()
+
+# ==================== FUNGSI TARIF ====================
+
+@st.cache_resource(ttl=300)
+def get_tarif_schedule():
+    """Jadwal tarif iuran (utils.tarif.TarifSchedule) bersama semua sesi.
+
+    Pengganti nominal 100000 yang dulu tertulis di form, query tunggakan dan pengaturan;
+    dibangun ulang oleh add_tarif/delete_tarif atau saat TTL habis.
+    """
     conn = get_connection()
     try:
-        query = "SELECT * FROM warga WHERE (nama_kepala_keluarga LIKE ? OR no_rumah LIKE ?) ORDER BY no_rumah"
-        return pd.read_sql_query(query, conn, params=(f'%{keyword}%', f'%{keyword}%'))
+        return TarifSchedule(load_tarif_rows(conn))
+    finally:
+        conn.close()
+
+def add_tarif(berlaku_mulai, jumlah, tipe_rumah=TIPE_STANDAR, keterangan='', created_by=None):
+    """Tambah tarif; tarif dengan tanggal dan tipe rumah yang sama ditimpa"""
+    conn = get_connection()
+    try:
+        cursor = conn.execute('''
+            INSERT INTO tarif (berlaku_mulai, tipe_rumah, jumlah, keterangan, created_by)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(berlaku_mulai, tipe_rumah) DO UPDATE SET
+                jumlah=excluded.jumlah, keterangan=excluded.keterangan, created_by=excluded.created_by
+        ''', (str(berlaku_mulai), (tipe_rumah or TIPE_STANDAR).strip(), int(jumlah), keterangan, created_by))
+        conn.commit()
+        get_tarif_schedule.clear()
+        return cursor.lastrowid
+    finally:
+        conn.close()
+
+def delete_tarif(tarif_id):
+    """Hapus satu baris tarif"""
+    conn = get_connection()
+    try:
+        conn.execute("DELETE FROM tarif WHERE id = ?", (int(tarif_id),))
+        conn.commit()
+        get_tarif_schedule.clear()
+        return True
+    except Exception as e:
+        conn.rollback()
+        print(f"Error delete_tarif: {e}")
+        return False
     finally:
         conn.close()
 
 # ==================== FUNGSI PEMBAYARAN ====================
 
-@st.cache_data(ttl=300)
-def get_all_pembayaran():
+def _sync_payment_cube(update):
+    """Terapkan pembayaran yang sudah di-commit ke kubus lewat update(cube) -> bool.
+
+    Dipanggil di luar try/rollback penulis: baris sudah tersimpan, jadi kegagalan di sini
+    tidak boleh dilaporkan sebagai gagal menyimpan. Jika update tidak bisa (False) atau
+    gagal, kubus dibuang dan dibangun ulang dari database saat dibaca berikutnya.
+    """
+    try:
+        applied = update(get_payment_cube())
+    except Exception as e:
+        print(f"Kubus pembayaran dibangun ulang: {e}")
+        applied = False
+    if not applied:
+        get_payment_cube.clear()
+
+@st.cache_resource(ttl=300)
+def get_payment_cube():
+    """Kubus pembayaran [warga, tahun, bulan] bersama semua sesi (utils.cube.PaymentCube).
+
+    Baris = semua warga dalam urutan direktori (urut natural no_rumah). Dibangun dari satu
+    scan pembayaran, diperbarui per transaksi oleh add_pembayaran/update_pembayaran_status,
+    dan dibangun ulang saat data warga berubah atau TTL habis (menangkap penulisan dari scripts/).
+    """
+    warga = get_resident_directory(active_only=False).frame
     conn = get_connection()
     try:
-        query = '''
-            SELECT p.*, w.no_rumah, w.nama_kepala_keluarga 
-            FROM pembayaran p
-            JOIN warga w ON p.warga_id = w.id
-            ORDER BY p.tahun DESC, p.bulan DESC, p.tanggal_bayar DESC
-        '''
-        return pd.read_sql_query(query, conn)
+        payments = pd.read_sql_query(f"SELECT {select_list('pembayaran', CUBE_COLUMNS)} FROM pembayaran ORDER BY id", conn)
     finally:
         conn.close()
+    return PaymentCube(warga['id'], payments, active=warga['status'].eq('aktif').to_numpy(),
+                       households=warga[['id', 'no_rumah', 'nama_kepala_keluarga', 'tipe_rumah', 'tanggal_masuk']])
+
+@st.cache_data(ttl=300)
+def get_all_pembayaran_arrow(columns=None, warga_columns=('no_rumah', 'nama_kepala_keluarga'), limit=None, report=False):
+    """Pembayaran beserta kolom warga sebagai pyarrow.Table (jalur Arrow, tanpa DataFrame);
+    columns/warga_columns membatasi kolom yang diambil, limit None = semua"""
+    query = f'''
+        SELECT {select_list('pembayaran', columns, 'p')}, {select_list('warga', warga_columns, 'w')}
+        FROM pembayaran p
+        JOIN warga w ON p.warga_id = w.id
+        ORDER BY p.tahun DESC, p.bulan DESC, p.tanggal_bayar DESC
+    '''
+    params = ()
+    if limit is not None:
+        query += " LIMIT ?"
+        params = (limit,)
+    return fetch_arrow(query, params, PEMBAYARAN_SCHEMA, report=report)
 
 def add_pembayaran(data):
     conn = get_connection()
     cursor = conn.cursor()
     try:
         warga_id, bulan, tahun, jumlah, tanggal_bayar, metode_bayar, bukti_bayar, status, catatan = data
+        closing.ensure_open(conn, tahun, bulan)
         if status == 'verified':
             query = 'INSERT INTO pembayaran (warga_id, bulan, tahun, jumlah, tanggal_bayar, metode_bayar, bukti_bayar, status, catatan, verified_by, verified_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)'
             params = (warga_id, bulan, tahun, jumlah, tanggal_bayar, metode_bayar, bukti_bayar, status, catatan, 1, datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
@@ -208,52 +630,289 @@ def add_pembayaran(data):
             params = (warga_id, bulan, tahun, jumlah, tanggal_bayar, metode_bayar, bukti_bayar, status, catatan)
         
         cursor.execute(query, params)
+        if status == 'verified':
+            billing.allocate(conn, pembayaran_ids=[cursor.lastrowid])
+            ledger.refresh_balances(conn, ledger.date_key(tanggal_bayar) or ledger.date_key(f"{tahun}-{int(bulan):02d}"))
         conn.commit()
-        st.cache_data.clear()
-        return cursor.lastrowid
+        pembayaran_id = cursor.lastrowid
     except Exception as e:
         conn.rollback()
         raise e
     finally:
         conn.close()
+    # Setelah commit: cache dan kubus diperbarui di luar try agar tidak memicu rollback/pesan gagal
+    invalidate_data()
+    _sync_payment_cube(lambda cube: cube.apply(pembayaran_id, warga_id, tahun, bulan, jumlah, status))
+    return pembayaran_id
 
 def update_pembayaran_status(pembayaran_id, status, verified_by=None):
     conn = get_connection()
     cursor = conn.cursor()
     try:
+        periode = cursor.execute("SELECT tahun, bulan FROM pembayaran WHERE id=?", (pembayaran_id,)).fetchone()
+        if periode:
+            closing.ensure_open(conn, *periode)
         if status == 'verified' and verified_by:
             cursor.execute('UPDATE pembayaran SET status=?, verified_by=?, verified_at=datetime("now") WHERE id=?', (status, verified_by, pembayaran_id))
         else:
             cursor.execute('UPDATE pembayaran SET status=? WHERE id=?', (status, pembayaran_id))
+        # Tagihan mengikuti status: verified dialokasikan, selain itu alokasinya dibatalkan
+        if status == 'verified':
+            billing.allocate(conn, pembayaran_ids=[pembayaran_id])
+        else:
+            billing.release(conn, pembayaran_id)
+        # Saldo kas mulai bulan tanggal bayar ikut berubah (masuk/keluar dari pemasukan)
+        tanggal_kas = cursor.execute(
+            f"SELECT {ledger.TANGGAL_PEMASUKAN} FROM pembayaran WHERE id=?", (pembayaran_id,)).fetchone()
+        if tanggal_kas:
+            ledger.refresh_balances(conn, ledger.date_key(tanggal_kas[0]))
         conn.commit()
-        st.cache_data.clear()
     finally:
         conn.close()
+    invalidate_data()
+    _sync_payment_cube(lambda cube: cube.set_status(pembayaran_id, status))
 
-# ==================== FUNGSI REPORT & ADMIN ====================
+# ==================== FUNGSI TAGIHAN ====================
+
+def run_billing(tahun, bulan):
+    """Billing run satu periode (utils.billing.billing_run); mengembalikan (tagihan baru, nominal teralokasi)"""
+    conn = get_connection()
+    try:
+        result = billing.billing_run(conn, tahun, bulan, get_tarif_schedule())
+        conn.commit()
+        invalidate_data()
+        return result
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
 
 @st.cache_data(ttl=300)
-def get_pembayaran_report():
+def get_tunggakan_tagihan():
+    """Tunggakan per warga dari tagihan terbuka (jumlah bulan, sisa, periode tertua, telepon)"""
     conn = get_connection()
     try:
-        query = '''
-            SELECT p.id, w.no_rumah, w.nama_kepala_keluarga, p.bulan, p.tahun, 
-                   p.jumlah, p.tanggal_bayar, p.metode_bayar, p.status
-            FROM pembayaran p
-            JOIN warga w ON p.warga_id = w.id
-            ORDER BY p.tahun DESC, p.bulan DESC
-        '''
-        df = pd.read_sql_query(query, conn)
-        # Proteksi: Konversi ke tipe data Python standar agar tidak error numpy.int64
-        if not df.empty:
-            df['tahun'] = df['tahun'].astype(int)
-            df['bulan'] = df['bulan'].astype(int)
+        return billing.arrears_summary(conn)
+    finally:
+        conn.close()
+
+@st.cache_data(ttl=300)
+def get_tunggakan_tahun(tahun):
+    """Tagihan satu tahun per warga (ditagih, lunas, tunggak, sisa) untuk analisis tunggakan tahunan"""
+    conn = get_connection()
+    try:
+        return billing.year_arrears(conn, tahun)
+    finally:
+        conn.close()
+
+@st.cache_data(ttl=300)
+def get_umur_tunggakan(batas_waktu, tanggal):
+    """Umur tunggakan per warga dari tagihan terbuka, dikelompokkan per hari lewat jatuh tempo"""
+    conn = get_connection()
+    try:
+        return arrears_aging(billing.open_invoices(conn), batas_waktu, today=tanggal)
+    finally:
+        conn.close()
+
+@st.cache_data(ttl=300)
+def get_statement(warga_id):
+    """Rekening tagihan satu warga beserta pembayaran yang dialokasikan"""
+    conn = get_connection()
+    try:
+        return billing.statement(conn, warga_id)
+    finally:
+        conn.close()
+
+# ==================== FUNGSI KAS ====================
+
+def rebuild_saldo():
+    """Bangun ulang seluruh saldo_bulanan (setelah data diubah di luar aplikasi, misal lewat scripts/)"""
+    conn = get_connection()
+    try:
+        months = ledger.refresh_balances(conn)
+        conn.commit()
+        invalidate_data()
+        return months
+    finally:
+        conn.close()
+
+@st.cache_data(ttl=300)
+def get_saldo_bulanan():
+    """Saldo penutupan kas per bulan dari tabel materialisasi; dibangun sekali jika masih kosong"""
+    conn = get_connection()
+    try:
+        df = ledger.monthly_balances(conn)
+        if df.empty and ledger.refresh_balances(conn):
+            conn.commit()
+            df = ledger.monthly_balances(conn)
         return df
-    except:
-        return pd.DataFrame()
     finally:
         conn.close()
 
+@st.cache_data(ttl=300)
+def get_buku_kas(tahun):
+    """Buku kas satu tahun: pemasukan dan pengeluaran dengan saldo berjalan"""
+    conn = get_connection()
+    try:
+        return ledger.cash_book(conn, int(tahun) * 12, int(tahun) * 12 + 11)
+    finally:
+        conn.close()
+
+# ==================== FUNGSI ANGGARAN ====================
+
+def rebuild_rekap_pengeluaran():
+    """Bangun ulang rekap pengeluaran per kategori-bulan (setelah data diubah di luar aplikasi)"""
+    conn = get_connection()
+    try:
+        rows = budget.refresh_spend(conn)
+        conn.commit()
+        invalidate_data()
+        return rows
+    finally:
+        conn.close()
+
+def set_anggaran(kategori, tahun, bulan, jumlah, created_by=None):
+    """Simpan anggaran satu kategori; bulan berupa angka 1..12, daftar bulan, atau 0 untuk tahunan"""
+    conn = get_connection()
+    try:
+        for b in (bulan if isinstance(bulan, (list, tuple, range)) else [bulan]):
+            budget.set_budget(conn, kategori, tahun, b, jumlah, created_by)
+        conn.commit()
+        invalidate_data()
+        return True
+    finally:
+        conn.close()
+
+def delete_anggaran(anggaran_id):
+    conn = get_connection()
+    try:
+        deleted = conn.execute("DELETE FROM anggaran WHERE id=?", (int(anggaran_id),)).rowcount > 0
+        conn.commit()
+        invalidate_data()
+        return deleted
+    finally:
+        conn.close()
+
+@st.cache_data(ttl=300)
+def get_anggaran(tahun):
+    conn = get_connection()
+    try:
+        return budget.budgets(conn, tahun)
+    finally:
+        conn.close()
+
+@st.cache_data(ttl=300)
+def get_anggaran_realisasi(tahun):
+    """(tahunan per kategori, bulanan per kategori-bulan) anggaran vs realisasi dari tabel rekap"""
+    conn = get_connection()
+    try:
+        return budget.annual_budget_vs_actual(conn, tahun), budget.monthly_budget_vs_actual(conn, tahun)
+    finally:
+        conn.close()
+
+@st.cache_data(ttl=300)
+def get_rekap_pengeluaran(tahun):
+    """Realisasi pengeluaran kategori x bulan satu tahun"""
+    conn = get_connection()
+    try:
+        return budget.spend_matrix(conn, tahun)
+    finally:
+        conn.close()
+
+# ==================== FUNGSI TUTUP BUKU ====================
+
+def tutup_buku(tahun, bulan, closed_by=None, force=False):
+    """Tutup buku satu periode (utils.closing.close_period); mengembalikan ringkasan yang dibekukan"""
+    conn = get_connection()
+    try:
+        summary = closing.close_period(conn, tahun, bulan, closed_by=closed_by, force=force)
+        conn.commit()
+        invalidate_data()
+        return summary
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+def buka_tutup_buku(tahun, bulan):
+    """Buka kembali periode yang sudah ditutup (snapshot dihapus, laporan kembali dihitung live)"""
+    conn = get_connection()
+    try:
+        reopened = closing.reopen_period(conn, tahun, bulan)
+        conn.commit()
+        invalidate_data()
+        return reopened
+    finally:
+        conn.close()
+
+@st.cache_data(ttl=300)
+def get_tutup_buku():
+    """Daftar periode yang sudah ditutup beserta ringkasan bekunya"""
+    conn = get_connection()
+    try:
+        return closing.closed_periods(conn)
+    finally:
+        conn.close()
+
+def get_ringkasan_periode(tahun, bulan):
+    """Ringkasan live satu periode (pratinjau sebelum tutup buku)"""
+    conn = get_connection()
+    try:
+        return closing.period_summary(conn, tahun, bulan)
+    finally:
+        conn.close()
+
+def periksa_tutup_buku(tahun, bulan):
+    """Kolom ringkasan beku yang tidak lagi cocok dengan data live (kosong = utuh)"""
+    conn = get_connection()
+    try:
+        return closing.verify_period(conn, tahun, bulan)
+    finally:
+        conn.close()
+
+# ==================== FUNGSI REPORT & ADMIN ====================
+
+@st.cache_resource
+def get_analytics_engine():
+    """Engine query laporan (utils.analytics): DuckDB di atas sumber laporan bila terpasang, selain itu SQLite.
+
+    Sumbernya sama dengan get_report_connection(): snapshot read-only pada mode 'snapshot',
+    database utama pada mode 'live'.
+    """
+    source = ensure_snapshot if REPORT_MODE == 'snapshot' else (lambda: DB_PATH)
+    return create_engine(source, get_report_connection)
+
+def report_generation():
+    """Kunci versi untuk hasil get_report dan turunannya (figure grafik).
+
+    Mode 'live' membaca database utama (generasi data), mode 'snapshot' membaca snapshot
+    yang baru berubah setelah refresh latar belakang selesai (generasi snapshot).
+    """
+    return data_generation(), snapshot_generation()
+
+def get_report(name, params=()):
+    """Hasil query laporan utils.analytics.REPORTS[name]; SQLite menjadi fallback jika DuckDB gagal.
+
+    Cache dikunci report_generation(): hasil dari snapshot lama tidak dipakai lagi setelah
+    refresh latar belakang selesai.
+    """
+    return _get_report(name, tuple(params), report_generation())
+
+@st.cache_data(ttl=300)
+def _get_report(name, params, generation):
+    fallback = SQLiteEngine(get_report_connection)
+    if name not in closing.SNAPSHOT_REPORTS:
+        return run_report(get_analytics_engine(), name, params, fallback=fallback)
+    # Periode tertutup dibaca dari snapshot tutup buku, REPORTS hanya menghitung periode terbuka.
+    # Kedua bagian dibaca dalam satu pembacaan engine agar tutup buku di antaranya tidak
+    # membuat satu periode terhitung dua kali atau hilang.
+    live, frozen = run_queries(get_analytics_engine(),
+                               [(REPORTS[name], params), (closing.SNAPSHOT_REPORTS[name], params)],
+                               fallback, label=f"laporan '{name}'")
+    return closing.merge_report(name, live, frozen)
+
 def get_pending_changes():
     conn = get_connection()
     try:
@@ -280,7 +939,7 @@ def update_pending_change_status(change_id, status, reviewer_id):
             WHERE id = ?
         ''', (status, reviewer_id, change_id))
         conn.commit()
-        st.cache_data.clear()
+        invalidate_data()
         return True
     except:
         return False
@@ -288,7 +947,7 @@ def update_pending_change_status(change_id, status, reviewer_id):
         conn.close()
 
 def get_change_history():
-    conn = get_connection()
+    conn = get_report_connection()
     try:
         query = '''
             SELECT pc.*, u1.username as requested_by_name, u2.username as reviewed_by_name
@@ -305,6 +964,38 @@ def get_change_history():
         conn.close()
 
 # ==================== FUNGSI Pengaturan ====================
+
+# Nilai bawaan untuk kunci yang belum pernah disimpan
+DEFAULT_SETTINGS = {
+    'batas_waktu': DEFAULT_BATAS_WAKTU,
+    'notifikasi_email': False,
+}
+
+@st.cache_data(ttl=300)
+def get_settings():
+    """Pengaturan aplikasi dari tabel pengaturan, dilengkapi DEFAULT_SETTINGS"""
+    conn = get_connection()
+    try:
+        stored = {kunci: json.loads(nilai) for kunci, nilai in conn.execute("SELECT kunci, nilai FROM pengaturan")}
+    finally:
+        conn.close()
+    return {**DEFAULT_SETTINGS, **stored}
+
+def save_settings(values, updated_by=None):
+    """Simpan beberapa pengaturan sekaligus (upsert per kunci)"""
+    conn = get_connection()
+    try:
+        conn.executemany('''
+            INSERT INTO pengaturan (kunci, nilai, updated_by, updated_at) VALUES (?, ?, ?, datetime('now', 'localtime'))
+            ON CONFLICT(kunci) DO UPDATE SET
+                nilai=excluded.nilai, updated_by=excluded.updated_by, updated_at=excluded.updated_at
+        ''', [(kunci, json.dumps(nilai), updated_by) for kunci, nilai in values.items()])
+        conn.commit()
+        get_settings.clear()
+        return True
+    finally:
+        conn.close()
+
 def update_user(user_id, username, nama_lengkap, role, status):
     """Memperbarui data user berdasarkan ID."""
     try:
@@ -317,11 +1008,23 @@ def update_user(user_id, username, nama_lengkap, role, status):
         """, (username, nama_lengkap, role, status, user_id))
         conn.commit()
         conn.close()
+        invalidate_user_frames()
         return True
     except Exception as e:
         print(f"Error update_user: {e}")
         return False
-    
+
+def delete_user(user_id):
+    """Menghapus user berdasarkan ID."""
+    conn = get_connection()
+    try:
+        conn.execute("DELETE FROM users WHERE id = ?", (user_id,))
+        conn.commit()
+    finally:
+        conn.close()
+    invalidate_user_frames()
+    return True
+
 
 # ==================== FUNGSI USERS & PENGELUARAN ====================
 
@@ -333,29 +1036,43 @@ def authenticate_user(username, password):
     conn.close()
     return user
 
-def get_all_users():
+def get_all_users(columns=USER_COLUMNS):
+    """Data user tanpa kolom password kecuali diminta eksplisit lewat columns"""
     conn = get_connection()
-    df = pd.read_sql_query("SELECT * FROM users ORDER BY created_at DESC", conn)
+    df = pd.read_sql_query(f"SELECT {select_list('users', columns)} FROM users ORDER BY created_at DESC", conn)
     conn.close()
     return df
 
+@st.cache_resource(ttl=300)
+def get_user_directory():
+    """Direktori user dengan index id/username dan label opsi siap pakai"""
+    return user_directory(shared_frame('users'))
+
+def invalidate_user_frames():
+    """Muat ulang frame bersama dan direktori user setelah tabel users berubah"""
+    get_frame_registry().invalidate('users')
+    get_user_directory.clear()
+
 def add_user(data):
     conn = get_connection()
     cursor = conn.cursor()
     try:
         cursor.execute('INSERT INTO users (username, password, nama_lengkap, role, status) VALUES (?, ?, ?, ?, ?)', data)
         conn.commit()
+        invalidate_user_frames()
         return True
     finally:
         conn.close()
 
 @st.cache_data(ttl=300)
-def get_all_pengeluaran():
+def get_all_pengeluaran(columns=None):
     conn = get_connection()
     try:
-        df = pd.read_sql_query("SELECT * FROM pengeluaran ORDER BY tanggal DESC", conn)
-        return df
-    except:
+        query = f"SELECT {select_list('pengeluaran', columns)} FROM pengeluaran ORDER BY tanggal DESC"
+        return read_sql_typed(query, conn, PENGELUARAN_SCHEMA)
+    except (sqlite3.OperationalError, pd.errors.DatabaseError) as e:
+        # Tabel belum ada / database terkunci: tampilkan kosong, kesalahan lain tetap naik
+        print(f"Error get_all_pengeluaran: {e}")
         return pd.DataFrame()
     finally:
         conn.close()
@@ -364,9 +1081,15 @@ def add_pengeluaran(data):
     conn = get_connection()
     cursor = conn.cursor()
     try:
+        if data[3]:
+            closing.ensure_open_date(conn, data[3])
         cursor.execute('INSERT INTO pengeluaran (kategori, deskripsi, jumlah, tanggal, bukti, disetujui_oleh) VALUES (?, ?, ?, ?, ?, ?)', data)
+        tanggal_kas = cursor.execute(
+            f"SELECT {ledger.TANGGAL_PENGELUARAN} FROM pengeluaran WHERE id=?", (cursor.lastrowid,)).fetchone()[0]
+        ledger.refresh_balances(conn, ledger.date_key(tanggal_kas))
+        budget.record_spend(conn, data[0], tanggal_kas, data[2])
         conn.commit()
-        st.cache_data.clear()
+        invalidate_data()
         return cursor.lastrowid
     finally:
         conn.close()
@@ -374,21 +1097,48 @@ def add_pengeluaran(data):
 
 def delete_pengeluaran(pengeluaran_id):
     """Menghapus data pengeluaran berdasarkan ID"""
+    return bool(delete_pengeluaran_batch([pengeluaran_id]))
+
+def delete_pengeluaran_batch(pengeluaran_ids):
+    """Menghapus beberapa pengeluaran dalam satu transaksi.
+
+    Semua periode dicek dulu: jika satu saja sudah ditutup buku, PeriodClosedError dilempar
+    sebelum ada yang dihapus. Mengembalikan daftar id yang benar-benar dihapus (id yang tidak
+    ditemukan tidak termasuk), atau None jika gagal (tidak ada yang dihapus).
+    """
+    pengeluaran_ids = [int(pid) for pid in pengeluaran_ids]
+    if not pengeluaran_ids:
+        return []
     conn = get_connection()
-    cursor = conn.cursor()
     try:
-        cursor.execute('DELETE FROM pengeluaran WHERE id = ?', (pengeluaran_id,))
+        placeholders = ", ".join("?" * len(pengeluaran_ids))
+        rows = conn.execute(
+            f"SELECT id, {ledger.TANGGAL_PENGELUARAN}, kategori, jumlah FROM pengeluaran WHERE id IN ({placeholders})",
+            pengeluaran_ids).fetchall()
+        for _, tanggal, _, _ in rows:
+            closing.ensure_open_date(conn, tanggal)
+        deleted = [row[0] for row in rows]
+        if not deleted:
+            return []
+        conn.execute(f"DELETE FROM pengeluaran WHERE id IN ({', '.join('?' * len(deleted))})", deleted)
+        keys = [key for key in (ledger.date_key(row[1]) for row in rows) if key is not None]
+        if keys:
+            ledger.refresh_balances(conn, min(keys))
+        for _, tanggal, kategori, jumlah in rows:
+            budget.record_spend(conn, kategori, tanggal, jumlah, sign=-1)
         conn.commit()
-        st.cache_data.clear() # Membersihkan cache agar daftar di UI langsung terupdate
-        return True
+        invalidate_data() # Membersihkan cache agar daftar di UI langsung terupdate
+        return deleted
+    except PeriodClosedError:
+        raise
     except Exception as e:
         conn.rollback()
-        print(f"Error delete_pengeluaran: {e}")
-        return False
+        print(f"Error delete_pengeluaran_batch: {e}")
+        return None
     finally:
         conn.close()
 
 # ==================== INISIALISASI ====================
 
 if __name__ == "__main__":
-    init_db()
\ No newline at end of file
+    init_db(force=True)
\ No newline at end of file
@@ -0,0 +1,95 @@
+import re
+
+import pyarrow as pa
+
+from utils.formatters import house_labels, join_labels
+from utils.typeahead import SEARCH_COLUMNS, PrefixIndex
+
+# ==================== NATURAL SORT ====================
+
+_DIGITS = re.compile(r'(\d+)')
+
+def natural_key(text):
+    """Kunci urut natural: 'A-2' sebelum 'A-10' (bagian angka dibandingkan sebagai angka)"""
+    parts = _DIGITS.split(str(text).strip().lower())
+    return tuple(int(part) if i % 2 else part for i, part in enumerate(parts))
+
+# ==================== DIREKTORI RECORD ====================
+
+class RecordDirectory:
+    """Direktori record siap pakai untuk selectbox dan lookup.
+
+    Dibangun sekali dari DataFrame lalu di-cache: record disimpan berurutan,
+    label opsi sudah jadi, dan index dict per kolom kunci membuat lookup O(1)
+    tanpa memindai DataFrame atau memecah string label.
+    """
+
+    def __init__(self, df, index_columns, labels, sort_column=None, search_columns=None):
+        if sort_column and not df.empty:
+            keys = [natural_key(value) for value in df[sort_column].tolist()]
+            order = sorted(range(len(keys)), key=keys.__getitem__)
+            df = df.iloc[order].reset_index(drop=True)
+        self.frame = df
+        self.records = df.to_dict('records')
+        self.labels = tuple(labels(df)) if not df.empty else ()
+        self._by_label = dict(zip(self.labels, self.records))
+        self._label_by_id = dict(zip((r['id'] for r in self.records), self.labels))
+        self._indexes = {
+            column: {record[column]: record for record in self.records}
+            for column in index_columns
+        }
+        self._arrow = None
+        self._search_columns = search_columns
+        self._search_index = None
+
+    def __len__(self):
+        return len(self.records)
+
+    @property
+    def empty(self):
+        return not self.records
+
+    @property
+    def arrow(self):
+        """Frame sebagai pyarrow.Table (dikonversi sekali per direktori) untuk st.dataframe tanpa konversi per rerun"""
+        if self._arrow is None:
+            self._arrow = pa.Table.from_pandas(self.frame, preserve_index=False)
+        return self._arrow
+
+    @property
+    def search_index(self):
+        """Index typeahead atas record direktori ini (dibangun sekali, perlu search_columns).
+
+        Posisi hasil pencarian sejajar dengan records/frame/arrow direktori yang sama,
+        sehingga index tidak bisa tertinggal dari direktorinya.
+        """
+        if self._search_index is None:
+            self._search_index = PrefixIndex(self.records, self._search_columns)
+        return self._search_index
+
+    def get(self, column, value, default=None):
+        """Record dengan nilai kolom kunci tertentu, misal get('no_rumah', 'A-01')"""
+        return self._indexes[column].get(value, default)
+
+    def by_label(self, label, default=None):
+        """Record untuk label opsi selectbox"""
+        return self._by_label.get(label, default)
+
+    def options(self, ids=None):
+        """Label opsi; jika ids diberikan hanya label untuk id tersebut (urutan ids)"""
+        if ids is None:
+            return list(self.labels)
+        return [self._label_by_id[i] for i in ids if i in self._label_by_id]
+
+# ==================== DIREKTORI WARGA & USER ====================
+
+def resident_directory(df):
+    """Direktori warga: index id dan no_rumah, label 'no_rumah - nama_kepala_keluarga', pencarian SEARCH_COLUMNS"""
+    return RecordDirectory(df, ['id', 'no_rumah'], house_labels, sort_column='no_rumah',
+                           search_columns=SEARCH_COLUMNS)
+
+def user_directory(df):
+    """Direktori user: index id dan username, label 'username - nama_lengkap (role)'"""
+    def labels(frame):
+        return join_labels(frame, ['username', 'nama_lengkap']) + ' (' + frame['role'].astype(str) + ')'
+    return RecordDirectory(df, ['id', 'username'], labels)
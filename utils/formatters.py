@@ -0,0 +1,29 @@
+import numpy as np
+import pandas as pd
+from utils.helpers import format_currency_series, month_name_series
+
+# ==================== FORMAT KOLOM (VEKTORISASI) ====================
+
+def month_labels(bulan, full=False):
+    """Nama bulan 'Jan' / 'Januari' untuk seluruh kolom nomor bulan (lihat helpers.month_name_series)"""
+    return month_name_series(bulan, short=not full)
+
+def period_labels(bulan, tahun, full=False):
+    """Label periode 'Agu 2026' dari kolom bulan dan tahun"""
+    tahun = pd.Series(tahun)
+    return month_labels(bulan, full=full) + ' ' + tahun.astype(np.int64).astype(str).to_numpy()
+
+def join_labels(df, columns, sep=' - '):
+    """Gabungkan beberapa kolom menjadi satu label teks, misal 'A-01 - Budi'"""
+    result = df[columns[0]].astype(str)
+    for col in columns[1:]:
+        result = result + sep + df[col].astype(str)
+    return result
+
+def house_labels(df, sep=' - '):
+    """Label pilihan warga 'no_rumah - nama_kepala_keluarga'"""
+    return join_labels(df, ['no_rumah', 'nama_kepala_keluarga'], sep=sep)
+
+def currency_column(values):
+    """Format seluruh kolom angka ke 'Rp 1,000' (lihat helpers.format_currency_series)"""
+    return format_currency_series(values)
@@ -0,0 +1,76 @@
+import threading
+import time
+
+import pandas as pd
+
+# ==================== KONFIGURASI PANDAS ====================
+# Copy-on-write: hasil filter/slice berbagi memori dengan frame asal dan baru disalin
+# saat benar-benar diubah, sehingga frame bersama aman dibaca banyak sesi tanpa .copy()
+pd.set_option('mode.copy_on_write', True)
+
+# ==================== REGISTRY FRAME BERSAMA ====================
+
+class FrameRegistry:
+    """Registry DataFrame read-only yang dipakai bersama oleh semua sesi.
+
+    Setiap nama punya satu loader; frame dimuat sekali, disimpan satu salinan
+    per proses, dan setiap get() mengembalikan shallow copy copy-on-write
+    (tanpa menyalin data). Sesi cukup menyimpan state filter, bukan DataFrame.
+    Versi naik setiap kali frame dimuat ulang sehingga sesi bisa mendeteksi data baru.
+    """
+
+    def __init__(self):
+        self._loaders = {}
+        self._entries = {}
+        self._versions = {}
+        self._lock = threading.Lock()
+
+    def register(self, name, loader, ttl=None):
+        """Daftarkan loader tanpa argumen yang mengembalikan DataFrame; ttl dalam detik (None = tanpa batas)"""
+        with self._lock:
+            self._loaders[name] = (loader, ttl)
+            self._entries.pop(name, None)
+
+    def _entry(self, name):
+        loader, ttl = self._loaders[name]
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is not None and (ttl is None or time.monotonic() - entry[1] < ttl):
+                return entry
+            frame = loader()
+            version = self._versions.get(name, 0) + 1
+            entry = (frame, time.monotonic(), version)
+            self._entries[name] = entry
+            self._versions[name] = version
+            return entry
+
+    def get(self, name):
+        """Frame bersama sebagai shallow copy copy-on-write (perubahan pemanggil tidak bocor ke sesi lain)"""
+        return self._entry(name)[0].copy(deep=False)
+
+    def version(self, name):
+        """Versi frame saat ini (naik setiap dimuat ulang)"""
+        return self._entry(name)[2]
+
+    def invalidate(self, name=None):
+        """Buang frame tertentu (atau semua) agar dimuat ulang pada get() berikutnya"""
+        with self._lock:
+            if name is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(name, None)
+
+    def info(self):
+        """Ringkasan frame yang sedang dimuat: baris, memori (KB), versi dan umur (detik)"""
+        with self._lock:
+            entries = dict(self._entries)
+        now = time.monotonic()
+        return {
+            name: {
+                'rows': len(frame),
+                'kb': round(frame.memory_usage(deep=True).sum() / 1024, 1),
+                'version': version,
+                'age': round(now - loaded_at, 1),
+            }
+            for name, (frame, loaded_at, version) in entries.items()
+        }
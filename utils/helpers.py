@@ -1,31 +1,122 @@
+import numpy as np
 import pandas as pd
 from datetime import datetime
 import json
+import re
+
+MONTH_NAMES_ID = np.array([
+    '', 'Januari', 'Februari', 'Maret', 'April', 'Mei', 'Juni',
+    'Juli', 'Agustus', 'September', 'Oktober', 'November', 'Desember'
+], dtype=object)
+# Singkatan tiga huruf (Jan, Feb, ..., Agu, ..., Des); satu-satunya tabel nama bulan di aplikasi
+MONTH_ABBR_ID = np.array([name[:3] for name in MONTH_NAMES_ID], dtype=object)
+
+DATETIME_INPUT_FORMATS = [
+    '%Y-%m-%d %H:%M:%S',
+    '%Y-%m-%d',
+    '%d-%m-%Y %H:%M:%S',
+    '%d-%m-%Y'
+]
+
+# Lookup angka 2 digit untuk menyusun teks tanggal tanpa strftime per elemen
+_PAD2 = np.array([f"{i:02d}" for i in range(100)], dtype=object)
+_FAST_DIRECTIVES = {
+    '%d': lambda dt: _PAD2[dt.dt.day.to_numpy()],
+    '%m': lambda dt: _PAD2[dt.dt.month.to_numpy()],
+    '%Y': lambda dt: dt.dt.year.astype(str).to_numpy(dtype=object),
+    '%H': lambda dt: _PAD2[dt.dt.hour.to_numpy()],
+    '%M': lambda dt: _PAD2[dt.dt.minute.to_numpy()],
+    '%S': lambda dt: _PAD2[dt.dt.second.to_numpy()],
+}
+
+# ==================== FORMAT KOLOM (SERIES) ====================
+
+def _strftime_series(parsed, fmt):
+    """strftime untuk seluruh kolom; format dengan %d %m %Y %H %M %S disusun dari lookup array"""
+    tokens = [t for t in re.split(r'(%.)', fmt) if t]
+    if any(t.startswith('%') and t not in _FAST_DIRECTIVES for t in tokens) or parsed.isna().all():
+        return parsed.dt.strftime(fmt)
+    valid = parsed.notna()
+    filled = parsed.fillna(pd.Timestamp(2000, 1, 1))
+    out = np.full(len(parsed), '', dtype=object)
+    for token in tokens:
+        out = out + (_FAST_DIRECTIVES[token](filled) if token in _FAST_DIRECTIVES else token)
+    return pd.Series(out, index=parsed.index).where(valid)
+
+def format_currency_series(values):
+    """Format seluruh kolom angka ke format mata uang Indonesia"""
+    values = pd.Series(values)
+    amounts = pd.to_numeric(values, errors='coerce').fillna(0).astype(np.int64)
+    # Pemisah ribuan tidak tersedia sebagai operasi string pandas; list comprehension
+    # atas integer native tetap jauh lebih ringan daripada apply() per sel
+    return pd.Series([f"Rp {v:,}" for v in amounts.tolist()], index=values.index, dtype=object)
+
+def _format_unique(values, formatter):
+    """Format hanya nilai unik lalu sebarkan kembali; kolom tanggal ledger sangat berulang"""
+    values = pd.Series(values)
+    codes, uniques = pd.factorize(values.astype(object))
+    formatted = np.append(formatter(pd.Series(uniques, dtype=object)).to_numpy(dtype=object), "")
+    return pd.Series(formatted[codes], index=values.index)
+
+def _fallback_text(values, formatted):
+    """Isi sel yang gagal diparse dengan teks aslinya"""
+    return formatted.where(formatted.notna(), values.astype(str))
+
+def _parse_datetime_formats(text):
+    """Parse teks tanggal dengan DATETIME_INPUT_FORMATS, satu panggilan to_datetime per format"""
+    parsed = pd.Series(pd.NaT, index=text.index, dtype='datetime64[ns]')
+    for fmt in DATETIME_INPUT_FORMATS:
+        todo = parsed.isna()
+        if not todo.any():
+            break
+        parsed[todo] = pd.to_datetime(text[todo], format=fmt, errors='coerce')
+    return parsed
+
+def format_date_series(values, format_from='%Y-%m-%d', format_to='%d-%m-%Y'):
+    """Format seluruh kolom tanggal dari satu format ke format lain"""
+    def _format(uniques):
+        parsed = pd.to_datetime(uniques.astype(str), format=format_from, errors='coerce')
+        return _fallback_text(uniques, _strftime_series(parsed, format_to))
+    return _format_unique(values, _format)
+
+def format_datetime_series(values):
+    """Format seluruh kolom datetime untuk display, mencoba setiap format input sekali per kolom"""
+    def _format(uniques):
+        parsed = _parse_datetime_formats(uniques.astype(str))
+        return _fallback_text(uniques, _strftime_series(parsed, '%d-%m-%Y %H:%M'))
+    return _format_unique(values, _format)
+
+def month_name_series(values, short=False):
+    """Nama bulan (Bahasa Indonesia) untuk seluruh kolom nomor bulan (nilai di luar 1-12 menjadi '')"""
+    values = pd.Series(values)
+    idx = pd.to_numeric(values, errors='coerce').fillna(0).astype(np.int64).to_numpy()
+    idx = np.where((idx >= 1) & (idx <= 12), idx, 0)
+    lookup = MONTH_ABBR_ID if short else MONTH_NAMES_ID
+    return pd.Series(lookup[idx], index=values.index)
+
+# ==================== FORMAT NILAI TUNGGAL ====================
+
+# Nilai tunggal diformat dengan operasi Python native; fungsi *_series di atas hanya
+# untuk seluruh kolom (membungkus satu nilai ke Series jauh lebih lambat)
 
 def format_currency(value):
     """Format angka ke format mata uang Indonesia"""
-    if pd.isna(value) or value is None:
+    if value is None or pd.isna(value):
         return "Rp 0"
     return f"Rp {int(value):,}"
 
 def format_date(date_str, format_from='%Y-%m-%d', format_to='%d-%m-%Y'):
     """Format tanggal dari satu format ke format lain"""
-    if pd.isna(date_str) or date_str is None:
+    if date_str is None or pd.isna(date_str):
         return ""
-    
     try:
-        date_obj = datetime.strptime(str(date_str), format_from)
-        return date_obj.strftime(format_to)
-    except:
+        return datetime.strptime(str(date_str), format_from).strftime(format_to)
+    except ValueError:
         return str(date_str)
 
 def get_month_name(month_num):
     """Dapatkan nama bulan dari angka bulan"""
-    months = [
-        '', 'Januari', 'Februari', 'Maret', 'April', 'Mei', 'Juni',
-        'Juli', 'Agustus', 'September', 'Oktober', 'November', 'Desember'
-    ]
-    return months[month_num] if 1 <= month_num <= 12 else ''
+    return MONTH_NAMES_ID[month_num] if 1 <= month_num <= 12 else ''
 
 def calculate_age(tanggal_lahir):
     """Hitung umur dari tanggal lahir"""
@@ -125,25 +216,11 @@ def load_json_safe(json_str, default=None):
 
 def format_datetime_for_display(dt_str):
     """Format datetime string untuk display"""
-    if pd.isna(dt_str) or dt_str is None:
+    if dt_str is None or pd.isna(dt_str):
         return ""
-    
-    try:
-        # Coba berbagai format
-        formats = [
-            '%Y-%m-%d %H:%M:%S',
-            '%Y-%m-%d',
-            '%d-%m-%Y %H:%M:%S',
-            '%d-%m-%Y'
-        ]
-        
-        for fmt in formats:
-            try:
-                dt_obj = datetime.strptime(str(dt_str), fmt)
-                return dt_obj.strftime('%d-%m-%Y %H:%M')
-            except:
-                continue
-        
-        return str(dt_str)
-    except:
-        return str(dt_str)
\ No newline at end of file
+    for fmt in DATETIME_INPUT_FORMATS:
+        try:
+            return datetime.strptime(str(dt_str), fmt).strftime('%d-%m-%Y %H:%M')
+        except ValueError:
+            continue
+    return str(dt_str)
\ No newline at end of file
@@ -0,0 +1,41 @@
+import importlib
+import sys
+
+# ==================== IMPORT TERTUNDA ====================
+# Modul berat (plotly, openpyxl) baru diimpor saat atributnya pertama kali dipakai,
+# misal saat grafik benar-benar dirender atau file Excel dibuat. Halaman tanpa
+# grafik dan layar login tidak ikut menanggung waktu impornya.
+
+class LazyModule:
+    """Proxy modul yang mengimpor modul aslinya pada akses atribut pertama"""
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def _load(self):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return self._module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __repr__(self):
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<LazyModule '{self._name}' ({state})>"
+
+def lazy_import(name):
+    """Modul langsung dikembalikan jika sudah diimpor, selain itu proxy LazyModule"""
+    if name in sys.modules:
+        return sys.modules[name]
+    return LazyModule(name)
+
+def is_loaded(name):
+    """True jika modul sudah benar-benar diimpor di proses ini"""
+    return name in sys.modules
+
+# ==================== MODUL BERAT ====================
+# openpyxl tidak perlu proxy: pandas baru mengimpornya di dalam pd.ExcelWriter
+px = lazy_import('plotly.express')
+pio = lazy_import('plotly.io')
@@ -0,0 +1,125 @@
+import pandas as pd
+
+# ==================== ARUS KAS ====================
+# Pemasukan = pembayaran terverifikasi pada tanggal_bayar (periode iuran bila kosong);
+# pengeluaran = tabel pengeluaran pada tanggal (tanggal input bila kosong). Ekspresi tanggal
+# dipakai sama persis oleh index ekspresi di SCHEMA_DDL agar filter rentang memakai index.
+
+TANGGAL_PEMASUKAN = "COALESCE(tanggal_bayar, printf('%04d-%02d-01', tahun, bulan))"
+TANGGAL_PENGELUARAN = "COALESCE(tanggal, substr(created_at, 1, 10))"
+
+def _period_key(column):
+    """Nomor bulan absolut (tahun * 12 + bulan - 1) dari kolom tanggal teks"""
+    return f"(CAST(substr({column}, 1, 4) AS INTEGER) * 12 + CAST(substr({column}, 6, 2) AS INTEGER) - 1)"
+
+def date_key(tanggal):
+    """Nomor bulan absolut dari tanggal teks/date ('YYYY-MM-...'); None jika tidak terbaca"""
+    try:
+        text = str(tanggal)
+        return int(text[:4]) * 12 + int(text[5:7]) - 1
+    except (TypeError, ValueError):
+        return None
+
+def month_start(key):
+    """Tanggal awal bulan 'YYYY-MM-01' untuk nomor bulan absolut"""
+    return f"{key // 12:04d}-{key % 12 + 1:02d}-01"
+
+def cash_flow_sql(where_pemasukan="1", where_pengeluaran="1"):
+    """UNION pembayaran terverifikasi dan pengeluaran sebagai baris (tanggal, jenis, keterangan, masuk, keluar)"""
+    return f'''
+        SELECT {TANGGAL_PEMASUKAN} AS tanggal, 'pemasukan' AS jenis,
+               'Iuran ' || printf('%02d/%04d', bulan, tahun) || ' #' || warga_id AS keterangan,
+               jumlah AS masuk, 0 AS keluar, id
+        FROM pembayaran
+        WHERE status='verified' AND {where_pemasukan}
+        UNION ALL
+        SELECT {TANGGAL_PENGELUARAN}, 'pengeluaran', kategori || COALESCE(': ' || deskripsi, ''),
+               0, jumlah, id
+        FROM pengeluaran
+        WHERE {where_pengeluaran}
+    '''
+
+# ==================== SALDO BULANAN ====================
+
+def refresh_balances(conn, from_key=None):
+    """Materialisasi saldo penutupan bulanan mulai nomor bulan from_key (None = bangun ulang semua).
+
+    Hanya transaksi sejak awal bulan from_key yang dibaca (lewat index tanggal); saldo awal
+    diambil dari saldo_akhir bulan sebelumnya yang sudah tersimpan. Bulan tanpa transaksi
+    tetap diisi agar deret saldo kontinu. Tidak melakukan commit.
+    """
+    if from_key is not None:
+        previous = conn.execute(
+            "SELECT MAX(tahun * 12 + bulan - 1) FROM saldo_bulanan WHERE tahun * 12 + bulan - 1 < ?",
+            (int(from_key),)).fetchone()[0]
+        # Bulan sebelum from_key belum pernah dimaterialisasi: mulai dari bulan terakhir yang ada
+        if previous is None or previous < from_key - 1:
+            from_key = None if previous is None else previous + 1
+    if from_key is None:
+        first = conn.execute(f'''
+            SELECT MIN(k) FROM (
+                SELECT MIN({TANGGAL_PEMASUKAN}) AS k FROM pembayaran WHERE status='verified'
+                UNION ALL SELECT MIN({TANGGAL_PENGELUARAN}) FROM pengeluaran)
+        ''').fetchone()[0]
+        conn.execute("DELETE FROM saldo_bulanan")
+        if first is None:
+            return 0
+        from_key = int(first[:4]) * 12 + int(first[5:7]) - 1
+        opening = 0
+    else:
+        opening = conn.execute(
+            "SELECT saldo_akhir FROM saldo_bulanan WHERE tahun * 12 + bulan - 1 = ?", (from_key - 1,)).fetchone()
+        opening = opening[0] if opening else 0
+        conn.execute("DELETE FROM saldo_bulanan WHERE tahun * 12 + bulan - 1 >= ?", (int(from_key),))
+
+    since = month_start(from_key)
+    flow = cash_flow_sql(f"{TANGGAL_PEMASUKAN} >= :since", f"{TANGGAL_PENGELUARAN} >= :since")
+    before = conn.total_changes
+    conn.execute(f'''
+        WITH arus AS ({flow}),
+        per_bulan AS (
+            SELECT {_period_key('tanggal')} AS k, SUM(masuk) AS masuk, SUM(keluar) AS keluar
+            FROM arus GROUP BY 1
+        ),
+        kalender(k) AS (
+            SELECT :from_key
+            UNION ALL SELECT k + 1 FROM kalender WHERE k < (SELECT MAX(k) FROM per_bulan)
+        )
+        INSERT INTO saldo_bulanan (tahun, bulan, pemasukan, pengeluaran, saldo_akhir)
+        SELECT c.k / 12, c.k % 12 + 1, COALESCE(p.masuk, 0), COALESCE(p.keluar, 0),
+               :opening + SUM(COALESCE(p.masuk, 0) - COALESCE(p.keluar, 0)) OVER (ORDER BY c.k)
+        FROM kalender c LEFT JOIN per_bulan p ON p.k = c.k
+        WHERE (SELECT MAX(k) FROM per_bulan) IS NOT NULL
+    ''', {'since': since, 'from_key': int(from_key), 'opening': opening})
+    return conn.total_changes - before
+
+def monthly_balances(conn):
+    """Saldo penutupan bulanan yang sudah dimaterialisasi (tanpa scan transaksi)"""
+    df = pd.read_sql_query('''
+        SELECT tahun, bulan, pemasukan, pengeluaran, saldo_akhir
+        FROM saldo_bulanan ORDER BY tahun, bulan
+    ''', conn)
+    df['periode'] = pd.to_datetime(dict(year=df['tahun'], month=df['bulan'], day=1))
+    return df
+
+# ==================== BUKU KAS ====================
+
+def cash_book(conn, from_key, to_key):
+    """Transaksi kas bulan from_key..to_key dengan saldo berjalan (window function).
+
+    Saldo awal diambil dari saldo_bulanan bulan sebelum from_key sehingga hanya
+    transaksi di rentang itu yang dibaca.
+    """
+    opening = conn.execute(
+        "SELECT saldo_akhir FROM saldo_bulanan WHERE tahun * 12 + bulan - 1 < ? ORDER BY tahun DESC, bulan DESC LIMIT 1",
+        (int(from_key),)).fetchone()
+    opening = opening[0] if opening else 0
+    flow = cash_flow_sql(f"{TANGGAL_PEMASUKAN} >= :since AND {TANGGAL_PEMASUKAN} < :until",
+                         f"{TANGGAL_PENGELUARAN} >= :since AND {TANGGAL_PENGELUARAN} < :until")
+    return pd.read_sql_query(f'''
+        SELECT tanggal, jenis, keterangan, masuk, keluar,
+               :opening + SUM(masuk - keluar) OVER (ORDER BY tanggal, jenis, id
+                                                   ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW) AS saldo
+        FROM ({flow})
+        ORDER BY tanggal, jenis, id
+    ''', conn, params={'since': month_start(from_key), 'until': month_start(to_key + 1), 'opening': opening})
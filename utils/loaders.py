@@ -0,0 +1,125 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+# ==================== SKEMA PER QUERY ====================
+# Kolom teks yang berulang di setiap baris dimuat sebagai 'category', angka kecil
+# memakai integer sempit, dan kolom tanggal diparse sekali saat dimuat.
+
+PEMBAYARAN_SCHEMA = {
+    'id': 'int64',
+    'warga_id': 'int32',
+    'bulan': 'uint8',
+    'tahun': 'uint16',
+    'jumlah': 'int64',
+    'tanggal_bayar': 'datetime',
+    'metode_bayar': 'category',
+    'status': 'category',
+    'verified_by': 'int32',
+    'verified_at': 'datetime',
+    'created_at': 'datetime',
+    'no_rumah': 'category',
+    'nama_kepala_keluarga': 'category',
+}
+
+PENGELUARAN_SCHEMA = {
+    'id': 'int64',
+    'kategori': 'category',
+    'jumlah': 'int64',
+    'tanggal': 'datetime',
+    'created_at': 'datetime',
+}
+
+# ==================== KONVERSI TIPE ====================
+
+# Padanan nullable pandas untuk kolom integer yang berisi NULL
+_NULLABLE_INT = {'uint8': 'UInt8', 'uint16': 'UInt16', 'int32': 'Int32', 'int64': 'Int64'}
+
+def _fit_int(series, dtype):
+    """Integer sempit sesuai skema; melebar ke int64 jika nilai di luar jangkauan,
+    dan memakai tipe nullable pandas (mis. 'UInt8') jika kolom berisi NULL"""
+    values = pd.to_numeric(series, errors='coerce')
+    info = np.iinfo(dtype)
+    if values.notna().any() and (values.min() < info.min or values.max() > info.max):
+        dtype = 'int64'
+    if values.isna().any():
+        return values.astype(_NULLABLE_INT[dtype])
+    return values.astype(dtype)
+
+def apply_schema(df, schema):
+    """Terapkan skema dtype ke DataFrame hasil query (kolom di luar skema dibiarkan)"""
+    for col, dtype in schema.items():
+        if col not in df.columns:
+            continue
+        if dtype == 'datetime':
+            df[col] = pd.to_datetime(df[col], errors='coerce')
+        elif dtype == 'category':
+            df[col] = df[col].astype('category')
+        else:
+            df[col] = _fit_int(df[col], dtype)
+    return df
+
+def read_sql_typed(query, conn, schema, params=None):
+    """pd.read_sql_query dengan skema dtype yang dideklarasikan per query"""
+    df = pd.read_sql_query(query, conn, params=params)
+    return apply_schema(df, schema)
+
+# ==================== FETCH ARROW ====================
+# Jalur alternatif tanpa pandas: tuple hasil cursor langsung menjadi kolom pyarrow,
+# sehingga st.dataframe cukup menulis Arrow IPC tanpa konversi kolom object per rerun.
+
+_ARROW_INT = {'uint8': pa.uint8(), 'uint16': pa.uint16(), 'int32': pa.int32(), 'int64': pa.int64()}
+_ARROW_DATETIME_FORMATS = ('%Y-%m-%d %H:%M:%S', '%Y-%m-%d')
+
+def _arrow_datetime(values):
+    """Teks tanggal ISO ke timestamp; nilai yang tidak bisa diparse menjadi null (seperti errors='coerce')"""
+    strings = pa.array(values, type=pa.string(), from_pandas=True) if not isinstance(values, pa.Array) else values.cast(pa.string())
+    try:
+        return pc.cast(strings, pa.timestamp('s'))
+    except pa.ArrowInvalid:
+        parsed = [pc.strptime(strings, format=fmt, unit='s', error_is_null=True) for fmt in _ARROW_DATETIME_FORMATS]
+        return pc.coalesce(*parsed)
+
+def _arrow_int(values, dtype):
+    """Integer sempit sesuai skema; melebar ke int64 jika nilai di luar jangkauan (null tetap null)"""
+    array = values if isinstance(values, pa.Array) else pa.array(values, type=pa.int64())
+    try:
+        return array.cast(_ARROW_INT[dtype])
+    except pa.ArrowInvalid:
+        return array.cast(pa.int64())
+
+def _arrow_infer(values):
+    """Kolom tanpa skema: tipe diinfer pyarrow, teks jika isinya campuran (SQLite tidak ketat tipe)"""
+    try:
+        return pa.array(values)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return pa.array([None if value is None else str(value) for value in values], type=pa.string())
+
+def arrow_column(values, dtype=None):
+    """Satu kolom hasil query (list Python atau pa.Array) menjadi pa.Array sesuai dtype skema"""
+    if dtype is None:
+        return values if isinstance(values, pa.Array) else _arrow_infer(values)
+    if dtype == 'datetime':
+        return _arrow_datetime(values)
+    if dtype == 'category':
+        array = values.cast(pa.string()) if isinstance(values, pa.Array) else pa.array(values, type=pa.string())
+        return array.dictionary_encode()
+    return _arrow_int(values, dtype)
+
+def apply_arrow_schema(table, schema):
+    """Terapkan skema dtype ke pa.Table (misal hasil ADBC); kolom di luar skema dibiarkan"""
+    for i, name in enumerate(table.column_names):
+        if name in schema:
+            table = table.set_column(i, name, arrow_column(table.column(name).combine_chunks(), schema[name]))
+    return table
+
+def read_sql_arrow(query, conn, schema=None, params=None):
+    """Query sqlite3 langsung ke pa.Table bertipe (tanpa DataFrame perantara)"""
+    schema = schema or {}
+    cursor = conn.execute(query, params or ())
+    names = [desc[0] for desc in cursor.description]
+    rows = cursor.fetchall()
+    columns = list(zip(*rows)) if rows else [()] * len(names)
+    arrays = [arrow_column(list(values), schema.get(name)) for name, values in zip(names, columns)]
+    return pa.Table.from_arrays(arrays, names=names)
@@ -0,0 +1,122 @@
+import itertools
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+# ==================== KONFIGURASI SNAPSHOT ====================
+# Mode laporan: 'snapshot' (baca dari salinan read-only) atau 'live' (langsung ke database utama)
+DB_PATH = 'data/database.db'
+SNAPSHOT_PATH = 'data/snapshot_laporan.db'
+REPORT_MODE = os.environ.get('GK_REPORT_MODE', 'snapshot')
+SNAPSHOT_INTERVAL = int(os.environ.get('GK_SNAPSHOT_INTERVAL', '60'))  # detik
+
+_refresh_lock = threading.Lock()
+
+# Generasi snapshot naik setiap kali snapshot selesai diperbarui; cache laporan memakainya
+# sebagai kunci sehingga hasil dari snapshot lama tidak dipakai lagi setelah refresh.
+_GENERATIONS = itertools.count(1)
+_snapshot_generation = 0
+
+# Refresh latar belakang: penulis meminta refresh setelah commit, satu thread worker
+# menjalankannya. Permintaan beruntun (misal import massal) digabung menjadi satu salinan.
+_pending = set()
+_pending_lock = threading.Lock()
+_pending_event = threading.Event()
+_worker = None
+
+# ==================== FUNGSI SNAPSHOT ====================
+
+def snapshot_age(snapshot_path=SNAPSHOT_PATH):
+    """Umur snapshot dalam detik, None jika snapshot belum ada"""
+    if not os.path.exists(snapshot_path):
+        return None
+    return time.time() - os.path.getmtime(snapshot_path)
+
+def refresh_snapshot(source_path=DB_PATH, snapshot_path=SNAPSHOT_PATH):
+    """Salin database utama ke file snapshot memakai backup API SQLite.
+
+    Salinan ditulis ke file sementara bernama unik di folder yang sama lalu diganti
+    secara atomik, sehingga koneksi laporan yang masih terbuka tetap membaca snapshot
+    lama dan proses lain (misal scripts/check_data.py) tidak menimpa salinan yang sama.
+    """
+    fd, tmp_path = tempfile.mkstemp(prefix=os.path.basename(snapshot_path) + '.',
+                                    suffix='.tmp', dir=os.path.dirname(snapshot_path) or '.')
+    os.close(fd)
+    try:
+        source = sqlite3.connect(source_path)
+        target = sqlite3.connect(tmp_path)
+        try:
+            source.backup(target)
+        finally:
+            target.close()
+            source.close()
+        os.replace(tmp_path, snapshot_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return snapshot_path
+
+def snapshot_generation():
+    """Generasi snapshot saat ini (naik setiap kali snapshot selesai diperbarui)"""
+    return _snapshot_generation
+
+def _refresh(source_path, snapshot_path):
+    global _snapshot_generation
+    with _refresh_lock:
+        refresh_snapshot(source_path, snapshot_path)
+        _snapshot_generation = next(_GENERATIONS)
+
+def _refresh_worker():
+    while True:
+        _pending_event.wait()
+        with _pending_lock:
+            _pending_event.clear()
+            requests = list(_pending)
+            _pending.clear()
+        for source_path, snapshot_path in requests:
+            try:
+                _refresh(source_path, snapshot_path)
+            except (sqlite3.Error, OSError) as e:
+                print(f"Refresh snapshot laporan gagal: {e}")
+
+def request_refresh(source_path=DB_PATH, snapshot_path=SNAPSHOT_PATH):
+    """Minta snapshot diperbarui di latar belakang; tidak menunggu salinan selesai"""
+    global _worker
+    with _pending_lock:
+        _pending.add((source_path, snapshot_path))
+        if _worker is None or not _worker.is_alive():
+            _worker = threading.Thread(target=_refresh_worker, name='snapshot-refresh', daemon=True)
+            _worker.start()
+        _pending_event.set()
+
+def ensure_snapshot(max_age=SNAPSHOT_INTERVAL, source_path=DB_PATH, snapshot_path=SNAPSHOT_PATH):
+    """Path snapshot laporan tanpa menunggu refresh di jalur request.
+
+    Hanya snapshot yang belum ada dibuat langsung. Perubahan lewat aplikasi sudah meminta
+    refresh dari sisi penulis (request_refresh setelah commit); snapshot yang lebih tua dari
+    max_age (perubahan di luar aplikasi) diperbarui di latar belakang, sementara request ini
+    tetap membaca snapshot yang ada.
+    """
+    age = snapshot_age(snapshot_path)
+    if age is None:
+        _refresh(source_path, snapshot_path)
+    elif age > max_age:
+        request_refresh(source_path, snapshot_path)
+    return snapshot_path
+
+def staleness_note():
+    """Keterangan keterlambatan data laporan untuk caption UI (None pada mode 'live')"""
+    if REPORT_MODE != 'snapshot':
+        return None
+    return ("Laporan dibaca dari snapshot read-only. Perubahan lewat aplikasi masuk ke laporan setelah "
+            "snapshot selesai diperbarui di latar belakang (biasanya beberapa detik, muat ulang halaman "
+            f"untuk melihatnya); perubahan dari luar aplikasi paling lambat {SNAPSHOT_INTERVAL} detik.")
+
+def connect_snapshot(max_age=SNAPSHOT_INTERVAL, source_path=DB_PATH, snapshot_path=SNAPSHOT_PATH):
+    """Koneksi read-only ke snapshot laporan (snapshot diperbarui bila kedaluwarsa)"""
+    ensure_snapshot(max_age, source_path, snapshot_path)
+    uri = f"file:{os.path.abspath(snapshot_path)}?mode=ro"
+    return sqlite3.connect(uri, uri=True, check_same_thread=False)
@@ -0,0 +1,109 @@
+import itertools
+
+import numpy as np
+import pandas as pd
+
+# ==================== KONSTANTA ====================
+
+# Dipakai hanya jika tabel tarif masih kosong (database baru)
+DEFAULT_IURAN = 100000
+# Tipe rumah kosong = tarif standar yang berlaku untuk semua warga
+TIPE_STANDAR = ''
+
+# Kolom tabel tarif yang dibutuhkan resolver
+TARIF_COLUMNS = ('id', 'berlaku_mulai', 'tipe_rumah', 'jumlah', 'keterangan')
+
+# Versi unik per jadwal yang dibangun, dipakai sebagai kunci cache turunan (seperti utils.cube)
+_VERSIONS = itertools.count(1)
+
+def month_key(tahun, bulan):
+    """Nomor bulan absolut (tahun * 12 + bulan - 1) agar periode bisa dibandingkan dan di-searchsorted"""
+    return np.asarray(tahun, dtype=np.int64) * 12 + np.asarray(bulan, dtype=np.int64) - 1
+
+def normalize_tipe(tipe):
+    """Tipe rumah sebagai teks kecil tanpa spasi tepi; None/NaN menjadi tipe standar"""
+    values = pd.Series(np.asarray(tipe, dtype=object).ravel())
+    return values.fillna(TIPE_STANDAR).astype(str).str.strip().str.lower().to_numpy(dtype=object)
+
+def load_tarif_rows(conn):
+    """Baris tabel tarif (kolom TARIF_COLUMNS) urut tanggal berlaku"""
+    return pd.read_sql_query(f"SELECT {', '.join(TARIF_COLUMNS)} FROM tarif ORDER BY berlaku_mulai, id", conn)
+
+# ==================== JADWAL TARIF ====================
+
+class TarifSchedule:
+    """Jadwal tarif iuran per tanggal berlaku, dengan override per tipe rumah.
+
+    Tarif berlaku mulai bulan dari berlaku_mulai sampai digantikan baris berikutnya
+    dengan tipe yang sama. Periode sebelum tarif standar pertama memakai tarif standar
+    paling awal; override tipe rumah hanya berlaku sejak tanggalnya sendiri, sebelum
+    itu warga bertipe tersebut mengikuti tarif standar.
+    """
+
+    def __init__(self, rows=None, default=DEFAULT_IURAN):
+        frame = pd.DataFrame(rows if rows is not None else [], columns=list(TARIF_COLUMNS))
+        dates = pd.to_datetime(frame['berlaku_mulai'], errors='coerce')
+        frame = frame.loc[dates.notna()].assign(berlaku_mulai=dates[dates.notna()].dt.date)
+        frame['tipe_rumah'] = normalize_tipe(frame['tipe_rumah'])
+        frame['jumlah'] = pd.to_numeric(frame['jumlah'], errors='coerce').fillna(0).astype('int64')
+        frame['_key'] = month_key(dates[dates.notna()].dt.year, dates[dates.notna()].dt.month)
+        # Baris dengan bulan berlaku sama: yang terakhir dimasukkan (id terbesar) menang
+        frame = (frame.sort_values(['tipe_rumah', '_key', 'id'])
+                      .drop_duplicates(['tipe_rumah', '_key'], keep='last'))
+        self.frame = frame.drop(columns='_key').reset_index(drop=True)
+
+        self._groups = {
+            tipe: (group['_key'].to_numpy(dtype=np.int64), group['jumlah'].to_numpy(dtype=np.int64))
+            for tipe, group in frame.groupby('tipe_rumah', sort=False)
+        }
+        self._default = self._groups.pop(TIPE_STANDAR, (np.array([0], dtype=np.int64),
+                                                        np.array([default], dtype=np.int64)))
+        self.version = next(_VERSIONS)
+
+    def __len__(self):
+        return len(self.frame)
+
+    @property
+    def types(self):
+        """Tipe rumah yang punya override tarif"""
+        return sorted(self._groups)
+
+    def resolve(self, tahun, bulan, tipe=TIPE_STANDAR):
+        """Tarif untuk setiap periode (tahun, bulan, tipe rumah), vektor dengan broadcasting.
+
+        Satu searchsorted untuk tarif standar ditambah satu per tipe override, sehingga
+        jutaan warga-bulan diselesaikan sekaligus. Hasil berbentuk hasil broadcast input.
+        """
+        keys = month_key(tahun, bulan)
+        tipe = np.asarray(tipe, dtype=object)
+        keys, tipe = np.broadcast_arrays(keys, tipe)
+        shape = keys.shape
+        keys = keys.ravel()
+
+        default_keys, default_amounts = self._default
+        pos = np.searchsorted(default_keys, keys, side='right') - 1
+        result = default_amounts[np.maximum(pos, 0)]
+
+        if self._groups:
+            # Normalisasi hanya nilai unik tipe rumah (biasanya segelintir), bukan per baris
+            codes, uniques = pd.factorize(tipe.ravel())
+            uniques = normalize_tipe(uniques)
+            for name, (group_keys, amounts) in self._groups.items():
+                mask = np.isin(codes, np.flatnonzero(uniques == name))
+                if not mask.any():
+                    continue
+                pos = np.searchsorted(group_keys, keys[mask], side='right') - 1
+                covered = pos >= 0
+                override = result[mask]
+                override[covered] = amounts[pos[covered]]
+                result[mask] = override
+        return result.reshape(shape)
+
+    def amount(self, tahun, bulan, tipe=TIPE_STANDAR):
+        """Tarif satu periode sebagai int"""
+        return int(self.resolve(tahun, bulan, tipe))
+
+    def year_matrix(self, tahun, tipe):
+        """Tarif [warga, 12 bulan] untuk satu tahun; tipe adalah tipe rumah per warga"""
+        tipe = np.asarray(tipe, dtype=object).reshape(-1, 1)
+        return self.resolve(tahun, np.arange(1, 13).reshape(1, -1), tipe)
@@ -0,0 +1,148 @@
+import os
+import re
+import threading
+from bisect import bisect_left
+from collections import OrderedDict
+
+# ==================== KONFIGURASI TYPEAHEAD ====================
+# Jumlah hasil query yang disimpan untuk penyempurnaan bertahap (LRU)
+SEARCH_CACHE_SIZE = int(os.environ.get('GK_SEARCH_CACHE_SIZE', '256'))
+
+# Kolom warga yang diindeks untuk pencarian
+SEARCH_COLUMNS = ('nama_kepala_keluarga', 'no_rumah', 'telepon', 'email')
+
+# Perkiraan biaya relatif memeriksa satu token kandidat di Python dibanding memasukkan satu
+# posting ke set (penyempurnaan bertahap memilih jalur yang lebih murah)
+CANDIDATE_SCAN_COST = 16
+
+_WORDS = re.compile(r'[0-9a-z]+')
+
+# ==================== TOKENISASI ====================
+
+def tokenize(value):
+    """Token pencarian dari satu nilai: kata/angka, teks utuh, dan versi tanpa tanda baca.
+
+    'A-01' -> {'a', '01', 'a-01', 'a01'} sehingga 'A-0', 'a0' dan '01' sama-sama cocok.
+    """
+    if value is None:
+        return set()
+    text = str(value).strip().lower()
+    if not text or text in ('nan', 'none'):
+        return set()
+    words = _WORDS.findall(text)
+    tokens = set(words)
+    tokens.add(text)
+    tokens.add(''.join(words))
+    tokens.discard('')
+    return tokens
+
+def query_terms(query):
+    """Pecah query menjadi term (semua term harus cocok sebagai prefix)"""
+    return tuple(term for term in str(query).strip().lower().split() if term)
+
+# ==================== INDEX PREFIX ====================
+
+class PrefixIndex:
+    """Index prefix berbasis array token terurut dengan cache hasil bertahap.
+
+    Setiap token disimpan sekali per record dalam array terurut; pencarian prefix
+    memakai bisect. Saat query bertambah panjang ('bu' -> 'bud'), hasil query
+    sebelumnya dipakai sebagai kandidat: hanya term yang berubah sejak query itu yang
+    diperiksa, dan hanya terhadap kandidat tersebut.
+    """
+
+    def __init__(self, records, columns=SEARCH_COLUMNS, cache_size=SEARCH_CACHE_SIZE):
+        self.records = records
+        pairs = []
+        self._record_tokens = []
+        for pos, record in enumerate(records):
+            tokens = set()
+            for column in columns:
+                tokens |= tokenize(record.get(column))
+            pairs.extend((token, pos) for token in tokens)
+            self._record_tokens.append(tuple(tokens))
+        pairs.sort()
+        self._tokens = [token for token, _ in pairs]
+        self._postings = [pos for _, pos in pairs]
+        self._tokens_per_record = len(pairs) / max(len(records), 1)
+
+        self._cache = OrderedDict()
+        self._cache_size = cache_size
+        self._lock = threading.Lock()
+        self.stats = {'hits': 0, 'refined': 0, 'scans': 0}
+
+    def __len__(self):
+        return len(self.records)
+
+    def _span(self, term):
+        """Rentang [lo, hi) token berawalan term di array token terurut"""
+        return bisect_left(self._tokens, term), bisect_left(self._tokens, term + '\uffff')
+
+    def _lookup(self, term):
+        """Posisi record yang punya token berawalan term"""
+        lo, hi = self._span(term)
+        return set(self._postings[lo:hi])
+
+    def _narrow(self, candidates, term):
+        """Saring kandidat (terurut) ke record yang punya token berawalan term.
+
+        Memilih jalur yang lebih murah: irisan dengan posting term jika rentangnya kecil,
+        atau memeriksa token kandidat satu per satu jika kandidatnya sedikit.
+        """
+        lo, hi = self._span(term)
+        if hi - lo <= len(candidates) * self._tokens_per_record * CANDIDATE_SCAN_COST:
+            matched = set(self._postings[lo:hi])
+            return tuple(pos for pos in candidates if pos in matched)
+        tokens = self._record_tokens
+        return tuple(pos for pos in candidates if any(token.startswith(term) for token in tokens[pos]))
+
+    def _cached_prefix(self, key):
+        """(kunci, hasil) cache untuk prefix terpanjang dari query (tanpa kunci itu sendiri)"""
+        for end in range(len(key) - 1, 0, -1):
+            result = self._cache.get(key[:end])
+            if result is not None:
+                return key[:end], result
+        return None, None
+
+    def search(self, query):
+        """Posisi record (urutan asli) yang cocok dengan query; query kosong = semua record"""
+        key = ' '.join(query_terms(query))
+        if not key:
+            return tuple(range(len(self.records)))
+
+        with self._lock:
+            result = self._cache.get(key)
+            if result is not None:
+                self._cache.move_to_end(key)
+                self.stats['hits'] += 1
+                return result
+            prefix, candidates = self._cached_prefix(key)
+
+        terms = key.split(' ')
+        if candidates is not None:
+            # Hasil prefix sudah terurut dan memuat semua hasil query ini. Term di prefix
+            # sudah terpenuhi; cukup saring dengan term terakhir prefix jika kini lebih
+            # panjang ('bu' -> 'bud') dan term sesudahnya
+            done = prefix.split(' ')
+            start = len(done) if terms[len(done) - 1] == done[-1] else len(done) - 1
+            result = candidates
+            for term in terms[start:]:
+                result = self._narrow(result, term)
+            stat = 'refined'
+        else:
+            matched = self._lookup(terms[0])
+            for term in terms[1:]:
+                matched &= self._lookup(term)
+            result = tuple(sorted(matched))
+            stat = 'scans'
+
+        with self._lock:
+            self.stats[stat] += 1
+            self._cache[key] = result
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return result
+
+    def search_ids(self, query):
+        """Id record yang cocok dengan query"""
+        return [self.records[pos]['id'] for pos in self.search(query)]
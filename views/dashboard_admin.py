@@ -0,0 +1,170 @@
+import streamlit as st
+import pandas as pd
+from utils.charts import cached_figure
+from datetime import datetime
+from utils.database import get_connection, data_generation
+
+st.markdown('<h1 class="main-header">Dashboard Admin</h1>', unsafe_allow_html=True)
+st.markdown('<h3 class="sub-header">Green Kartika Residence - Administrator Panel</h3>', unsafe_allow_html=True)
+
+# Info admin
+st.markdown('<div class="info-message">👋 Selamat datang, Administrator! Anda memiliki akses penuh ke semua fitur sistem.</div>', unsafe_allow_html=True)
+
+# ==================== DATA LOADER ====================
+# Setiap bagian punya loader sendiri (di-cache) sehingga fragment yang rerun
+# hanya menjalankan query miliknya. Fungsi tulis di utils.database
+# membersihkan st.cache_data sehingga data baru tetap langsung muncul.
+
+@st.cache_data(ttl=60)
+def load_stat_cards(bulan, tahun):
+    conn = get_connection()
+    try:
+        query = """
+            SELECT
+                (SELECT COUNT(*) FROM warga) AS total_warga,
+                (SELECT COUNT(*) FROM users) AS total_users,
+                (SELECT COALESCE(SUM(jumlah), 0) FROM pembayaran
+                 WHERE bulan=? AND tahun=? AND status='verified') AS total_pembayaran,
+                (SELECT COUNT(*) FROM pembayaran WHERE status='pending') AS pending_count
+        """
+        return pd.read_sql_query(query, conn, params=(bulan, tahun)).iloc[0].to_dict()
+    finally:
+        conn.close()
+
+@st.cache_data(ttl=60)
+def load_status_bulan(bulan, tahun):
+    conn = get_connection()
+    try:
+        query = """
+            SELECT 
+                status,
+                COUNT(*) as jumlah
+            FROM pembayaran 
+            WHERE bulan=? AND tahun=?
+            GROUP BY status
+        """
+        return pd.read_sql_query(query, conn, params=(bulan, tahun))
+    finally:
+        conn.close()
+
+@st.cache_data(ttl=60)
+def load_pembayaran_terakhir(limit=6):
+    conn = get_connection()
+    try:
+        query = """
+            SELECT 
+                bulan,
+                tahun,
+                SUM(jumlah) as total_pembayaran
+            FROM pembayaran 
+            WHERE status='verified'
+            GROUP BY tahun, bulan
+            ORDER BY tahun DESC, bulan DESC
+            LIMIT ?
+        """
+        return pd.read_sql_query(query, conn, params=(limit,))
+    finally:
+        conn.close()
+
+@st.cache_data(ttl=60)
+def load_antrean_verifikasi(limit=10):
+    conn = get_connection()
+    try:
+        query = """
+            SELECT 
+                p.id,
+                w.no_rumah,
+                w.nama_kepala_keluarga,
+                p.bulan || '/' || p.tahun as periode,
+                p.jumlah,
+                p.tanggal_bayar,
+                p.status
+            FROM pembayaran p
+            JOIN warga w ON p.warga_id = w.id
+            WHERE p.status = 'pending'
+            ORDER BY p.tanggal_bayar DESC
+            LIMIT ?
+        """
+        return pd.read_sql_query(query, conn, params=(limit,))
+    finally:
+        conn.close()
+
+# ==================== FRAGMENT ====================
+
+@st.fragment
+def render_stat_cards():
+    now = datetime.now()
+    stats = load_stat_cards(now.month, now.year)
+
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.markdown(f'<div class="stat-card"><h4>Total Warga</h4><h2>{stats["total_warga"]}</h2></div>', unsafe_allow_html=True)
+    with col2:
+        st.markdown(f'<div class="stat-card"><h4>Total User</h4><h2>{stats["total_users"]}</h2></div>', unsafe_allow_html=True)
+    with col3:
+        st.markdown(f'<div class="stat-card"><h4>Pembayaran Bulan Ini</h4><h2>Rp {int(stats["total_pembayaran"]):,}</h2></div>', unsafe_allow_html=True)
+    with col4:
+        st.markdown(f'<div class="stat-card"><h4>Verifikasi Pending</h4><h2>{stats["pending_count"]}</h2></div>', unsafe_allow_html=True)
+
+@st.fragment
+def render_charts():
+    now = datetime.now()
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown('<div class="card"><h4>Status Pembayaran Bulan Ini</h4></div>', unsafe_allow_html=True)
+        df_status = load_status_bulan(now.month, now.year)
+
+        if not df_status.empty:
+            fig = cached_figure('admin_status_bulan', 'pie', df_status,
+                                version=(data_generation(), now.month, now.year),
+                                values='jumlah', names='status',
+                                title='Distribusi Status Pembayaran',
+                                color_discrete_map={'verified': '#2E8B57', 'pending': '#FFA500', 'rejected': '#DC143C'})
+            st.plotly_chart(fig, use_container_width=True)
+        else:
+            st.info("Belum ada data pembayaran bulan ini")
+
+    with col2:
+        st.markdown('<div class="card"><h4>Pembayaran 6 Bulan Terakhir</h4></div>', unsafe_allow_html=True)
+        df_pembayaran = load_pembayaran_terakhir(6)
+
+        if not df_pembayaran.empty:
+            df_pembayaran = df_pembayaran.copy()
+            df_pembayaran['periode'] = df_pembayaran['bulan'].astype(str) + '/' + df_pembayaran['tahun'].astype(str)
+            df_pembayaran = df_pembayaran.sort_values('periode')
+
+            fig = cached_figure('admin_pembayaran_terakhir', 'bar', df_pembayaran,
+                                version=(data_generation(), 6),
+                                x='periode', y='total_pembayaran',
+                                title='Pembayaran Iuran 6 Bulan Terakhir',
+                                color='total_pembayaran',
+                                labels={'total_pembayaran': 'Total Pembayaran (Rp)', 'periode': 'Periode'})
+            st.plotly_chart(fig, use_container_width=True)
+        else:
+            st.info("Belum ada data pembayaran terverifikasi")
+
+@st.fragment
+def render_verification_queue():
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        st.subheader("Aktivitas yang Perlu Verifikasi")
+    with col2:
+        if st.button("Refresh Data", key="refresh_antrean", use_container_width=True):
+            load_antrean_verifikasi.clear()  # klik tombol sudah merender ulang fragment ini
+
+    df_pending = load_antrean_verifikasi(10)
+    if not df_pending.empty:
+        st.dataframe(df_pending, use_container_width=True, hide_index=True)
+    else:
+        st.info("Tidak ada pembayaran yang perlu diverifikasi")
+
+# Statistik Cepat untuk Admin
+render_stat_cards()
+
+# Grafik untuk Admin
+render_charts()
+
+# Aktivitas Terbaru yang Perlu Perhatian Admin
+st.markdown("---")
+render_verification_queue()
@@ -0,0 +1,36 @@
+import streamlit as st
+import pandas as pd
+from datetime import datetime
+from utils.database import get_connection, get_payment_cube
+
+st.markdown('<h1 class="main-header">Dashboard User</h1>', unsafe_allow_html=True)
+st.markdown('<div class="info-message">👋 Selamat datang! Anda login sebagai user biasa dengan akses terbatas.</div>', unsafe_allow_html=True)
+
+# Statistik untuk user biasa
+col1, col2 = st.columns(2)
+
+with col1:
+    conn = get_connection()
+    total_warga = pd.read_sql_query("SELECT COUNT(*) as total FROM warga WHERE status='aktif'", conn)['total'][0]
+    conn.close()
+    st.metric("Total Warga Aktif", total_warga)
+
+with col2:
+    current_month = datetime.now().month
+    current_year = datetime.now().year
+    lunas_count = get_payment_cube().payer_count(current_year, current_month)
+    st.metric(f"Sudah Bayar ({current_month}/{current_year})", lunas_count,
+              help="Warga dengan pembayaran terverifikasi untuk bulan ini; bayar di muka "
+                   "dihitung di bulan pembayarannya")
+
+# Info untuk user biasa
+st.info("""
+**Hak Akses Anda:**
+- Melihat statistik umum
+- Tidak dapat mengubah data
+- Tidak dapat verifikasi pembayaran
+- Tidak dapat mengelola user
+
+**Jika memerlukan akses lebih:**
+Hubungi administrator untuk mendapatkan hak akses admin.
+""")
@@ -0,0 +1,198 @@
+import streamlit as st
+import pandas as pd
+import io
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+from datetime import datetime
+from utils.database import get_resident_directory, invalidate_warga_frames, add_warga, update_warga, delete_warga, PeriodClosedError
+
+st.markdown('<h1 class="main-header">Data Warga</h1>', unsafe_allow_html=True)
+
+# ==================== FRAGMENT ====================
+# Filter, pencarian dan tombol aksi hanya merender ulang daftar warga
+
+@st.fragment
+def render_daftar_warga():
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        st.subheader("Daftar Semua Warga")
+    with col2:
+        if st.button("Refresh Data", key="refresh_warga"):
+            invalidate_warga_frames()  # klik tombol sudah merender ulang fragment ini
+
+    # Direktori warga (semua status) yang di-cache: urut natural no_rumah, label dan index siap pakai
+    directory = get_resident_directory(active_only=False)
+    if directory.empty:
+        st.info("Belum ada data warga")
+        return
+
+    # Filter
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        filter_status = st.selectbox("Filter Status", ["Semua", "aktif", "non-aktif"])
+
+    with col2:
+        search_term = st.text_input("Cari", placeholder="Nama / No Rumah / Telepon")
+
+    # Apply filters pada tabel Arrow direktori (pencarian lewat index typeahead milik direktori yang sama)
+    filtered = directory.arrow
+    if search_term:
+        filtered = filtered.take(list(directory.search_index.search(search_term)))
+
+    if filter_status != "Semua":
+        filtered = filtered.filter(pc.equal(filtered['status'], filter_status))
+
+    # Statistik ringkas dari tabel Arrow hasil filter
+    status_col = filtered['status']
+    m1, m2, m3, m4 = st.columns(4)
+    m1.metric("Total Warga", filtered.num_rows)
+    m2.metric("Aktif", pc.sum(pc.equal(status_col, 'aktif')).as_py() or 0)
+    m3.metric("Non-aktif", pc.sum(pc.equal(status_col, 'non-aktif')).as_py() or 0)
+    m4.metric("Total Anggota", pc.sum(filtered['anggota_keluarga']).as_py() or 0)
+
+    # Tampilkan data (pa.Table langsung, tanpa konversi pandas -> Arrow setiap rerun)
+    st.dataframe(filtered, use_container_width=True, hide_index=True)
+    csv_buffer = io.BytesIO()
+    pacsv.write_csv(filtered, csv_buffer)
+    st.download_button("Download CSV", csv_buffer.getvalue(), "data_warga.csv", "text/csv")
+
+    # Action buttons untuk setiap warga
+    st.subheader("Kelola Warga")
+    selected_warga = st.selectbox(
+        "Pilih warga untuk dikelola",
+        options=["Pilih warga..."] + directory.options(filtered['id'].to_pylist())
+    )
+
+    if selected_warga == "Pilih warga...":
+        return
+
+    warga_data = directory.by_label(selected_warga)
+
+    with st.expander("Edit Data"):
+        with st.form(f"form_edit_{warga_data['id']}"):
+            c1, c2 = st.columns(2)
+            with c1:
+                e_no = st.text_input("Nomor Rumah", value=warga_data['no_rumah'])
+                e_nama = st.text_input("Nama Kepala Keluarga", value=warga_data['nama_kepala_keluarga'])
+                e_anggota = st.number_input("Jumlah Anggota", min_value=1, value=max(int(warga_data['anggota_keluarga'] or 1), 1))
+            with c2:
+                e_telp = st.text_input("Telepon", value=warga_data['telepon'] or '')
+                e_mail = st.text_input("Email", value=warga_data['email'] or '')
+                e_stat = st.selectbox("Status", ["aktif", "non-aktif"], index=0 if warga_data['status'] == 'aktif' else 1)
+            if st.form_submit_button("Update", type="primary"):
+                if update_warga(int(warga_data['id']), (
+                    e_no.strip(), e_nama.strip(), int(e_anggota), e_telp.strip(), e_mail.strip(),
+                    warga_data['tanggal_masuk'], e_stat
+                )):
+                    st.success("Data diperbarui")
+                    st.rerun(scope="fragment")
+                else:
+                    st.error("Gagal memperbarui. Cek apakah nomor rumah sudah dipakai.")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        if st.button("Nonaktifkan", use_container_width=True):
+            if update_warga(int(warga_data['id']), (
+                warga_data['no_rumah'],
+                warga_data['nama_kepala_keluarga'],
+                int(warga_data['anggota_keluarga']),
+                warga_data['telepon'],
+                warga_data['email'],
+                warga_data['tanggal_masuk'],
+                'non-aktif'
+            )):
+                st.success(f"Warga {warga_data['nama_kepala_keluarga']} dinonaktifkan")
+                st.rerun(scope="fragment")
+
+    with col2:
+        if st.button("Hapus Data", use_container_width=True, type="secondary"):
+            if st.checkbox(f"Konfirmasi hapus {warga_data['nama_kepala_keluarga']}?"):
+                try:
+                    if delete_warga(int(warga_data['id'])):
+                        st.success("Data berhasil dihapus")
+                        st.rerun(scope="fragment")
+                except PeriodClosedError as e:
+                    st.error(str(e))
+
+# Tab untuk berbagai fungsi data warga
+tab1, tab2, tab3 = st.tabs(["Daftar Warga", "Tambah Warga", "Import Data"])
+
+with tab1:
+    render_daftar_warga()
+
+with tab2:
+    st.subheader("Tambah Warga Baru")
+    with st.form("tambah_warga_form", clear_on_submit=True):
+        col1, col2 = st.columns(2)
+
+        with col1:
+            no_rumah = st.text_input("No Rumah*", placeholder="A-01")
+            nama = st.text_input("Nama Kepala Keluarga*")
+            anggota = st.number_input("Jumlah Anggota", min_value=1, value=1)
+
+        with col2:
+            telepon = st.text_input("Telepon", placeholder="081234567890")
+            email = st.text_input("Email", placeholder="nama@email.com")
+            tanggal_masuk = st.date_input("Tanggal Masuk", value=datetime.now())
+            status = st.selectbox("Status", ["aktif", "non-aktif"])
+
+        submitted = st.form_submit_button("Simpan", type="primary", use_container_width=True)
+
+        if submitted:
+            if no_rumah and nama:
+                try:
+                    data = (
+                        no_rumah.strip(),
+                        nama.strip(),
+                        int(anggota),
+                        telepon.strip(),
+                        email.strip(),
+                        tanggal_masuk.strftime('%Y-%m-%d'),
+                        status
+                    )
+                    warga_id = add_warga(data)
+                    st.success(f"Data warga berhasil ditambahkan (ID: {warga_id})")
+                except Exception as e:
+                    st.error(f"Gagal menambahkan data: {str(e)}")
+            else:
+                st.error("No Rumah dan Nama harus diisi")
+
+with tab3:
+    st.subheader("Import Data Warga")
+    st.info("Kolom file: no_rumah, nama_kepala_keluarga, anggota_keluarga, telepon, email, tanggal_masuk, status")
+    uploaded_file = st.file_uploader("Upload file CSV/Excel", type=['csv', 'xlsx'])
+
+    if uploaded_file:
+        try:
+            if uploaded_file.name.endswith('.csv'):
+                df_import = pd.read_csv(uploaded_file)
+            else:
+                df_import = pd.read_excel(uploaded_file)
+            st.dataframe(df_import.head(), use_container_width=True)
+
+            if st.button("Import Data", type="primary"):
+                success_count = 0
+                error_count = 0
+
+                for _, row in df_import.iterrows():
+                    try:
+                        if pd.notna(row.get('no_rumah')) and pd.notna(row.get('nama_kepala_keluarga')):
+                            data = (
+                                str(row['no_rumah']).strip(),
+                                str(row['nama_kepala_keluarga']).strip(),
+                                int(row.get('anggota_keluarga', 1)),
+                                str(row.get('telepon', '')).strip(),
+                                str(row.get('email', '')).strip(),
+                                pd.to_datetime(row.get('tanggal_masuk', datetime.now())).strftime('%Y-%m-%d'),
+                                str(row.get('status', 'aktif')).lower()
+                            )
+                            add_warga(data)
+                            success_count += 1
+                        else:
+                            error_count += 1
+                    except:
+                        error_count += 1
+
+                st.success(f"Import selesai: {success_count} berhasil, {error_count} gagal")
+        except Exception as e:
+            st.error(f"Error membaca file: {str(e)}")
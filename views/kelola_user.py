@@ -0,0 +1,107 @@
+import streamlit as st
+from utils.database import get_connection, get_user_directory, invalidate_user_frames, add_user, update_user, delete_user
+
+st.markdown('<h1 class="main-header">Kelola Pengguna</h1>', unsafe_allow_html=True)
+
+# ==================== AKSI ====================
+
+def set_user_status(user_id, status):
+    conn = get_connection()
+    cursor = conn.cursor()
+    cursor.execute("UPDATE users SET status=? WHERE id=?", (status, user_id))
+    conn.commit()
+    conn.close()
+    invalidate_user_frames()
+
+# ==================== FRAGMENT ====================
+# Memilih user dan tombol aksi hanya merender ulang tabel user
+
+@st.fragment
+def render_daftar_user():
+    st.subheader("Daftar Semua Pengguna")
+
+    directory = get_user_directory()
+    if directory.empty:
+        st.info("Belum ada data user")
+        return
+
+    st.dataframe(directory.frame, use_container_width=True, hide_index=True)
+
+    # Action untuk user
+    selected_user = st.selectbox(
+        "Pilih user untuk dikelola",
+        options=["Pilih user..."] + directory.options()
+    )
+
+    if selected_user == "Pilih user...":
+        return
+
+    user_data = directory.by_label(selected_user)
+
+    with st.expander("Edit Data"):
+        with st.form(f"form_edit_user_{user_data['id']}"):
+            c1, c2 = st.columns(2)
+            with c1:
+                e_username = st.text_input("Username", value=user_data['username'])
+                e_nama = st.text_input("Nama Lengkap", value=user_data['nama_lengkap'])
+            with c2:
+                e_role = st.selectbox("Role", ["admin", "user"], index=0 if user_data['role'] == 'admin' else 1)
+                e_status = st.selectbox("Status", ["active", "inactive"], index=0 if user_data['status'] == 'active' else 1)
+            if st.form_submit_button("Simpan", type="primary"):
+                if update_user(int(user_data['id']), e_username.strip(), e_nama.strip(), e_role, e_status):
+                    st.success("Data user diperbarui")
+                    st.rerun(scope="fragment")
+                else:
+                    st.error("Gagal memperbarui. Username mungkin sudah digunakan.")
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        new_status = "inactive" if user_data['status'] == 'active' else 'active'
+        status_text = "Nonaktifkan" if user_data['status'] == 'active' else 'Aktifkan'
+        if st.button(status_text, use_container_width=True):
+            set_user_status(int(user_data['id']), new_status)
+            st.success(f"Status user diubah menjadi {new_status}")
+            st.rerun(scope="fragment")
+
+    with col2:
+        if st.button("Reset Password", use_container_width=True, type="secondary"):
+            conn = get_connection()
+            cursor = conn.cursor()
+            cursor.execute("UPDATE users SET password='user123' WHERE id=?", (int(user_data['id']),))
+            conn.commit()
+            conn.close()
+            st.success("Password direset ke 'user123'")
+
+    with col3:
+        if st.button("Hapus User", use_container_width=True, type="secondary"):
+            if int(user_data['id']) == st.session_state.get('user_id'):
+                st.error("Tidak dapat menghapus akun yang sedang dipakai")
+            elif delete_user(int(user_data['id'])):
+                st.success(f"User {user_data['username']} dihapus")
+                st.rerun(scope="fragment")
+
+tab1, tab2 = st.tabs(["Daftar User", "Tambah User"])
+
+with tab1:
+    render_daftar_user()
+
+with tab2:
+    st.subheader("Tambah User Baru")
+    with st.form("tambah_user_form", clear_on_submit=True):
+        username = st.text_input("Username*")
+        nama_lengkap = st.text_input("Nama Lengkap*")
+        password = st.text_input("Password*", type="password")
+        role = st.selectbox("Role", ["user", "admin"])
+        status = st.selectbox("Status", ["active", "inactive"])
+
+        submitted = st.form_submit_button("Tambah User", type="primary", use_container_width=True)
+
+        if submitted:
+            if username and nama_lengkap and password:
+                try:
+                    add_user((username.strip(), password, nama_lengkap.strip(), role, status))
+                    st.success(f"User {username} berhasil ditambahkan")
+                except Exception as e:
+                    st.error(f"Gagal menambahkan user: {str(e)}")
+            else:
+                st.error("Semua field harus diisi")
@@ -0,0 +1,56 @@
+import streamlit as st
+import pandas as pd
+from datetime import datetime
+from utils.database import get_connection
+from utils.helpers import get_month_name
+
+# Judul utama dan sub-header dengan perataan tengah
+st.markdown('<h1 style="text-align: center;" class="main-header">Green Kartika Residence</h1>', unsafe_allow_html=True)
+st.markdown('<h3 style="text-align: center;" class="sub-header">Sistem Administrasi Iuran Lingkungan</h3>', unsafe_allow_html=True)
+
+col1, col2, col3 = st.columns([1, 2, 1])
+with col2:
+    st.info("""
+    ### 🔒 Sistem Khusus Administrator
+
+    **Fitur Admin:**
+    - Kelola data warga lengkap
+    - Verifikasi pembayaran iuran
+    - Laporan keuangan lengkap
+    - Kelola pengguna sistem
+    - Pengaturan aplikasi
+
+    **Persyaratan:**
+    - Akun dengan role 'admin'
+    - Status akun 'active'
+    - Kredensial valid dari administrator
+
+    Silakan login menggunakan kredensial yang diberikan.
+    """)
+
+# Statistik public (bisa dilihat tanpa login)
+st.markdown("---")
+st.subheader("Statistik Publik")
+
+col1, col2, col3 = st.columns(3)
+with col1:
+    conn = get_connection()
+    total_warga = pd.read_sql_query("SELECT COUNT(*) as total FROM warga WHERE status='aktif'", conn)['total'][0]
+    conn.close()
+    st.metric("Total Warga Aktif", total_warga)
+
+with col2:
+    current_month = datetime.now().month
+    current_year = datetime.now().year
+    conn = get_connection()
+    query = f"""
+        SELECT COUNT(DISTINCT warga_id) as jumlah 
+        FROM pembayaran 
+        WHERE bulan={current_month} AND tahun={current_year} AND status='verified'
+    """
+    lunas_count = pd.read_sql_query(query, conn)['jumlah'][0]
+    conn.close()
+    st.metric(f"Pembayaran Lunas {current_month}/{current_year}", lunas_count)
+
+with col3:
+    st.metric("Bulan Berjalan", f"{get_month_name(datetime.now().month)} {datetime.now().year}")
@@ -0,0 +1,162 @@
+import streamlit as st
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+from datetime import datetime
+from utils.database import get_connection, get_all_pembayaran_arrow, get_resident_directory, get_tarif_schedule, add_pembayaran, update_pembayaran_status, PeriodClosedError
+
+st.markdown('<h1 class="main-header">Kelola Pembayaran</h1>', unsafe_allow_html=True)
+
+# ==================== DATA LOADER ====================
+
+# Kolom yang dirender tabel riwayat
+KOLOM_RIWAYAT = ('id', 'warga_id', 'bulan', 'tahun', 'jumlah', 'tanggal_bayar', 'metode_bayar', 'bukti_bayar', 'status', 'catatan')
+KOLOM_WARGA = ('no_rumah', 'nama_kepala_keluarga')
+
+@st.cache_data(ttl=60)
+def load_antrean_verifikasi():
+    conn = get_connection()
+    try:
+        query = """
+            SELECT 
+                p.id,
+                w.no_rumah,
+                w.nama_kepala_keluarga,
+                p.bulan || '/' || p.tahun as periode,
+                p.jumlah,
+                p.tanggal_bayar,
+                p.metode_bayar,
+                p.bukti_bayar,
+                p.catatan
+            FROM pembayaran p
+            JOIN warga w ON p.warga_id = w.id
+            WHERE p.status = 'pending'
+            ORDER BY p.tanggal_bayar DESC
+        """
+        return pd.read_sql_query(query, conn)
+    finally:
+        conn.close()
+
+def load_riwayat(limit=100):
+    """Riwayat terbaru sebagai pyarrow.Table (jalur Arrow, tanpa DataFrame); limit None = semua"""
+    return get_all_pembayaran_arrow(KOLOM_RIWAYAT, KOLOM_WARGA, limit=limit)
+
+# ==================== FRAGMENT ====================
+# Tombol verifikasi/tolak hanya merender ulang antrean; update_pembayaran_status
+# sudah membersihkan cache sehingga antrean langsung terbarui
+
+@st.fragment
+def render_antrean_verifikasi():
+    st.subheader("Pembayaran yang Perlu Verifikasi")
+
+    df_pending = load_antrean_verifikasi()
+    if df_pending.empty:
+        st.info("Tidak ada pembayaran yang perlu diverifikasi")
+        return
+
+    for _, row in df_pending.iterrows():
+        with st.container():
+            col1, col2 = st.columns([3, 1])
+            with col1:
+                st.markdown(f"**{row['no_rumah']} - {row['nama_kepala_keluarga']}**")
+                st.markdown(f"Periode: {row['periode']} | Jumlah: Rp {row['jumlah']:,}")
+                st.markdown(f"Metode: {row['metode_bayar']} | Tanggal: {row['tanggal_bayar']}")
+                if row['bukti_bayar']:
+                    st.markdown(f"Bukti: {row['bukti_bayar']}")
+                if row['catatan']:
+                    st.markdown(f"Catatan: {row['catatan']}")
+
+            with col2:
+                col_ver, col_rej = st.columns(2)
+                try:
+                    with col_ver:
+                        if st.button("✓ Verifikasi", key=f"ver_{row['id']}", use_container_width=True):
+                            update_pembayaran_status(row['id'], 'verified', st.session_state.user_id)
+                            st.success("Pembayaran diverifikasi")
+                            st.rerun(scope="fragment")
+                    with col_rej:
+                        if st.button("✗ Tolak", key=f"rej_{row['id']}", use_container_width=True, type="secondary"):
+                            update_pembayaran_status(row['id'], 'rejected', st.session_state.user_id)
+                            st.warning("Pembayaran ditolak")
+                            st.rerun(scope="fragment")
+                except PeriodClosedError as e:
+                    st.error(str(e))
+
+            st.divider()
+
+@st.fragment
+def render_riwayat():
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        st.subheader("Riwayat Pembayaran")
+    with col2:
+        if st.button("Refresh Data", key="refresh_riwayat", use_container_width=True):
+            get_all_pembayaran_arrow.clear()  # klik tombol sudah merender ulang fragment ini
+
+    c1, c2 = st.columns([2, 1])
+    search = c1.text_input("Cari", placeholder="No. Rumah / Nama", key="cari_riwayat")
+    status_f = c2.selectbox("Filter Status", ["Semua", "verified", "pending", "rejected"], key="status_riwayat")
+
+    # Tanpa filter cukup 100 transaksi terbaru; dengan filter seluruh riwayat disaring di Arrow
+    filtered = bool(search) or status_f != "Semua"
+    riwayat = load_riwayat(None if filtered else 100)
+    if search:
+        ids = pa.array(get_resident_directory(active_only=False).search_index.search_ids(search), type=riwayat['warga_id'].type)
+        riwayat = riwayat.filter(pc.is_in(riwayat['warga_id'], value_set=ids))
+    if status_f != "Semua":
+        riwayat = riwayat.filter(pc.equal(riwayat['status'].cast(pa.string()), status_f))
+
+    if riwayat.num_rows:
+        st.dataframe(riwayat.drop_columns(['warga_id']), use_container_width=True, hide_index=True)
+    else:
+        st.info("Belum ada riwayat pembayaran")
+
+tab1, tab2, tab3 = st.tabs(["Verifikasi Pembayaran", "Input Pembayaran", "Riwayat"])
+
+with tab1:
+    render_antrean_verifikasi()
+
+with tab2:
+    st.subheader("Input Pembayaran Manual")
+
+    with st.form("input_pembayaran_form"):
+        # Pilih warga
+        directory = get_resident_directory()
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            selected_warga = st.selectbox("Pilih Warga", ["Pilih warga..."] + directory.options())
+
+            bulan = st.number_input("Bulan", min_value=1, max_value=12, value=datetime.now().month)
+            tahun = st.number_input("Tahun", min_value=2020, max_value=2100, value=datetime.now().year)
+
+        with col2:
+            jumlah = st.number_input("Jumlah (Rp)", min_value=0,
+                                     value=get_tarif_schedule().amount(datetime.now().year, datetime.now().month),
+                                     help="Default: tarif standar bulan ini (Pengaturan > Tarif Iuran)")
+            tanggal_bayar = st.date_input("Tanggal Bayar", value=datetime.now())
+            metode_bayar = st.selectbox("Metode Bayar", ["Transfer", "Tunai", "QRIS"])
+            status = st.selectbox("Status", ["verified", "pending"])
+            bukti_bayar = st.text_input("No. Bukti/Referensi")
+            catatan = st.text_area("Catatan")
+
+        submitted = st.form_submit_button("Simpan Pembayaran", type="primary", use_container_width=True)
+
+        if submitted and selected_warga != "Pilih warga...":
+            # Extract warga_id
+            warga_id = int(directory.by_label(selected_warga)['id'])
+
+            try:
+                data = (
+                    warga_id, bulan, tahun, jumlah,
+                    tanggal_bayar.strftime('%Y-%m-%d'),
+                    metode_bayar, bukti_bayar, status, catatan
+                )
+                pembayaran_id = add_pembayaran(data)
+                st.success(f"Pembayaran berhasil disimpan (ID: {pembayaran_id})")
+            except Exception as e:
+                st.error(f"Gagal menyimpan: {str(e)}")
+
+with tab3:
+    render_riwayat()
@@ -0,0 +1,180 @@
+import streamlit as st
+import pandas as pd
+from datetime import datetime
+import os
+from utils.database import (
+    get_connection, reinit_db, get_resident_directory, get_tarif_schedule, add_tarif, delete_tarif, set_tipe_rumah,
+    run_billing, get_settings, save_settings, rebuild_saldo, rebuild_rekap_pengeluaran,
+    tutup_buku, buka_tutup_buku, get_tutup_buku, get_ringkasan_periode, periksa_tutup_buku, PeriodClosedError
+)
+from utils.helpers import format_currency
+
+st.markdown('<h1 class="main-header">Pengaturan Sistem</h1>', unsafe_allow_html=True)
+
+tab1, tab2, tab3, tab4 = st.tabs(["Database", "Aplikasi", "Tarif Iuran", "Tutup Buku"])
+
+with tab1:
+    st.subheader("Manajemen Database")
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        if st.button("Backup Database", use_container_width=True):
+            import shutil
+            backup_file = f"backup/database_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.db"
+            os.makedirs("backup", exist_ok=True)
+            shutil.copy2("data/database.db", backup_file)
+            st.success(f"Database berhasil di-backup ke {backup_file}")
+
+    with col2:
+        if st.button("Reset Auto-increment", use_container_width=True, type="secondary"):
+            conn = get_connection()
+            cursor = conn.cursor()
+            cursor.execute("DELETE FROM sqlite_sequence")
+            conn.commit()
+            conn.close()
+            st.success("Auto-increment direset")
+
+    with col3:
+        if st.button("Inisialisasi Ulang Skema", use_container_width=True, type="secondary"):
+            reinit_db()
+            st.success("Skema database diperiksa dan dibuat ulang")
+
+    # Saldo kas dan rekap pengeluaran diperbarui otomatis oleh aplikasi; perlu dihitung ulang
+    # hanya jika pembayaran/pengeluaran diubah langsung di database atau lewat scripts/
+    if st.button("Hitung Ulang Saldo Kas", type="secondary"):
+        bulan_saldo, baris_rekap = rebuild_saldo(), rebuild_rekap_pengeluaran()
+        st.success(f"Saldo kas {bulan_saldo} bulan dan {baris_rekap} baris rekap pengeluaran dihitung ulang")
+
+    # Database Info
+    st.subheader("Info Database")
+    conn = get_connection()
+    tables = pd.read_sql_query("SELECT name FROM sqlite_master WHERE type='table'", conn)
+
+    for table in tables['name']:
+        count = pd.read_sql_query(f"SELECT COUNT(*) as count FROM {table}", conn)['count'][0]
+        st.write(f"**{table}**: {count} records")
+
+    conn.close()
+
+with tab2:
+    st.subheader("Pengaturan Aplikasi")
+
+    # Pengaturan tersimpan di tabel pengaturan (nominal iuran diatur di tab Tarif Iuran)
+    settings = get_settings()
+    batas_waktu = st.number_input("Batas Waktu Pembayaran (hari)", min_value=1, max_value=31,
+                                  value=int(settings['batas_waktu']),
+                                  help="Iuran bulan X jatuh tempo pada tanggal ini di bulan X; dipakai umur tunggakan")
+    notifikasi_email = st.checkbox("Aktifkan Notifikasi Email", value=bool(settings['notifikasi_email']))
+
+    if st.button("Simpan Pengaturan", type="primary"):
+        save_settings({
+            'batas_waktu': batas_waktu,
+            'notifikasi_email': notifikasi_email,
+        }, updated_by=st.session_state.username)
+        st.success("Pengaturan disimpan")
+
+with tab3:
+    st.subheader("Jadwal Tarif Iuran")
+    schedule = get_tarif_schedule()
+    today = datetime.now()
+
+    m1, m2 = st.columns(2)
+    m1.metric("Tarif Standar Bulan Ini", format_currency(schedule.amount(today.year, today.month)))
+    m2.metric("Tipe Rumah dengan Tarif Khusus", len(schedule.types))
+
+    if len(schedule):
+        st.dataframe(schedule.frame, use_container_width=True, hide_index=True)
+    else:
+        st.info("Belum ada tarif; semua perhitungan memakai tarif standar bawaan")
+
+    with st.form("form_tarif", clear_on_submit=True):
+        c1, c2 = st.columns(2)
+        berlaku_mulai = c1.date_input("Berlaku Mulai", value=today.replace(day=1))
+        jumlah = c2.number_input("Iuran per Bulan (Rp)", min_value=0, value=schedule.amount(today.year, today.month), step=5000)
+        tipe_rumah = c1.text_input("Tipe Rumah", placeholder="Kosongkan untuk tarif standar")
+        keterangan = c2.text_input("Keterangan")
+        if st.form_submit_button("Simpan Tarif", type="primary"):
+            add_tarif(berlaku_mulai.strftime('%Y-%m-%d'), jumlah, tipe_rumah, keterangan, st.session_state.get('user_id'))
+            st.success("Tarif disimpan; berlaku mulai bulan dari tanggal tersebut")
+            st.rerun()
+
+    if len(schedule):
+        c1, c2 = st.columns([3, 1])
+        hapus_id = c1.selectbox("Hapus Tarif (ID)", schedule.frame['id'].tolist())
+        if c2.button("Hapus", use_container_width=True) and delete_tarif(hapus_id):
+            st.success("Tarif dihapus")
+            st.rerun()
+
+    st.subheader("Billing Run Tagihan")
+    st.caption("Membuat tagihan satu periode untuk semua warga aktif dan mengalokasikan pembayaran "
+               "terverifikasi ke tagihan tersebut. Aman dijalankan ulang; rentang periode bisa "
+               "di-backfill lewat scripts/run_billing.py")
+    c1, c2, c3 = st.columns([1, 1, 1])
+    tahun_tagihan = c1.number_input("Tahun", min_value=2020, max_value=2100, value=today.year, key="tagihan_tahun")
+    bulan_tagihan = c2.selectbox("Bulan", list(range(1, 13)), index=today.month - 1, key="tagihan_bulan")
+    if c3.button("Jalankan Billing", type="primary", use_container_width=True):
+        try:
+            dibuat, dialokasikan = run_billing(tahun_tagihan, bulan_tagihan)
+            st.success(f"{dibuat} tagihan baru, {format_currency(dialokasikan)} pembayaran dialokasikan")
+        except PeriodClosedError as e:
+            st.error(str(e))
+
+    st.subheader("Tipe Rumah Warga")
+    directory = get_resident_directory(active_only=False)
+    with st.form("form_tipe_rumah"):
+        pilihan = st.multiselect("Warga", directory.options())
+        tipe_baru = st.text_input("Tipe Rumah", placeholder="Kosongkan untuk tarif standar")
+        if st.form_submit_button("Terapkan") and pilihan:
+            jumlah_warga = set_tipe_rumah([directory.by_label(label)['id'] for label in pilihan], tipe_baru)
+            st.success(f"Tipe rumah {jumlah_warga} warga diperbarui")
+
+with tab4:
+    st.subheader("Tutup Buku Periode")
+    st.caption("Periode yang ditutup dikunci: pembayaran iuran bulan itu dan pengeluaran bertanggal "
+               "bulan itu tidak bisa ditambah, diverifikasi, atau dihapus. Laporan periode tertutup "
+               "dibaca dari ringkasan beku.")
+    today = datetime.now()
+    bulan_lalu = today.replace(day=1) - pd.Timedelta(days=1)
+    c1, c2 = st.columns(2)
+    tahun_tutup = c1.number_input("Tahun", min_value=2020, max_value=2100, value=bulan_lalu.year, key="tutup_tahun")
+    bulan_tutup = c2.selectbox("Bulan", list(range(1, 13)), index=bulan_lalu.month - 1, key="tutup_bulan")
+
+    ringkasan = get_ringkasan_periode(tahun_tutup, bulan_tutup)
+    m1, m2, m3, m4 = st.columns(4)
+    m1.metric("Pemasukan Terverifikasi", format_currency(ringkasan['pemasukan']))
+    m2.metric("Pengeluaran", format_currency(ringkasan['pengeluaran']))
+    m3.metric("Pembayar", ringkasan['jumlah_pembayar'])
+    m4.metric("Pembayaran Pending", ringkasan['pending'])
+
+    paksa = st.checkbox("Tutup walau masih ada pembayaran pending", disabled=not ringkasan['pending'])
+    if st.button("Tutup Buku", type="primary"):
+        try:
+            tutup_buku(tahun_tutup, bulan_tutup, closed_by=st.session_state.get('username'), force=paksa)
+            st.success(f"Periode {bulan_tutup:02d}/{tahun_tutup} ditutup")
+        except ValueError as e:
+            st.error(str(e))
+
+    st.subheader("Periode Tertutup")
+    tertutup = get_tutup_buku()
+    if tertutup.empty:
+        st.info("Belum ada periode yang ditutup")
+    else:
+        st.dataframe(tertutup, use_container_width=True, hide_index=True, column_config={
+            "pemasukan": st.column_config.NumberColumn("Pemasukan", format="Rp %d"),
+            "pengeluaran": st.column_config.NumberColumn("Pengeluaran", format="Rp %d"),
+        })
+        labels = [f"{row.bulan:02d}/{row.tahun}" for row in tertutup.itertuples()]
+        c1, c2, c3 = st.columns([2, 1, 1])
+        pilihan = c1.selectbox("Periode", range(len(labels)), format_func=lambda i: labels[i])
+        periode = tertutup.iloc[pilihan]
+        if c2.button("Periksa Integritas", use_container_width=True):
+            berbeda = periksa_tutup_buku(periode['tahun'], periode['bulan'])
+            if berbeda:
+                st.warning(f"Data live berbeda dari ringkasan beku: {', '.join(berbeda)}")
+            else:
+                st.success("Data live cocok dengan ringkasan beku")
+        if c3.button("Buka Kembali", use_container_width=True, type="secondary"):
+            buka_tutup_buku(periode['tahun'], periode['bulan'])
+            st.success(f"Periode {labels[pilihan]} dibuka kembali")
+            st.rerun()